@@ -8,19 +8,66 @@ DEFAULT_DATE_EXTEND_DAYS = 3
 MAX_SEARCH_RESULTS = 50
 
 HTTP_TIMEOUT_SECONDS = 30
+SEARCH_DEADLINE_SECONDS = 12
+DATA_SOURCE_DEADLINE_SECONDS = 5
 HTTP_CONNECT_TIMEOUT_SECONDS = 5
+HTTP_KEEPALIVE_EXPIRY_SECONDS = 30
+HTTP2_ENABLED = True
+
+HTTP_POOL_LIMITS = {
+    "serpapi": {"max_connections": 20, "max_keepalive_connections": 10},
+    "reddit": {"max_connections": 20, "max_keepalive_connections": 10},
+    "eventbrite": {"max_connections": 10, "max_keepalive_connections": 5},
+    "geocoding": {"max_connections": 20, "max_keepalive_connections": 10},
+}
+DEFAULT_HTTP_POOL_LIMITS = {"max_connections": 10, "max_keepalive_connections": 5}
 
 OPENAI_MODEL = "gpt-4o-mini"
 OPENAI_TEMPERATURE = 0.3
 OPENAI_MAX_TOKENS_PARSE = 200
 OPENAI_MAX_TOKENS_RESPONSE = 300
+PARSE_FAST_PATH_MIN_CONFIDENCE = 0.6
+OPENAI_PARSE_PROMPT_VERSION = 1
+RESPONSE_LLM_MIN_PLACES = 3
+RESPONSE_LLM_MIN_SOURCES = 2
 
 CACHE_TTL_SECONDS = 60
+CACHE_KEY_SCHEMA_VERSION = 1
+CACHE_STATS_TTL_SECONDS = 30
+CACHE_PAYLOAD_VERSION = 1
+MEMORY_CACHE_MAX_ENTRIES = 512
+MEMORY_CACHE_MAX_BYTES = 16 * 1024 * 1024
 SUPABASE_CACHE_TTL_MINUTES = 30
+SUPABASE_CACHE_HARD_TTL_MINUTES = 6 * 60
 LOCATION_CACHE_TTL_HOURS = 24
+LOCATION_NEGATIVE_CACHE_TTL_MINUTES = 30
+LOCATION_MEMORY_CACHE_MAX_ENTRIES = 1024
+PARSE_CACHE_TTL_HOURS = 7 * 24
+PARSE_MEMORY_CACHE_MAX_ENTRIES = 2048
+SUPABASE_MAX_CONCURRENCY = 8
+CACHE_WRITE_MAX_PENDING = 1024
+CACHE_WRITE_BATCH_SIZE = 50
+CACHE_WRITE_FLUSH_INTERVAL_SECONDS = 0.5
+DEFERRED_RESPONSE_TTL_SECONDS = 10 * 60
+DEFERRED_RESPONSE_MAX_ENTRIES = 1024
+DEFERRED_RESPONSE_MAX_WAIT_SECONDS = 20
+
+DEDUP_TITLE_SIMILARITY = 0.8
+DEDUP_MIN_TITLE_LENGTH = 8
+DEDUP_MINHASH_PERMUTATIONS = 32
+DEDUP_MINHASH_BANDS = 16
 
 SSE_MAX_CONNECTIONS = 100
 RATE_LIMIT_PER_MINUTE = 100
+RATE_LIMIT_BURST = 20
+RATE_LIMIT_MAX_CLIENTS = 10_000
+# Proxies in front of the worker that append to X-Forwarded-For (Cloudflare)
+TRUSTED_PROXY_HOPS = 1
+SEARCH_MAX_IN_FLIGHT = 64
+OVERLOAD_RETRY_AFTER_SECONDS = 2
+
+METRICS_LATENCY_BUCKETS_MS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+METRICS_MAX_SERIES = 256
 
 INTENT_KEYWORDS = [
     "hidden gems",
@@ -39,4 +86,21 @@ INTENT_KEYWORDS = [
     "alternative",
 ]
 
+UNDERGROUND_KEYWORDS = [
+    "underground",
+    "hidden",
+    "secret",
+    "local",
+    "offbeat",
+    "alternative",
+    "indie",
+    "dive",
+    "authentic",
+    "quirky",
+    "weird",
+    "unique",
+    "undiscovered",
+    "locals only",
+]
+
 SENSITIVE_KEYS = {"password", "api_key", "token", "secret", "credit_card", "apikey"}
@@ -2,8 +2,11 @@ import os
 from functools import lru_cache
 from typing import Literal
 
+from pydantic import Field
 from pydantic_settings import BaseSettings
 
+from src.config.constants import UNDERGROUND_KEYWORDS
+
 
 class Settings(BaseSettings):
     """Application settings loaded from environment variables."""
@@ -21,6 +24,8 @@ class Settings(BaseSettings):
     supabase_anon_key: str
     supabase_service_role_key: str | None = None
 
+    scoring_keywords: list[str] = Field(default_factory=lambda: list(UNDERGROUND_KEYWORDS))
+
     class Config:
         env_file = ".env"
         case_sensitive = False
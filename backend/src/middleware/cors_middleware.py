@@ -1,23 +1,73 @@
-"""CORS middleware configuration."""
+"""CORS policy."""
 
-from fastapi.middleware.cors import CORSMiddleware
+ALLOW_CREDENTIALS = True
+ALLOW_METHODS = b"DELETE, GET, HEAD, OPTIONS, PATCH, POST, PUT"
+EXPOSE_HEADERS = b"X-Request-ID, X-Response-Time"
+PREFLIGHT_MAX_AGE = b"600"
 
-from src.config.settings import get_settings
 
-settings = get_settings()
+def is_preflight(method: str, headers: dict[bytes, bytes]) -> bool:
+    """Check whether a request is a CORS preflight.
+
+    Args:
+        method: HTTP method
+        headers: Lowercased request headers
+
+    Returns:
+        True for OPTIONS requests carrying Origin and Access-Control-Request-Method
+    """
+    return (
+        method == "OPTIONS" and b"origin" in headers and b"access-control-request-method" in headers
+    )
 
 
-def add_cors_middleware(app):
-    """Add CORS middleware to FastAPI app.
+def _allow_origin(origin: bytes, echo: bool) -> list[tuple[bytes, bytes]]:
+    if echo:
+        return [(b"access-control-allow-origin", origin), (b"vary", b"Origin")]
+    return [(b"access-control-allow-origin", b"*")]
+
+
+def simple_headers(headers: dict[bytes, bytes]) -> list[tuple[bytes, bytes]]:
+    """Build CORS headers for a non-preflight response.
+
+    Any origin is allowed. The origin is echoed instead of ``*`` when the
+    request carries cookies, since browsers reject a wildcard on
+    credentialed requests.
 
     Args:
-        app: FastAPI application instance
+        headers: Lowercased request headers
+
+    Returns:
+        Headers to append, empty if the request has no Origin
     """
-    app.add_middleware(
-        CORSMiddleware,
-        allow_origins=["*"],
-        allow_credentials=True,
-        allow_methods=["*"],
-        allow_headers=["*"],
-        expose_headers=["X-Request-ID", "X-Response-Time"],
-    )
+    origin = headers.get(b"origin")
+    if origin is None:
+        return []
+
+    result = _allow_origin(origin, echo=ALLOW_CREDENTIALS and b"cookie" in headers)
+    if ALLOW_CREDENTIALS:
+        result.append((b"access-control-allow-credentials", b"true"))
+    result.append((b"access-control-expose-headers", EXPOSE_HEADERS))
+    return result
+
+
+def preflight_headers(headers: dict[bytes, bytes]) -> list[tuple[bytes, bytes]]:
+    """Build CORS headers answering a preflight request.
+
+    Args:
+        headers: Lowercased request headers
+
+    Returns:
+        Headers for the preflight response
+    """
+    result = _allow_origin(headers[b"origin"], echo=ALLOW_CREDENTIALS)
+    result += [
+        (b"access-control-allow-methods", ALLOW_METHODS),
+        (b"access-control-max-age", PREFLIGHT_MAX_AGE),
+    ]
+    requested = headers.get(b"access-control-request-headers")
+    if requested:
+        result.append((b"access-control-allow-headers", requested))
+    if ALLOW_CREDENTIALS:
+        result.append((b"access-control-allow-credentials", b"true"))
+    return result
@@ -0,0 +1,114 @@
+"""Fused pure-ASGI middleware for tracing, CORS and security headers."""
+
+import time
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.middleware.cors_middleware import is_preflight, preflight_headers, simple_headers
+from src.middleware.security_middleware import SECURITY_HEADERS
+from src.middleware.tracing_middleware import generate_request_id, request_id_var
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class RequestMiddleware:
+    """Tag, time and log each request and add CORS and security headers.
+
+    Works at the raw ASGI level: headers are appended to the
+    ``http.response.start`` message and body messages pass through
+    untouched, so streaming responses are never buffered or re-wrapped.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start = time.perf_counter()
+        headers = dict(scope["headers"])
+        request_id = headers.get(b"x-request-id", b"").decode("latin-1") or generate_request_id()
+        request_id_var.set(request_id)
+
+        if is_preflight(scope["method"], headers):
+            await self._send_preflight(headers, request_id, start, send)
+            self._log_complete(scope, headers, request_id, 200, start)
+            return
+
+        cors = simple_headers(headers)
+        status = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                message["headers"] = [
+                    *message.get("headers", []),
+                    *self._common_headers(request_id, start),
+                    *cors,
+                ]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        except Exception as e:
+            logger.error(
+                "request.failed",
+                request_id=request_id,
+                method=scope["method"],
+                path=scope["path"],
+                elapsed_ms=_elapsed_ms(start),
+                error_type=type(e).__name__,
+                error_msg=str(e),
+                exc_info=True,
+            )
+            raise
+
+        self._log_complete(scope, headers, request_id, status, start)
+
+    async def _send_preflight(
+        self, headers: dict[bytes, bytes], request_id: str, start: float, send: Send
+    ) -> None:
+        """Answer a CORS preflight without calling the app."""
+        await send(
+            {
+                "type": "http.response.start",
+                "status": 200,
+                "headers": [
+                    (b"content-type", b"text/plain; charset=utf-8"),
+                    (b"content-length", b"2"),
+                    *preflight_headers(headers),
+                    *self._common_headers(request_id, start),
+                ],
+            }
+        )
+        await send({"type": "http.response.body", "body": b"OK"})
+
+    @staticmethod
+    def _common_headers(request_id: str, start: float) -> list[tuple[bytes, bytes]]:
+        return [
+            *SECURITY_HEADERS,
+            (b"x-request-id", request_id.encode("latin-1")),
+            (b"x-response-time", str(_elapsed_ms(start)).encode()),
+        ]
+
+    @staticmethod
+    def _log_complete(
+        scope: Scope, headers: dict[bytes, bytes], request_id: str, status: int, start: float
+    ) -> None:
+        logger.info(
+            "request.complete",
+            request_id=request_id,
+            method=scope["method"],
+            path=scope["path"],
+            status=status,
+            elapsed_ms=_elapsed_ms(start),
+            user_agent=headers.get(b"user-agent", b"unknown").decode("latin-1")[:100],
+        )
+
+
+def _elapsed_ms(start: float) -> int:
+    return int((time.perf_counter() - start) * 1000)
@@ -1,5 +1,6 @@
 """Domain models."""
 
+import time
 from dataclasses import dataclass
 from typing import Any
 
@@ -11,6 +12,7 @@ class ParsedInput:
     location: str
     intent: str
     confidence: float
+    method: str = "llm"
 
 
 @dataclass
@@ -30,6 +32,7 @@ class SearchContext:
     intent: str
     coordinates: dict[str, float] | None
     confidence: float
+    query_type: str = "general"
 
 
 @dataclass
@@ -78,3 +81,22 @@ class ScoringSummary:
     average_score: float
     max_score: float
     min_score: float
+
+
+@dataclass
+class CachedSearch:
+    """Cached search response with freshness metadata."""
+
+    results: dict[str, Any]
+    cached_at: float
+    soft_ttl_seconds: float
+
+    @property
+    def age_seconds(self) -> float:
+        """Seconds since the entry was stored."""
+        return max(0.0, time.time() - self.cached_at)
+
+    @property
+    def is_stale(self) -> bool:
+        """Whether the entry is past its soft TTL and should be refreshed."""
+        return self.age_seconds > self.soft_ttl_seconds
@@ -15,6 +15,10 @@ class SearchRequest(BaseModel):
         description="User search query",
     )
     force: bool = Field(default=False, description="Force cache bypass")
+    defer_response: bool = Field(
+        default=False,
+        description="Return places immediately and fetch the narrative by response_id",
+    )
 
     @field_validator("chat_input")
     @classmethod
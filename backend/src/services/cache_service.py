@@ -1,91 +1,288 @@
 """Cache service with Supabase persistence."""
 
 import hashlib
-import json
-from datetime import datetime, timedelta, timezone
+import re
+import time
+from dataclasses import asdict
+from datetime import datetime
 from typing import Any
 
-from src.config.constants import LOCATION_CACHE_TTL_HOURS, SUPABASE_CACHE_TTL_MINUTES
-from src.services.supabase_service import supabase
+from src.config.constants import (
+    CACHE_KEY_SCHEMA_VERSION,
+    CACHE_PAYLOAD_VERSION,
+    CACHE_STATS_TTL_SECONDS,
+    CACHE_TTL_SECONDS,
+    CACHE_WRITE_BATCH_SIZE,
+    CACHE_WRITE_FLUSH_INTERVAL_SECONDS,
+    CACHE_WRITE_MAX_PENDING,
+    LOCATION_CACHE_TTL_HOURS,
+    LOCATION_MEMORY_CACHE_MAX_ENTRIES,
+    MEMORY_CACHE_MAX_BYTES,
+    MEMORY_CACHE_MAX_ENTRIES,
+    OPENAI_MODEL,
+    OPENAI_PARSE_PROMPT_VERSION,
+    PARSE_CACHE_TTL_HOURS,
+    PARSE_MEMORY_CACHE_MAX_ENTRIES,
+    SUPABASE_CACHE_HARD_TTL_MINUTES,
+    SUPABASE_CACHE_TTL_MINUTES,
+)
+from src.models.domain_models import CachedSearch, ParsedInput
+from src.services.supabase_service import (
+    async_supabase,
+    location_row,
+    parse_row,
+    search_results_row,
+)
+from src.utils import cache_payload
 from src.utils.logger import get_logger
+from src.utils.metrics import STAGE_DURATION, metrics
+from src.utils.ttl_cache import TTLCache
+from src.utils.write_behind import WriteBehindQueue
 
 logger = get_logger(__name__)
 
+_NON_KEY_CHARS = re.compile(r"[^\w\s,]+")
+_COMMA_SPACING = re.compile(r"\s*,\s*")
 
-def generate_cache_key(query: str, location: str = "") -> str:
-    """Generate cache key from query and location.
+search_results_l1 = TTLCache(
+    max_entries=MEMORY_CACHE_MAX_ENTRIES,
+    max_bytes=MEMORY_CACHE_MAX_BYTES,
+    ttl_seconds=CACHE_TTL_SECONDS,
+)
+
+location_l1 = TTLCache(
+    max_entries=LOCATION_MEMORY_CACHE_MAX_ENTRIES,
+    max_bytes=MEMORY_CACHE_MAX_BYTES,
+    ttl_seconds=LOCATION_CACHE_TTL_HOURS * 3600,
+)
+
+parse_l1 = TTLCache(
+    max_entries=PARSE_MEMORY_CACHE_MAX_ENTRIES,
+    max_bytes=MEMORY_CACHE_MAX_BYTES,
+    ttl_seconds=PARSE_CACHE_TTL_HOURS * 3600,
+)
+
+# Supabase row counts, refreshed at most every CACHE_STATS_TTL_SECONDS
+supabase_stats = TTLCache(
+    max_entries=1,
+    max_bytes=MEMORY_CACHE_MAX_BYTES,
+    ttl_seconds=CACHE_STATS_TTL_SECONDS,
+)
+
+
+async def _upsert_rows(table: str, rows: list[dict[str, Any]]) -> bool:
+    return await async_supabase.upsert_rows(table, rows)
+
+
+# Supabase writes are batched off the request path; see set_cached_* below
+cache_writes = WriteBehindQueue(
+    _upsert_rows,
+    max_pending=CACHE_WRITE_MAX_PENDING,
+    batch_size=CACHE_WRITE_BATCH_SIZE,
+    interval_seconds=CACHE_WRITE_FLUSH_INTERVAL_SECONDS,
+)
+
+
+def normalize_cache_text(text: str) -> str:
+    """Normalize free text so trivially different inputs share a cache key.
+
+    Args:
+        text: Raw query, intent or location text
+
+    Returns:
+        Lowercased text with punctuation (except commas) and extra whitespace removed
+    """
+    text = _NON_KEY_CHARS.sub(" ", text.lower())
+    text = _COMMA_SPACING.sub(", ", text)
+    return " ".join(text.split()).strip(" ,")
+
+
+def generate_cache_key(query: str = "", location: str = "", intent: str = "") -> str:
+    """Generate canonical cache key.
+
+    Primary entries are keyed on the query text alone (the only thing known
+    before parsing); secondary entries on parsed intent plus normalized
+    location. The schema version is folded in so format changes never read
+    stale rows.
 
     Args:
         query: Search query
-        location: Optional location filter
+        location: Normalized location
+        intent: Parsed intent
 
     Returns:
         Hash-based cache key
     """
-    normalized = f"{query.strip().lower()}|{location.strip().lower()}"
+    normalized = "|".join(
+        [
+            f"v{CACHE_KEY_SCHEMA_VERSION}",
+            normalize_cache_text(query),
+            normalize_cache_text(intent),
+            normalize_cache_text(location),
+        ]
+    )
     return hashlib.sha256(normalized.encode()).hexdigest()[:32]
 
 
-async def get_cached_search_results(query: str, location: str) -> dict[str, Any] | None:
-    """Get cached search results from Supabase.
+def _entry_from_row(row: dict[str, Any]) -> CachedSearch:
+    """Build a cache entry from a search_results row.
+
+    Args:
+        row: Row with results_json and created_at
+
+    Returns:
+        Cache entry aged from the row's created_at
+    """
+    created_at = row.get("created_at")
+    cached_at = datetime.fromisoformat(created_at).timestamp() if created_at else time.time()
+    return CachedSearch(
+        results=cache_payload.expand(row["results_json"]),
+        cached_at=cached_at,
+        soft_ttl_seconds=SUPABASE_CACHE_TTL_MINUTES * 60,
+    )
+
+
+@metrics.timed(STAGE_DURATION, stage="cache_read", cache="search_results")
+async def get_cached_search_results(query: str) -> CachedSearch | None:
+    """Get cached search results, checking the in-process tier before Supabase.
+
+    Entries are returned until their hard TTL; callers use ``is_stale`` to
+    decide whether to refresh in the background.
 
     Args:
         query: Search query
-        location: Location filter
 
     Returns:
-        Cached results or None if not found
+        Cache entry or None if not found
     """
     try:
-        query_hash = generate_cache_key(query, location)
-        result = supabase.get_search_results(query_hash)
+        query_hash = generate_cache_key(query)
+
+        entry = search_results_l1.get(query_hash)
+        if entry is not None:
+            logger.debug(
+                "cache.hit", cache_type="search_results", tier="memory", query_hash=query_hash
+            )
+            return entry
+
+        row = await async_supabase.get_search_results(query_hash)
+        if not row:
+            return None
+
+        entry = _entry_from_row(row)
+        search_results_l1.set(query_hash, entry)
+        logger.info(
+            "cache.hit", cache_type="search_results", tier="supabase", query_hash=query_hash
+        )
+        return entry
+
+    except Exception as e:
+        logger.warning("cache.read_error", error=str(e), cache_type="search_results")
+        return None
+
+
+@metrics.timed(STAGE_DURATION, stage="cache_read", cache="search_results_intent")
+async def get_cached_search_results_by_intent(
+    query: str, intent: str, location: str
+) -> CachedSearch | None:
+    """Get cached search results for a parsed (intent, location) pair.
+
+    Lets paraphrased queries for the same place hit. On a hit the entry is
+    also aliased in memory under the query key so the next identical query
+    skips parsing.
 
-        if result:
-            logger.info("cache.hit", cache_type="search_results", query_hash=query_hash)
+    Args:
+        query: Search query that produced the parse
+        intent: Parsed intent
+        location: Normalized location
 
-        return result
+    Returns:
+        Cache entry or None if not found
+    """
+    try:
+        intent_key = generate_cache_key(intent=intent, location=location)
+
+        entry = search_results_l1.get(intent_key)
+        if entry is None:
+            row = await async_supabase.get_search_results_by_intent(
+                normalize_cache_text(intent), normalize_cache_text(location)
+            )
+            if not row:
+                return None
+            entry = _entry_from_row(row)
+            search_results_l1.set(intent_key, entry)
+
+        search_results_l1.set(generate_cache_key(query), entry)
+        logger.info("cache.hit", cache_type="search_results", match="intent", key=intent_key)
+        return entry
 
     except Exception as e:
         logger.warning("cache.read_error", error=str(e), cache_type="search_results")
         return None
 
 
+@metrics.timed(STAGE_DURATION, stage="cache_write", cache="search_results")
 async def set_cached_search_results(
-    query: str, location: str, results: dict[str, Any], ttl_minutes: int = SUPABASE_CACHE_TTL_MINUTES
+    query: str,
+    intent: str,
+    location: str,
+    results: dict[str, Any],
+    ttl_minutes: int = SUPABASE_CACHE_TTL_MINUTES,
+    hard_ttl_minutes: int = SUPABASE_CACHE_HARD_TTL_MINUTES,
 ) -> bool:
-    """Cache search results in Supabase.
+    """Cache search results in memory and queue them for Supabase.
+
+    Debug data is not cached. Supabase rows use the compact payload format
+    from cache_payload.
 
     Args:
         query: Search query
-        location: Location filter
+        intent: Parsed intent
+        location: Normalized location
         results: Results to cache
-        ttl_minutes: Time to live in minutes
+        ttl_minutes: Soft TTL; after this the entry is served stale and refreshed
+        hard_ttl_minutes: Hard TTL; after this the entry is no longer served
 
     Returns:
-        True if successful, False otherwise
+        True if stored in memory and queued for Supabase, False otherwise
     """
     try:
-        query_hash = generate_cache_key(query, location)
-        success = supabase.store_search_results(
-            query_hash=query_hash,
-            location=location.strip(),
-            intent=query.strip(),
-            results=results,
-            ttl_seconds=ttl_minutes * 60,
+        query_hash = generate_cache_key(query)
+        entry = CachedSearch(
+            results=cache_payload.strip(results),
+            cached_at=time.time(),
+            soft_ttl_seconds=ttl_minutes * 60,
+        )
+        intent_key = generate_cache_key(intent=intent, location=location)
+        search_results_l1.set(query_hash, entry)
+        search_results_l1.set(intent_key, entry)
+
+        queued = cache_writes.enqueue(
+            "search_results",
+            query_hash,
+            search_results_row(
+                query_hash=query_hash,
+                location=normalize_cache_text(location),
+                intent=normalize_cache_text(intent),
+                results=cache_payload.compact(results),
+                ttl_seconds=max(ttl_minutes, hard_ttl_minutes) * 60,
+                payload_version=CACHE_PAYLOAD_VERSION,
+            ),
         )
 
-        if success:
+        if queued:
             logger.info("cache.write", cache_type="search_results", query_hash=query_hash)
 
-        return success
+        return queued
 
     except Exception as e:
         logger.error("cache.write_error", error=str(e), cache_type="search_results")
         return False
 
 
+@metrics.timed(STAGE_DURATION, stage="cache_read", cache="location")
 async def get_cached_location(raw_input: str) -> dict[str, Any] | None:
-    """Get cached location normalization from Supabase.
+    """Get cached location normalization, checking memory before Supabase.
 
     Args:
         raw_input: Raw location input
@@ -93,87 +290,198 @@ async def get_cached_location(raw_input: str) -> dict[str, Any] | None:
     Returns:
         Cached location data or None
     """
-    if not supabase:
-        return None
+    key = normalize_cache_text(raw_input)
+
+    cached = location_l1.get(key)
+    if cached is not None:
+        return cached
 
     try:
-        result = (
-            supabase.table("location_cache")
-            .select("*")
-            .eq("raw_input", raw_input.strip().lower())
-            .gt("expires_at", datetime.now(timezone.utc).isoformat())
-            .single()
-            .execute()
+        row = await async_supabase.get_location(key)
+        if not row:
+            return None
+
+        candidates = row.get("raw_candidates") or []
+        cached = {
+            "normalized": row["normalized_location"],
+            "confidence": row["confidence"],
+            "coordinates": candidates[0] if candidates else None,
+        }
+        # Keep the row's own expiry, which is much shorter for negative entries
+        expires_at = row.get("expires_at")
+        ttl_seconds = (
+            datetime.fromisoformat(expires_at).timestamp() - time.time() if expires_at else None
         )
+        if ttl_seconds is None or ttl_seconds > 0:
+            location_l1.set(key, cached, ttl_seconds)
 
-        if result.data:
-            logger.info("cache.hit", cache_type="location", raw_input=raw_input[:50])
-            return {
-                "normalized": result.data["normalized_location"],
-                "confidence": result.data["confidence"],
-                "coordinates": result.data.get("raw_candidates", []),
-            }
-
-        return None
+        logger.info("cache.hit", cache_type="location", raw_input=raw_input[:50])
+        return cached
 
     except Exception as e:
         logger.warning("cache.read_error", error=str(e), cache_type="location")
         return None
 
 
+@metrics.timed(STAGE_DURATION, stage="cache_write", cache="location")
 async def set_cached_location(
     raw_input: str,
     normalized: str,
     confidence: float,
-    raw_candidates: list[dict[str, Any]] | None = None,
-    ttl_hours: int = LOCATION_CACHE_TTL_HOURS,
+    coordinates: dict[str, float] | None = None,
+    ttl_seconds: int = LOCATION_CACHE_TTL_HOURS * 3600,
 ) -> bool:
-    """Cache location normalization in Supabase.
+    """Cache location normalization in memory and queue it for Supabase.
 
     Args:
         raw_input: Raw location input
         normalized: Normalized location
         confidence: Confidence score
-        raw_candidates: Optional raw geocoding candidates
-        ttl_hours: Time to live in hours
+        coordinates: Optional lat/lng of the match
+        ttl_seconds: Time to live in seconds
 
     Returns:
-        True if successful, False otherwise
+        True if stored in memory and queued for Supabase, False otherwise
     """
-    if not supabase:
-        return False
+    key = normalize_cache_text(raw_input)
+    location_l1.set(
+        key,
+        {"normalized": normalized, "confidence": confidence, "coordinates": coordinates},
+        ttl_seconds,
+    )
 
     try:
-        expires_at = (datetime.now(timezone.utc) + timedelta(hours=ttl_hours)).isoformat()
-
-        supabase.table("location_cache").upsert(
-            {
-                "raw_input": raw_input.strip().lower(),
-                "normalized_location": normalized,
-                "confidence": confidence,
-                "raw_candidates": raw_candidates or [],
-                "expires_at": expires_at,
-            },
-            on_conflict="raw_input",
-        ).execute()
-
-        logger.info("cache.write", cache_type="location", raw_input=raw_input[:50])
-        return True
+        queued = cache_writes.enqueue(
+            "location_cache",
+            key,
+            location_row(
+                raw_input=key,
+                normalized_location=normalized,
+                confidence=confidence,
+                raw_candidates=[coordinates] if coordinates else [],
+                ttl_seconds=ttl_seconds,
+            ),
+        )
+
+        if queued:
+            logger.info("cache.write", cache_type="location", raw_input=raw_input[:50])
+
+        return queued
 
     except Exception as e:
         logger.error("cache.write_error", error=str(e), cache_type="location")
         return False
 
 
+def generate_parse_key(user_input: str) -> str:
+    """Generate the memo key for a parse result.
+
+    The model and parse prompt version are folded in, so bumping either in
+    constants invalidates every memoized parse.
+
+    Args:
+        user_input: Raw user query
+
+    Returns:
+        Hash-based parse key
+    """
+    normalized = "|".join(
+        [OPENAI_MODEL, f"p{OPENAI_PARSE_PROMPT_VERSION}", normalize_cache_text(user_input)]
+    )
+    return hashlib.sha256(normalized.encode()).hexdigest()[:32]
+
+
+@metrics.timed(STAGE_DURATION, stage="cache_read", cache="parse")
+async def get_cached_parse(user_input: str) -> ParsedInput | None:
+    """Get a memoized parse, checking memory before Supabase.
+
+    Args:
+        user_input: Raw user query
+
+    Returns:
+        Memoized parse or None
+    """
+    input_hash = generate_parse_key(user_input)
+
+    parsed = parse_l1.get(input_hash)
+    if parsed is not None:
+        return parsed
+
+    try:
+        row = await async_supabase.get_parse(input_hash)
+        if not row:
+            return None
+
+        parsed = ParsedInput(**row)
+        parse_l1.set(input_hash, parsed)
+
+        logger.info("cache.hit", cache_type="parse", tier="supabase", input_hash=input_hash)
+        return parsed
+
+    except Exception as e:
+        logger.warning("cache.read_error", error=str(e), cache_type="parse")
+        return None
+
+
+@metrics.timed(STAGE_DURATION, stage="cache_write", cache="parse")
+async def set_cached_parse(user_input: str, parsed: ParsedInput) -> bool:
+    """Memoize a parse result in memory and queue it for Supabase.
+
+    Args:
+        user_input: Raw user query
+        parsed: Parse result to memoize
+
+    Returns:
+        True if stored in memory and queued for Supabase, False otherwise
+    """
+    input_hash = generate_parse_key(user_input)
+    parse_l1.set(input_hash, parsed)
+
+    try:
+        queued = cache_writes.enqueue(
+            "parse_cache",
+            input_hash,
+            parse_row(
+                input_hash=input_hash,
+                raw_input=normalize_cache_text(user_input),
+                parsed=asdict(parsed),
+                model=OPENAI_MODEL,
+                prompt_version=OPENAI_PARSE_PROMPT_VERSION,
+            ),
+        )
+
+        if queued:
+            logger.info("cache.write", cache_type="parse", input_hash=input_hash)
+
+        return queued
+
+    except Exception as e:
+        logger.error("cache.write_error", error=str(e), cache_type="parse")
+        return False
+
+
 async def get_cache_stats() -> dict[str, Any]:
     """Get cache statistics.
 
+    Supabase row counts are cached briefly so frequent callers do not each
+    cost three count queries; the in-process counters are always current.
+
     Returns:
-        Cache statistics including counts and connection status
+        Cache statistics including counts, connection status and in-process tier counters
     """
     try:
-        stats = supabase.get_stats()
-        return stats
+        stats = supabase_stats.get("supabase")
+        if stats is None:
+            stats = await async_supabase.get_stats()
+            supabase_stats.set("supabase", stats)
+
+        return {
+            **stats,
+            "memory": search_results_l1.stats(),
+            "location_memory": location_l1.stats(),
+            "parse_memory": parse_l1.stats(),
+            "write_behind": cache_writes.stats(),
+        }
 
     except Exception as e:
         logger.error("cache.stats_error", error=str(e))
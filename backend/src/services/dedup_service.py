@@ -0,0 +1,222 @@
+"""Cross-source deduplication of search results."""
+
+import random
+import re
+import zlib
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from src.config.constants import (
+    DEDUP_MIN_TITLE_LENGTH,
+    DEDUP_MINHASH_BANDS,
+    DEDUP_MINHASH_PERMUTATIONS,
+    DEDUP_TITLE_SIMILARITY,
+)
+from src.models.domain_models import SearchResult
+from src.utils.logger import get_logger
+from src.utils.metrics import STAGE_DURATION, metrics
+
+logger = get_logger(__name__)
+
+TRACKING_PARAMS = {
+    "fbclid",
+    "gclid",
+    "dclid",
+    "msclkid",
+    "igshid",
+    "mc_cid",
+    "mc_eid",
+    "ref",
+    "ref_src",
+    "ref_url",
+    "share_id",
+    "si",
+    "aff",
+    "affiliate",
+    "campaign",
+}
+TRACKING_PREFIXES = ("utm_", "_ga", "_hs", "hsa_", "pk_", "mtm_")
+HOST_ALIASES = {
+    "old.reddit.com": "reddit.com",
+    "np.reddit.com": "reddit.com",
+    "m.reddit.com": "reddit.com",
+    "new.reddit.com": "reddit.com",
+}
+PLACEHOLDER_TITLES = {"unknown", "unknown event"}
+
+_NON_WORD = re.compile(r"[^\w]+")
+_MERSENNE_PRIME = (1 << 61) - 1
+_rng = random.Random(0x5EED)
+_PERMUTATIONS = [
+    (_rng.randrange(1, _MERSENNE_PRIME), _rng.randrange(0, _MERSENNE_PRIME))
+    for _ in range(DEDUP_MINHASH_PERMUTATIONS)
+]
+
+
+def canonicalize_url(url: str | None) -> str | None:
+    """Reduce a URL to a canonical form for duplicate detection.
+
+    Treats http and https alike, lowercases the host, drops "www." and
+    known host aliases, the fragment, tracking parameters and trailing
+    slashes, and sorts the remaining query parameters.
+
+    Args:
+        url: Raw URL
+
+    Returns:
+        Canonical URL, or None if the URL is empty or not http(s)
+    """
+    if not url:
+        return None
+
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+    if scheme not in ("http", "https"):
+        return None
+
+    host = (parts.hostname or "").lower().removeprefix("www.")
+    host = HOST_ALIASES.get(host, host)
+    if parts.port and parts.port not in (80, 443):
+        host = f"{host}:{parts.port}"
+
+    query = sorted(
+        (key, value)
+        for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if key.lower() not in TRACKING_PARAMS and not key.lower().startswith(TRACKING_PREFIXES)
+    )
+    path = parts.path.rstrip("/") or "/"
+
+    return urlunsplit(("https", host, path, urlencode(query), ""))
+
+
+def _normalize_title(title: str) -> str:
+    return " ".join(_NON_WORD.sub(" ", title.lower()).split())
+
+
+def _shingles(title: str, size: int = 3) -> set[str]:
+    """Character shingles of a normalized title.
+
+    Args:
+        title: Normalized title
+        size: Shingle length
+
+    Returns:
+        Set of shingles
+    """
+    padded = f" {title} "
+    return {padded[i : i + size] for i in range(max(1, len(padded) - size + 1))}
+
+
+def _minhash(shingles: set[str]) -> tuple[int, ...]:
+    """MinHash signature of a shingle set.
+
+    Args:
+        shingles: Shingle set
+
+    Returns:
+        One minimum per permutation
+    """
+    hashes = [zlib.crc32(shingle.encode()) for shingle in shingles]
+    return tuple(min((a * h + b) % _MERSENNE_PRIME for h in hashes) for a, b in _PERMUTATIONS)
+
+
+def _jaccard(left: set[str], right: set[str]) -> float:
+    return len(left & right) / len(left | right) if left or right else 0.0
+
+
+class _DisjointSet:
+    """Union-find over result indices."""
+
+    def __init__(self, size: int) -> None:
+        self.parent = list(range(size))
+
+    def find(self, index: int) -> int:
+        while self.parent[index] != index:
+            self.parent[index] = self.parent[self.parent[index]]
+            index = self.parent[index]
+        return index
+
+    def union(self, left: int, right: int) -> None:
+        left, right = self.find(left), self.find(right)
+        if left != right:
+            self.parent[max(left, right)] = min(left, right)
+
+
+def _merge(group: list[SearchResult]) -> SearchResult:
+    """Collapse duplicates into one result that keeps every source's provenance.
+
+    The result with the longest description is kept as the representative.
+
+    Args:
+        group: Duplicate results in arrival order
+
+    Returns:
+        Representative result with metadata["provenance"] listing all sources
+    """
+    representative = max(group, key=lambda r: len(r.description or ""))
+    provenance = []
+    for result in group:
+        provenance.extend(
+            (result.metadata or {}).get("provenance")
+            or [{"source": result.source, "url": result.url}]
+        )
+
+    representative.metadata = {**(representative.metadata or {}), "provenance": provenance}
+    return representative
+
+
+@metrics.timed(STAGE_DURATION, stage="dedup")
+def deduplicate(results: list[SearchResult]) -> list[SearchResult]:
+    """Merge results that point at the same place.
+
+    Results are duplicates when their canonical URLs match, or when their
+    titles are near-duplicates: MinHash signatures with LSH banding find
+    candidate pairs, which are confirmed by exact Jaccard similarity of
+    title shingles.
+
+    Args:
+        results: Results from every data source, in arrival order
+
+    Returns:
+        Deduplicated results in order of first appearance
+    """
+    if len(results) < 2:
+        return results
+
+    groups = _DisjointSet(len(results))
+    by_url: dict[str, int] = {}
+    buckets: dict[tuple[int, tuple[int, ...]], list[int]] = {}
+    shingles: dict[int, set[str]] = {}
+    rows = DEDUP_MINHASH_PERMUTATIONS // DEDUP_MINHASH_BANDS
+
+    for index, result in enumerate(results):
+        url = canonicalize_url(result.url)
+        if url is not None:
+            if url in by_url:
+                groups.union(by_url[url], index)
+            else:
+                by_url[url] = index
+
+        title = _normalize_title(result.name)
+        if len(title) < DEDUP_MIN_TITLE_LENGTH or title in PLACEHOLDER_TITLES:
+            continue
+
+        shingles[index] = _shingles(title)
+        signature = _minhash(shingles[index])
+        for band in range(DEDUP_MINHASH_BANDS):
+            key = (band, signature[band * rows : (band + 1) * rows])
+            for other in buckets.setdefault(key, []):
+                if (
+                    groups.find(other) != groups.find(index)
+                    and _jaccard(shingles[other], shingles[index]) >= DEDUP_TITLE_SIMILARITY
+                ):
+                    groups.union(other, index)
+            buckets[key].append(index)
+
+    merged: dict[int, list[SearchResult]] = {}
+    for index, result in enumerate(results):
+        merged.setdefault(groups.find(index), []).append(result)
+
+    deduped = [group[0] if len(group) == 1 else _merge(group) for group in merged.values()]
+
+    logger.info("dedup.complete", before=len(results), after=len(deduped))
+    return deduped
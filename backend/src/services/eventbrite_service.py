@@ -2,21 +2,28 @@
 
 import httpx
 
-from src.config.constants import HTTP_CONNECT_TIMEOUT_SECONDS, HTTP_TIMEOUT_SECONDS
 from src.config.settings import get_settings
 from src.models.domain_models import SearchResult
+from src.services.http_client_service import http_clients, request_timeout
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
 settings = get_settings()
 
 
-async def search_local_events(location: str, keywords: list[str]) -> list[SearchResult]:
+async def search_local_events(
+    location: str,
+    keywords: list[str],
+    client: httpx.AsyncClient | None = None,
+    timeout: float | None = None,
+) -> list[SearchResult]:
     """Search for local events on Eventbrite.
 
     Args:
         location: Normalized location
         keywords: List of search keywords
+        client: Shared HTTP client (defaults to the pooled eventbrite client)
+        timeout: Remaining deadline budget in seconds (defaults to the client timeout)
 
     Returns:
         List of event results
@@ -35,12 +42,12 @@ async def search_local_events(location: str, keywords: list[str]) -> list[Search
         }
         headers = {"Authorization": f"Bearer {settings.eventbrite_token}"}
 
-        async with httpx.AsyncClient(
-            timeout=httpx.Timeout(HTTP_TIMEOUT_SECONDS, connect=HTTP_CONNECT_TIMEOUT_SECONDS)
-        ) as client:
-            response = await client.get(url, params=params, headers=headers)
-            response.raise_for_status()
-            data = response.json()
+        client = client or http_clients.get("eventbrite")
+        response = await client.get(
+            url, params=params, headers=headers, timeout=request_timeout(timeout)
+        )
+        response.raise_for_status()
+        data = response.json()
 
         results = []
         for event in data.get("events", [])[:10]:
@@ -66,6 +73,9 @@ async def search_local_events(location: str, keywords: list[str]) -> list[Search
 
         return results
 
+    except httpx.TimeoutException:
+        logger.warning("eventbrite.search_timeout", location=location, keywords=keywords)
+        raise
     except httpx.HTTPStatusError as e:
         logger.error(
             "eventbrite.http_error",
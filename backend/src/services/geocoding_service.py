@@ -2,24 +2,69 @@
 
 import httpx
 
-from src.config.constants import HTTP_CONNECT_TIMEOUT_SECONDS, HTTP_TIMEOUT_SECONDS
+from src.config.constants import LOCATION_CACHE_TTL_HOURS, LOCATION_NEGATIVE_CACHE_TTL_MINUTES
 from src.config.settings import get_settings
 from src.models.domain_models import NormalizedLocation
+from src.services import cache_service
+from src.services.http_client_service import http_clients
 from src.utils.logger import get_logger
+from src.utils.metrics import STAGE_DURATION, metrics
 
 logger = get_logger(__name__)
 settings = get_settings()
 
+NEGATIVE_CACHE_STATUSES = {"ZERO_RESULTS"}
 
-async def normalize_location(raw_input):
-    """Normalize location using Google Maps Geocoding API.
+
+@metrics.timed(STAGE_DURATION, stage="geocode")
+async def normalize_location(
+    raw_input: str, client: httpx.AsyncClient | None = None
+) -> NormalizedLocation:
+    """Normalize location, consulting the location cache before the Geocoding API.
+
+    Lookups go memory -> location_cache table -> Google. Definitive "no
+    result" answers are cached for a shorter TTL so junk input doesn't keep
+    hitting the API; transient failures are never cached.
 
     Args:
         raw_input: Raw location string from user
+        client: Shared HTTP client (defaults to the pooled geocoding client)
 
     Returns:
         Normalized location with coordinates and confidence
     """
+    cached = await cache_service.get_cached_location(raw_input)
+    if cached is not None:
+        logger.debug("geocoding.cache_hit", input=raw_input)
+        return NormalizedLocation(**cached)
+
+    location, ttl_seconds = await _geocode(raw_input, client)
+
+    if ttl_seconds:
+        await cache_service.set_cached_location(
+            raw_input,
+            location.normalized,
+            location.confidence,
+            location.coordinates,
+            ttl_seconds=ttl_seconds,
+        )
+
+    return location
+
+
+async def _geocode(
+    raw_input: str, client: httpx.AsyncClient | None
+) -> tuple[NormalizedLocation, int | None]:
+    """Normalize location using Google Maps Geocoding API.
+
+    Args:
+        raw_input: Raw location string from user
+        client: Shared HTTP client (defaults to the pooled geocoding client)
+
+    Returns:
+        Tuple of (normalized location, cache TTL in seconds or None if the
+        answer should not be cached)
+    """
     try:
         url = "https://maps.googleapis.com/maps/api/geocode/json"
         params = {
@@ -27,24 +72,30 @@ async def normalize_location(raw_input):
             "key": settings.google_maps_api_key,
         }
 
-        async with httpx.AsyncClient(
-            timeout=httpx.Timeout(HTTP_TIMEOUT_SECONDS, connect=HTTP_CONNECT_TIMEOUT_SECONDS)
-        ) as client:
-            response = await client.get(url, params=params)
-            response.raise_for_status()
-            data = response.json()
+        client = client or http_clients.get("geocoding")
+        response = await client.get(url, params=params)
+        response.raise_for_status()
+        data = response.json()
 
         if data.get("status") != "OK" or not data.get("results"):
             logger.warning("geocoding.no_results", input=raw_input, status=data.get("status"))
-            return NormalizedLocation(
-                normalized=raw_input,
-                confidence=0.5,
-                coordinates=None,
+            negative_ttl = (
+                LOCATION_NEGATIVE_CACHE_TTL_MINUTES * 60
+                if data.get("status") in NEGATIVE_CACHE_STATUSES
+                else None
+            )
+            return (
+                NormalizedLocation(
+                    normalized=raw_input,
+                    confidence=0.5,
+                    coordinates=None,
+                ),
+                negative_ttl,
             )
 
         result = data["results"][0]
         normalized = result.get("formatted_address", raw_input)
-        
+
         location = result.get("geometry", {}).get("location", {})
         coordinates = None
         if location.get("lat") and location.get("lng"):
@@ -65,10 +116,13 @@ async def normalize_location(raw_input):
             confidence=confidence,
         )
 
-        return NormalizedLocation(
-            normalized=normalized,
-            confidence=confidence,
-            coordinates=coordinates,
+        return (
+            NormalizedLocation(
+                normalized=normalized,
+                confidence=confidence,
+                coordinates=coordinates,
+            ),
+            LOCATION_CACHE_TTL_HOURS * 3600,
         )
 
     except httpx.HTTPStatusError as e:
@@ -77,16 +131,22 @@ async def normalize_location(raw_input):
             status=e.response.status_code,
             input=raw_input,
         )
-        return NormalizedLocation(
-            normalized=raw_input,
-            confidence=0.5,
-            coordinates=None,
+        return (
+            NormalizedLocation(
+                normalized=raw_input,
+                confidence=0.5,
+                coordinates=None,
+            ),
+            None,
         )
 
     except Exception as e:
         logger.error("geocoding.error", error=str(e), input=raw_input)
-        return NormalizedLocation(
-            normalized=raw_input,
-            confidence=0.5,
-            coordinates=None,
+        return (
+            NormalizedLocation(
+                normalized=raw_input,
+                confidence=0.5,
+                coordinates=None,
+            ),
+            None,
         )
@@ -0,0 +1,105 @@
+"""Shared pooled HTTP clients for upstream services."""
+
+import importlib.util
+
+import httpx
+
+from src.config.constants import (
+    DEFAULT_HTTP_POOL_LIMITS,
+    HTTP2_ENABLED,
+    HTTP_CONNECT_TIMEOUT_SECONDS,
+    HTTP_KEEPALIVE_EXPIRY_SECONDS,
+    HTTP_POOL_LIMITS,
+    HTTP_TIMEOUT_SECONDS,
+)
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+def request_timeout(seconds: float | None) -> httpx.Timeout:
+    """Build a per-request timeout from a remaining deadline budget.
+
+    Args:
+        seconds: Remaining budget, or None for the default HTTP timeout
+
+    Returns:
+        Timeout to pass to a client request
+    """
+    if seconds is None:
+        seconds = HTTP_TIMEOUT_SECONDS
+    return httpx.Timeout(seconds, connect=min(seconds, HTTP_CONNECT_TIMEOUT_SECONDS))
+
+
+def _http2_available() -> bool:
+    """Check whether HTTP/2 is enabled and the optional h2 package is installed.
+
+    Returns:
+        True if clients should negotiate HTTP/2
+    """
+    return HTTP2_ENABLED and importlib.util.find_spec("h2") is not None
+
+
+class HttpClientRegistry:
+    """App-scoped registry of pooled AsyncClients, one per upstream."""
+
+    def __init__(self) -> None:
+        self._clients: dict[str, httpx.AsyncClient] = {}
+
+    def _create_client(self, upstream: str) -> httpx.AsyncClient:
+        """Build a pooled client tuned for a single upstream.
+
+        Args:
+            upstream: Upstream name (key into HTTP_POOL_LIMITS)
+
+        Returns:
+            Configured async HTTP client
+        """
+        pool = HTTP_POOL_LIMITS.get(upstream, DEFAULT_HTTP_POOL_LIMITS)
+        return httpx.AsyncClient(
+            timeout=request_timeout(None),
+            limits=httpx.Limits(**pool, keepalive_expiry=HTTP_KEEPALIVE_EXPIRY_SECONDS),
+            http2=_http2_available(),
+        )
+
+    def get(self, upstream: str) -> httpx.AsyncClient:
+        """Get the pooled client for an upstream, creating it if needed.
+
+        Args:
+            upstream: Upstream name
+
+        Returns:
+            Shared async HTTP client
+        """
+        client = self._clients.get(upstream)
+        if client is None or client.is_closed:
+            client = self._create_client(upstream)
+            self._clients[upstream] = client
+        return client
+
+    async def startup(self) -> None:
+        """Open pooled clients for every configured upstream."""
+        for upstream in HTTP_POOL_LIMITS:
+            self.get(upstream)
+
+        logger.info(
+            "http_clients.started",
+            upstreams=list(self._clients),
+            http2=_http2_available(),
+        )
+
+    async def shutdown(self) -> None:
+        """Close all pooled clients and release their connections."""
+        clients = list(self._clients.items())
+        self._clients.clear()
+
+        for upstream, client in clients:
+            try:
+                await client.aclose()
+            except Exception as e:
+                logger.warning("http_clients.close_error", upstream=upstream, error=str(e))
+
+        logger.info("http_clients.stopped", closed=len(clients))
+
+
+http_clients = HttpClientRegistry()
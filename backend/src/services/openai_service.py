@@ -1,6 +1,9 @@
 """OpenAI service for parsing and response generation."""
 
 import json
+import re
+from collections import Counter
+from collections.abc import AsyncIterator
 from typing import Any
 
 from openai import AsyncOpenAI
@@ -11,21 +14,31 @@ from src.config.constants import (
     OPENAI_MAX_TOKENS_RESPONSE,
     OPENAI_MODEL,
     OPENAI_TEMPERATURE,
+    PARSE_FAST_PATH_MIN_CONFIDENCE,
 )
 from src.config.settings import get_settings
 from src.models.domain_models import ParsedInput
+from src.services.cache_service import get_cached_parse, set_cached_parse
 from src.utils.errors import UpstreamError
+from src.utils.input_sanitizer import IntentParser
 from src.utils.logger import get_logger
+from src.utils.metrics import STAGE_DURATION, metrics
+from src.utils.response_templates import render_template
 
 logger = get_logger(__name__)
 settings = get_settings()
 
 client = AsyncOpenAI(api_key=settings.openai_api_key)
 
+parse_route_counts: Counter[str] = Counter()
+
 
 async def parse_user_input(user_input: str) -> ParsedInput:
     """Parse user input to extract location and intent.
 
+    Successful LLM parses are memoized on the normalized input; heuristic
+    fallbacks are not, so a transient OpenAI failure is retried next time.
+
     Args:
         user_input: Raw user query
 
@@ -35,6 +48,11 @@ async def parse_user_input(user_input: str) -> ParsedInput:
     Raises:
         UpstreamError: If OpenAI API fails
     """
+    memoized = await get_cached_parse(user_input)
+    if memoized is not None:
+        logger.debug("openai.parse_memo_hit", input_preview=user_input[:100])
+        return memoized
+
     try:
         completion = await client.chat.completions.create(
             model=OPENAI_MODEL,
@@ -58,7 +76,7 @@ Extract the most specific location and the clearest intent description.""",
 
         result = json.loads(completion.choices[0].message.content or "{}")
 
-        return ParsedInput(
+        parsed = ParsedInput(
             location=result.get("location", ""),
             intent=result.get("intent", ""),
             confidence=0.8,
@@ -72,6 +90,9 @@ Extract the most specific location and the clearest intent description.""",
         )
         return _parse_heuristically(user_input)
 
+    await set_cached_parse(user_input, parsed)
+    return parsed
+
 
 def _parse_heuristically(user_input: str) -> ParsedInput:
     """Fallback heuristic parsing when OpenAI fails.
@@ -91,32 +112,88 @@ def _parse_heuristically(user_input: str) -> ParsedInput:
         r"([a-z\s]+(?:city|town|ville|burg|port))",
     ]
 
-    import re
-
     location = ""
+    phrase = ""
     for pattern in location_patterns:
         match = re.search(pattern, user_input, re.IGNORECASE)
         if match:
             location = match.group(1).strip()
+            phrase = user_input[: match.start()].strip(" ,.!?").lower()
             break
 
-    intent = "hidden gems"
-    for keyword in INTENT_KEYWORDS:
-        if keyword in text:
-            intent = keyword
-            break
+    # Keep everything asked for before the location phrase, so "quirky coffee
+    # shops in Portland" searches for coffee shops rather than just "quirky".
+    intent = phrase or next(
+        (keyword for keyword in INTENT_KEYWORDS if keyword in text), "hidden gems"
+    )
 
     return ParsedInput(
         location=location or "unknown",
         intent=intent,
         confidence=0.6 if location else 0.3,
+        method="heuristic",
     )
 
 
-async def generate_response(
+def _parse_locally_if_confident(user_input: str, local_intent: dict) -> ParsedInput | None:
+    """Use the heuristic parse when it is unambiguous.
+
+    The input must be nothing more than a known intent keyword followed by
+    its location, and the heuristic location must agree with the location
+    IntentParser found (allowing a trailing state code). Inputs such as
+    "quirky coffee shops in Portland" or "bars in Austin this weekend"
+    still go to the LLM.
+
+    Args:
+        user_input: Raw user query
+        local_intent: Result of IntentParser.parse_intent
+
+    Returns:
+        Heuristic parse, or None if the input needs the LLM
+    """
+    location_hint = local_intent.get("location")
+    if not location_hint:
+        return None
+
+    parsed = _parse_heuristically(user_input)
+    if parsed.intent not in INTENT_KEYWORDS:
+        return None
+    if parsed.confidence < PARSE_FAST_PATH_MIN_CONFIDENCE:
+        return None
+
+    agrees = re.fullmatch(
+        rf"{re.escape(location_hint)}(?:,?\s+[a-z]{{2}})?", parsed.location, re.IGNORECASE
+    )
+    return parsed if agrees else None
+
+
+@metrics.timed(STAGE_DURATION, stage="parse")
+async def route_parse(user_input: str, local_intent: dict | None = None) -> ParsedInput:
+    """Parse user input, skipping the OpenAI call when the local parse is confident.
+
+    Args:
+        user_input: Raw user query
+        local_intent: Result of IntentParser.parse_intent, computed if omitted
+
+    Returns:
+        Parsed input with location, intent, and confidence
+    """
+    if local_intent is None:
+        local_intent = IntentParser.parse_intent(user_input)
+
+    parsed = _parse_locally_if_confident(user_input, local_intent)
+    route = "heuristic" if parsed else "llm"
+    parse_route_counts[route] += 1
+    metrics.counter("parse_route_total", route=route)
+    logger.info("openai.parse_routed", route=route, input_preview=user_input[:100])
+
+    return parsed or await parse_user_input(user_input)
+
+
+def _build_response_messages(
     intent: str, location: str, places: list[dict[str, Any]], summary: dict[str, Any]
-) -> str:
-    """Generate Stonewalker-style response.
+) -> list[dict[str, str]]:
+    """Build the chat messages for a Stonewalker response.
 
     Args:
         intent: User's search intent
@@ -125,33 +202,25 @@ async def generate_response(
         summary: Scoring summary
 
     Returns:
-        Generated response text
-
-    Raises:
-        UpstreamError: If OpenAI API fails
+        Chat completion messages
     """
-    try:
-        places_text = "\n".join(
-            [f"• {p.get('name', 'Unknown')}: {p.get('description', '')[:100]}" for p in places[:5]]
-        )
+    places_text = "\n".join(
+        [f"• {p.get('name', 'Unknown')}: {p.get('description', '')[:100]}" for p in places[:5]]
+    )
 
-        completion = await client.chat.completions.create(
-            model=OPENAI_MODEL,
-            temperature=0.4,
-            max_tokens=OPENAI_MAX_TOKENS_RESPONSE,
-            messages=[
-                {
-                    "role": "system",
-                    "content": """You are Stonewalker, a mystical and concise travel guide who uncovers hidden places.
+    return [
+        {
+            "role": "system",
+            "content": """You are Stonewalker, a mystical and concise travel guide who uncovers hidden places.
 
 Respond with wisdom and brevity in 2-3 sentences. Be helpful but never overly enthusiastic.
 Reference the specific places found and give practical advice.
 
 Style: Mystical, wise, slightly mysterious, but practical and helpful.""",
-                },
-                {
-                    "role": "user",
-                    "content": f"""User seeks: {intent} in {location}
+        },
+        {
+            "role": "user",
+            "content": f"""User seeks: {intent} in {location}
 
 Found places:
 {places_text}
@@ -159,8 +228,34 @@ Found places:
 Scoring summary: {summary.get('total_results', 0)} results, average score {summary.get('average_score', 0):.1f}/1.0
 
 Write a brief Stonewalker response.""",
-                },
-            ],
+        },
+    ]
+
+
+@metrics.timed(STAGE_DURATION, stage="generate")
+async def generate_response(
+    intent: str, location: str, places: list[dict[str, Any]], summary: dict[str, Any]
+) -> str:
+    """Generate Stonewalker-style response.
+
+    Args:
+        intent: User's search intent
+        location: Normalized location
+        places: List of discovered places
+        summary: Scoring summary
+
+    Returns:
+        Generated response text
+
+    Raises:
+        UpstreamError: If OpenAI API fails
+    """
+    try:
+        completion = await client.chat.completions.create(
+            model=OPENAI_MODEL,
+            temperature=0.4,
+            max_tokens=OPENAI_MAX_TOKENS_RESPONSE,
+            messages=_build_response_messages(intent, location, places, summary),
         )
 
         return completion.choices[0].message.content or _generate_fallback_response(
@@ -172,6 +267,46 @@ Write a brief Stonewalker response.""",
         return _generate_fallback_response(intent, location, places)
 
 
+async def stream_response(
+    intent: str, location: str, places: list[dict[str, Any]], summary: dict[str, Any]
+) -> AsyncIterator[str]:
+    """Stream a Stonewalker-style response as it is generated.
+
+    Falls back to the template response if the stream fails before any
+    text is produced.
+
+    Args:
+        intent: User's search intent
+        location: Normalized location
+        places: List of discovered places
+        summary: Scoring summary
+
+    Yields:
+        Response text chunks
+    """
+    emitted = False
+    try:
+        stream = await client.chat.completions.create(
+            model=OPENAI_MODEL,
+            temperature=0.4,
+            max_tokens=OPENAI_MAX_TOKENS_RESPONSE,
+            messages=_build_response_messages(intent, location, places, summary),
+            stream=True,
+        )
+
+        async for chunk in stream:
+            delta = chunk.choices[0].delta.content if chunk.choices else None
+            if delta:
+                emitted = True
+                yield delta
+
+    except Exception as e:
+        logger.error("openai.stream_failed", error=str(e), emitted=emitted)
+
+    if not emitted:
+        yield _generate_fallback_response(intent, location, places)
+
+
 def _generate_fallback_response(intent: str, location: str, places: list[dict[str, Any]]) -> str:
     """Generate fallback response when OpenAI fails.
 
@@ -183,12 +318,4 @@ def _generate_fallback_response(intent: str, location: str, places: list[dict[st
     Returns:
         Fallback response text
     """
-    total = len(places)
-
-    if total == 0:
-        return f"The paths around {location} remain elusive for {intent}. Perhaps broaden your search or try a different approach—sometimes the best discoveries lie in unexpected directions."
-
-    if total >= 3:
-        return f"{location} reveals {total} intriguing spots for {intent}. These places whisper of authentic experiences—venture forth with curiosity and an open mind."
-
-    return f"{location} offers {total} discoveries for {intent}. Some paths lead nearby, others require a short journey—but each promises something beyond the ordinary tourist trail."
+    return render_template(intent, location, places)
@@ -2,21 +2,28 @@
 
 import httpx
 
-from src.config.constants import HTTP_CONNECT_TIMEOUT_SECONDS, HTTP_TIMEOUT_SECONDS
 from src.config.settings import get_settings
 from src.models.domain_models import SearchResult
+from src.services.http_client_service import http_clients, request_timeout
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
 settings = get_settings()
 
 
-async def search_reddit_rss(location: str, intent: str) -> list[SearchResult]:
+async def search_reddit_rss(
+    location: str,
+    intent: str,
+    client: httpx.AsyncClient | None = None,
+    timeout: float | None = None,
+) -> list[SearchResult]:
     """Search Reddit RSS for local recommendations.
 
     Args:
         location: Normalized location
         intent: Search intent
+        client: Shared HTTP client (defaults to the pooled reddit client)
+        timeout: Remaining deadline budget in seconds (defaults to the client timeout)
 
     Returns:
         List of search results
@@ -28,12 +35,12 @@ async def search_reddit_rss(location: str, intent: str) -> list[SearchResult]:
 
         headers = {"User-Agent": "Underfoot/1.0"}
 
-        async with httpx.AsyncClient(
-            timeout=httpx.Timeout(HTTP_TIMEOUT_SECONDS, connect=HTTP_CONNECT_TIMEOUT_SECONDS)
-        ) as client:
-            response = await client.get(url, params=params, headers=headers)
-            response.raise_for_status()
-            data = response.json()
+        client = client or http_clients.get("reddit")
+        response = await client.get(
+            url, params=params, headers=headers, timeout=request_timeout(timeout)
+        )
+        response.raise_for_status()
+        data = response.json()
 
         results = []
         for item in data.get("data", {}).get("children", [])[:10]:
@@ -60,6 +67,9 @@ async def search_reddit_rss(location: str, intent: str) -> list[SearchResult]:
 
         return results
 
+    except httpx.TimeoutException:
+        logger.warning("reddit.search_timeout", location=location, intent=intent)
+        raise
     except Exception as e:
         logger.error("reddit.search_failed", error=str(e), location=location, intent=intent)
         return []
@@ -0,0 +1,99 @@
+"""Stonewalker response generation with a per-search response policy."""
+
+from collections.abc import AsyncIterator
+from typing import Any
+
+from src.config.constants import RESPONSE_LLM_MIN_PLACES, RESPONSE_LLM_MIN_SOURCES
+from src.services import openai_service
+from src.utils.logger import get_logger
+from src.utils.metrics import STAGE_DURATION, metrics
+from src.utils.response_templates import place_sources, render_template
+
+logger = get_logger(__name__)
+
+POLICY_TEMPLATE = "template"
+POLICY_LLM = "llm"
+
+
+def choose_policy(places: list[dict[str, Any]]) -> str:
+    """Pick how the Stonewalker response is produced for a result set.
+
+    Small or single-source result sets give the model little to say that a
+    template cannot, so only sets with enough places from enough distinct
+    sources are sent to the LLM.
+
+    Args:
+        places: Ranked places for the response
+
+    Returns:
+        POLICY_LLM or POLICY_TEMPLATE
+    """
+    if (
+        len(places) >= RESPONSE_LLM_MIN_PLACES
+        and len(place_sources(places)) >= RESPONSE_LLM_MIN_SOURCES
+    ):
+        return POLICY_LLM
+    return POLICY_TEMPLATE
+
+
+async def generate_response(
+    intent: str,
+    location: str,
+    places: list[dict[str, Any]],
+    summary: dict[str, Any],
+    query_type: str = "general",
+) -> str:
+    """Generate the Stonewalker response using the policy for this result set.
+
+    Args:
+        intent: User's search intent
+        location: Normalized location
+        places: Ranked places for the response
+        summary: Scoring summary
+        query_type: Query type from IntentParser
+
+    Returns:
+        Response text
+    """
+    policy = choose_policy(places)
+    metrics.counter("response_policy_total", policy=policy)
+    logger.info("response.policy", policy=policy, places=len(places), query_type=query_type)
+
+    with metrics.time(STAGE_DURATION, stage="respond", policy=policy):
+        if policy == POLICY_TEMPLATE:
+            return render_template(intent, location, places, query_type)
+        return await openai_service.generate_response(intent, location, places, summary)
+
+
+async def stream_response(
+    intent: str,
+    location: str,
+    places: list[dict[str, Any]],
+    summary: dict[str, Any],
+    query_type: str = "general",
+) -> AsyncIterator[str]:
+    """Stream the Stonewalker response using the policy for this result set.
+
+    Template responses are yielded as a single chunk.
+
+    Args:
+        intent: User's search intent
+        location: Normalized location
+        places: Ranked places for the response
+        summary: Scoring summary
+        query_type: Query type from IntentParser
+
+    Yields:
+        Response text chunks
+    """
+    policy = choose_policy(places)
+    metrics.counter("response_policy_total", policy=policy)
+    logger.info("response.policy", policy=policy, places=len(places), query_type=query_type)
+
+    with metrics.time(STAGE_DURATION, stage="respond_stream", policy=policy):
+        if policy == POLICY_TEMPLATE:
+            yield render_template(intent, location, places, query_type)
+            return
+
+        async for chunk in openai_service.stream_response(intent, location, places, summary):
+            yield chunk
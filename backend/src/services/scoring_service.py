@@ -1,62 +1,170 @@
 """Scoring and ranking service for search results."""
 
+from functools import lru_cache
+
+import numpy as np
+
+from src.config.settings import get_settings
 from src.models.domain_models import CategorizedResults, ScoringSummary, SearchResult
+from src.utils.keyword_matcher import KeywordMatcher
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
-UNDERGROUND_KEYWORDS = [
-    "underground",
-    "hidden",
-    "secret",
-    "local",
-    "offbeat",
-    "alternative",
-    "indie",
-    "dive",
-    "authentic",
-    "quirky",
-    "weird",
-    "unique",
-    "undiscovered",
-    "locals only",
-]
-
-
-def score_result(result: SearchResult, intent: str) -> SearchResult:
+INTENT_MATCH_WEIGHT = 0.3
+KEYWORD_WEIGHT = 0.1
+MAX_KEYWORD_SCORE = 0.4
+SOURCE_WEIGHTS = {"reddit": 0.2, "serp": 0.15}
+POPULARITY_WEIGHT = 0.1
+REDDIT_POPULAR_SCORE = 100
+PRIMARY_THRESHOLD = 0.5
+
+
+@lru_cache(maxsize=1)
+def get_keyword_matcher() -> KeywordMatcher:
+    """Get the matcher for the configured underground keywords.
+
+    Keywords come from the SCORING_KEYWORDS setting (a JSON list),
+    defaulting to UNDERGROUND_KEYWORDS.
+
+    Returns:
+        Cached keyword matcher
+    """
+    return KeywordMatcher(get_settings().scoring_keywords)
+
+
+def _features(
+    result: SearchResult, intent_lower: str, matcher: KeywordMatcher
+) -> tuple[float, int, float, bool]:
+    """Extract the raw score features of one result.
+
+    Args:
+        result: Search result
+        intent_lower: Lowercased user intent
+        matcher: Underground keyword matcher
+
+    Returns:
+        Tuple of (intent matched, keyword count, source weight, popular)
+    """
+    text = f"{result.name} {result.description}".lower()
+
+    popular = bool(result.metadata) and (
+        result.source == "eventbrite"
+        or (result.source == "reddit" and result.metadata.get("score", 0) > REDDIT_POPULAR_SCORE)
+    )
+    return (
+        intent_lower in text,
+        matcher.count(text),
+        SOURCE_WEIGHTS.get(result.source, 0.0),
+        popular,
+    )
+
+
+def _scores(features: np.ndarray) -> np.ndarray:
+    """Weight and sum a feature matrix into scores.
+
+    Args:
+        features: One row of _features per result
+
+    Returns:
+        Score per result, capped at 1.0
+    """
+    intent, keywords, source, popular = features.T
+    total = (
+        INTENT_MATCH_WEIGHT * intent
+        + np.minimum(keywords * KEYWORD_WEIGHT, MAX_KEYWORD_SCORE)
+        + source
+        + POPULARITY_WEIGHT * popular
+    )
+    return np.minimum(total, 1.0)
+
+
+def _feature_matrix(
+    results: list[SearchResult], intent_lower: str, matcher: KeywordMatcher
+) -> np.ndarray:
+    """Build the feature matrix for a batch of results.
+
+    Args:
+        results: Search results
+        intent_lower: Lowercased user intent
+        matcher: Underground keyword matcher
+
+    Returns:
+        Array of shape (len(results), 4), one row of _features per result
+    """
+    return np.array(
+        [_features(result, intent_lower, matcher) for result in results], dtype=np.float64
+    ).reshape(len(results), 4)
+
+
+def score_result(
+    result: SearchResult, intent: str, matcher: KeywordMatcher | None = None
+) -> SearchResult:
     """Score a single search result based on relevance.
 
     Args:
         result: Search result to score
         intent: User's search intent
+        matcher: Underground keyword matcher (defaults to the configured one)
 
     Returns:
         Result with updated score
     """
-    score = 0.0
+    features = _feature_matrix([result], intent.lower(), matcher or get_keyword_matcher())
+    result.score = float(_scores(features)[0])
+    return result
 
-    text = f"{result.name} {result.description}".lower()
-    intent_lower = intent.lower()
 
-    if intent_lower in text:
-        score += 0.3
+def rank_results(
+    results: list[SearchResult], context: dict, top_k: int | None = None
+) -> tuple[list[SearchResult], CategorizedResults, ScoringSummary]:
+    """Score, rank, categorize and summarize results in one batch.
 
-    underground_count = sum(1 for keyword in UNDERGROUND_KEYWORDS if keyword in text)
-    score += min(underground_count * 0.1, 0.4)
+    Text features are extracted once per result into a matrix; weighting,
+    ordering, top-k, thresholding and summary statistics then run over
+    NumPy arrays.
 
-    if result.source == "reddit":
-        score += 0.2
-    elif result.source == "serp":
-        score += 0.15
+    Args:
+        results: List of search results
+        context: Search context with intent and location
+        top_k: Keep only the highest-scoring results (default: all)
+
+    Returns:
+        Tuple of (ranked results, categorized results, scoring summary)
+    """
+    features = _feature_matrix(results, context.get("intent", "").lower(), get_keyword_matcher())
+    scores = _scores(features)
+    order = np.argsort(-scores, kind="stable")[:top_k]
+    kept = scores[order]
+    is_primary = kept >= PRIMARY_THRESHOLD
+
+    ranked = []
+    primary: list[SearchResult] = []
+    nearby: list[SearchResult] = []
+    for index, score, in_primary in zip(
+        order.tolist(), kept.tolist(), is_primary.tolist(), strict=True
+    ):
+        result = results[index]
+        result.score = score
+        result.category = "primary" if in_primary else "nearby"
+        (primary if in_primary else nearby).append(result)
+        ranked.append(result)
+
+    summary = ScoringSummary(
+        total_results=len(ranked),
+        average_score=float(kept.mean()) if ranked else 0.0,
+        max_score=float(kept[0]) if ranked else 0.0,
+        min_score=float(kept[-1]) if ranked else 0.0,
+    )
 
-    if result.metadata:
-        if result.source == "reddit" and result.metadata.get("score", 0) > 100:
-            score += 0.1
-        if result.source == "eventbrite":
-            score += 0.1
+    logger.info(
+        "scoring.complete",
+        total_results=len(ranked),
+        primary_count=len(primary),
+        avg_score=summary.average_score,
+    )
 
-    result.score = min(score, 1.0)
-    return result
+    return ranked, CategorizedResults(primary=primary, nearby=nearby), summary
 
 
 def score_and_rank_results(results: list[SearchResult], context: dict) -> list[SearchResult]:
@@ -69,18 +177,8 @@ def score_and_rank_results(results: list[SearchResult], context: dict) -> list[S
     Returns:
         Sorted list of scored results
     """
-    intent = context.get("intent", "")
-
-    scored = [score_result(result, intent) for result in results]
-    scored.sort(key=lambda x: x.score, reverse=True)
-
-    logger.info(
-        "scoring.complete",
-        total_results=len(scored),
-        avg_score=sum(r.score for r in scored) / len(scored) if scored else 0,
-    )
-
-    return scored
+    ranked, _, _ = rank_results(results, context)
+    return ranked
 
 
 def categorize_results(scored_results: list[SearchResult]) -> CategorizedResults:
@@ -92,10 +190,8 @@ def categorize_results(scored_results: list[SearchResult]) -> CategorizedResults
     Returns:
         Categorized results
     """
-    primary_threshold = 0.5
-
-    primary = [r for r in scored_results if r.score >= primary_threshold]
-    nearby = [r for r in scored_results if r.score < primary_threshold]
+    primary = [r for r in scored_results if r.score >= PRIMARY_THRESHOLD]
+    nearby = [r for r in scored_results if r.score < PRIMARY_THRESHOLD]
 
     for result in primary:
         result.category = "primary"
@@ -2,29 +2,70 @@
 
 import asyncio
 import time
+from collections.abc import AsyncIterator, Awaitable, Callable
 from dataclasses import asdict
 from uuid import uuid4
 
-from src.models.domain_models import SearchContext
+import httpx
+
+from src.config.constants import (
+    DATA_SOURCE_DEADLINE_SECONDS,
+    DEFERRED_RESPONSE_MAX_ENTRIES,
+    DEFERRED_RESPONSE_TTL_SECONDS,
+    MEMORY_CACHE_MAX_BYTES,
+    OVERLOAD_RETRY_AFTER_SECONDS,
+    SEARCH_DEADLINE_SECONDS,
+    SEARCH_MAX_IN_FLIGHT,
+)
+from src.models.domain_models import (
+    CachedSearch,
+    CategorizedResults,
+    NormalizedLocation,
+    ParsedInput,
+    ScoringSummary,
+    SearchContext,
+    SearchResult,
+)
 from src.services import (
     cache_service,
+    dedup_service,
     eventbrite_service,
     geocoding_service,
     openai_service,
     reddit_service,
+    response_service,
     scoring_service,
     serp_service,
 )
+from src.utils.deadline import Deadline
+from src.utils.errors import OverloadedError
+from src.utils.input_sanitizer import IntentParser
 from src.utils.logger import get_logger
+from src.utils.metrics import STAGE_DURATION, metrics
+from src.utils.single_flight import SingleFlight
+from src.utils.sse import ConnectionLimiter
+from src.utils.ttl_cache import TTLCache
 
 logger = get_logger(__name__)
 
+inflight_searches = SingleFlight()
+search_admission = ConnectionLimiter(SEARCH_MAX_IN_FLIGHT)
+_background_tasks: set[asyncio.Task] = set()
+
+# Narrative generation tasks for deferred searches, keyed by request ID
+deferred_responses = TTLCache(
+    max_entries=DEFERRED_RESPONSE_MAX_ENTRIES,
+    max_bytes=MEMORY_CACHE_MAX_BYTES,
+    ttl_seconds=DEFERRED_RESPONSE_TTL_SECONDS,
+)
+
 
 async def execute_search(
     chat_input: str,
     force: bool = False,
     intent: dict | None = None,
     vector_query: str | None = None,
+    defer_response: bool = False,
 ) -> dict:
     """Execute complete search orchestration.
 
@@ -33,9 +74,17 @@ async def execute_search(
         force: Force bypass cache
         intent: Parsed user intent
         vector_query: Optimized query for vector search
+        defer_response: Return ranked places without waiting for the
+            Stonewalker response, which is then fetched by ``response_id``
+            (see get_deferred_response)
 
     Returns:
-        Complete search response
+        Complete search response, or places with ``response_status``
+        "pending" when the response is deferred
+
+    Raises:
+        OverloadedError: If this search would start a pipeline while
+            SEARCH_MAX_IN_FLIGHT pipelines are already running
     """
     started = time.perf_counter()
     request_id = f"search_{uuid4().hex[:12]}"
@@ -49,88 +98,789 @@ async def execute_search(
     )
 
     if not force:
-        cached = await cache_service.get_cached_search_results(chat_input, "")
+        cached = await cache_service.get_cached_search_results(chat_input)
         if cached:
-            elapsed_ms = int((time.perf_counter() - started) * 1000)
-            logger.info(
-                "search.cache_hit",
-                request_id=request_id,
-                elapsed_ms=elapsed_ms,
+            return _serve_cached(cached, chat_input, request_id, started, match="query")
+
+    if force:
+        return await _admit(
+            lambda: _run_pipeline(
+                chat_input,
+                request_id,
+                started,
+                use_cache=False,
+                intent=intent,
+                defer_response=defer_response,
             )
-            return {
-                **cached,
-                "debug": {
-                    **cached.get("debug", {}),
-                    "cache": "hit",
-                    "request_id": request_id,
-                    "execution_time_ms": elapsed_ms,
-                },
-            }
-
-    parsed = await openai_service.parse_user_input(chat_input)
-    if not parsed.location or not parsed.intent:
-        raise ValueError("Unable to parse location and intent from input")
-
-    normalized = await geocoding_service.normalize_location(parsed.location)
+        )
+
+    cache_key = cache_service.generate_cache_key(chat_input)
+    flight_key = f"{cache_key}:deferred" if defer_response else cache_key
+    result, shared = await inflight_searches.do(
+        flight_key,
+        lambda: _admit(
+            lambda: _run_pipeline(
+                chat_input, request_id, started, intent=intent, defer_response=defer_response
+            )
+        ),
+    )
+
+    if not shared:
+        return result
+
+    elapsed_ms = int((time.perf_counter() - started) * 1000)
+    logger.info(
+        "search.coalesced",
+        request_id=request_id,
+        leader_request_id=result["debug"]["request_id"],
+        elapsed_ms=elapsed_ms,
+    )
+    return {
+        **result,
+        "debug": {
+            **result["debug"],
+            "request_id": request_id,
+            "execution_time_ms": elapsed_ms,
+            "coalesced_with": result["debug"]["request_id"],
+        },
+    }
+
+
+async def _admit(run: Callable[[], Awaitable[dict]]) -> dict:
+    """Run a search pipeline if there is capacity for another one.
+
+    Only pipeline leaders pass through here: cache hits and searches
+    coalesced onto a running pipeline cost nothing and are never shed.
+    Excess pipelines are rejected up front rather than queued, keeping
+    latency bounded for admitted requests.
+
+    Args:
+        run: Starts the pipeline
+
+    Returns:
+        Pipeline result
+
+    Raises:
+        OverloadedError: If SEARCH_MAX_IN_FLIGHT pipelines are already running
+    """
+    if not search_admission.try_acquire():
+        metrics.counter("requests_shed_total", reason="overload")
+        raise OverloadedError(
+            retry_after=OVERLOAD_RETRY_AFTER_SECONDS, in_flight=search_admission.active
+        )
+
+    try:
+        return await run()
+    finally:
+        search_admission.release()
+
+
+def _serve_cached(
+    cached: CachedSearch, chat_input: str, request_id: str, started: float, match: str
+) -> dict:
+    """Build a response from a cache entry, refreshing it in the background if stale.
+
+    Args:
+        cached: Cache entry
+        chat_input: User's search query
+        request_id: Request ID
+        started: perf_counter timestamp when the request began
+        match: Which key produced the hit ("query" or "intent")
+
+    Returns:
+        Cached search response with freshness recorded in debug
+    """
+    stale = cached.is_stale
+    revalidating = _schedule_revalidation(chat_input) if stale else False
+
+    elapsed_ms = int((time.perf_counter() - started) * 1000)
+    logger.info(
+        "search.cache_hit",
+        request_id=request_id,
+        match=match,
+        stale=stale,
+        revalidating=revalidating,
+        elapsed_ms=elapsed_ms,
+    )
+    return {
+        **cached.results,
+        "debug": {
+            **cached.results.get("debug", {}),
+            "cache": "stale" if stale else "hit",
+            "cache_match": match,
+            "cache_age_seconds": int(cached.age_seconds),
+            "revalidating": revalidating,
+            "request_id": request_id,
+            "execution_time_ms": elapsed_ms,
+        },
+    }
+
+
+def _schedule_revalidation(chat_input: str) -> bool:
+    """Refresh a stale cache entry in the background, at most once per key.
+
+    Refreshes are coalesced under their own ``revalidate:`` key rather than
+    the search key, because a stale intent match is served by the pipeline
+    leader while it still holds the search key's flight. A refresh takes a
+    search_admission slot for its whole run and is skipped when none is
+    free; the stale entry keeps being served until a later hit refreshes it.
+
+    Args:
+        chat_input: User's search query
+
+    Returns:
+        True if a refresh was started, False if one is already running or
+        there is no capacity for it
+    """
+    flight_key = f"revalidate:{cache_service.generate_cache_key(chat_input)}"
+    if flight_key in inflight_searches:
+        return False
+    if not search_admission.try_acquire():
+        metrics.counter("requests_shed_total", reason="revalidate")
+        logger.info("search.revalidate_skipped", in_flight=search_admission.active)
+        return False
+
+    async def revalidate() -> None:
+        request_id = f"revalidate_{uuid4().hex[:12]}"
+        try:
+            await inflight_searches.do(
+                flight_key,
+                lambda: _run_pipeline(chat_input, request_id, time.perf_counter(), use_cache=False),
+            )
+            logger.info("search.revalidated", request_id=request_id)
+        except Exception as e:
+            logger.warning("search.revalidate_failed", request_id=request_id, error=str(e))
+        finally:
+            search_admission.release()
+
+    task = asyncio.create_task(revalidate())
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+    return True
+
+
+async def _run_pipeline(
+    chat_input: str,
+    request_id: str,
+    started: float,
+    use_cache: bool = True,
+    intent: dict | None = None,
+    defer_response: bool = False,
+) -> dict:
+    """Run the search pipeline: parse, geocode, fetch, score, respond.
+
+    Once the location is normalized, the cache is checked again by
+    (intent, location) so paraphrased queries reuse an existing result.
+    With ``defer_response`` the ranked places are returned as soon as they
+    are ready and the response is generated in the background; the cache
+    entry is written once the response is complete.
+
+    Args:
+        chat_input: User's search query
+        request_id: Request ID of the caller that started the pipeline
+        started: perf_counter timestamp when the request began
+        use_cache: Whether to consult the (intent, location) cache
+        intent: Locally parsed intent from IntentParser, if already computed
+        defer_response: Return before the Stonewalker response is generated
+
+    Returns:
+        Complete search response, or places with a pending response
+    """
+    deadline = Deadline(SEARCH_DEADLINE_SECONDS, started)
+    parsed, normalized, search_context = await _parse_and_locate(chat_input, intent)
+
+    if use_cache:
+        cached = await cache_service.get_cached_search_results_by_intent(
+            chat_input, parsed.intent, search_context.location
+        )
+        if cached:
+            return _serve_cached(cached, chat_input, request_id, started, match="intent")
+
+    data_source_started = time.perf_counter()
+    all_results: list[SearchResult] = []
+    source_stats: dict[str, dict] = {}
+    async for source_name, result in _iter_sources(search_context, deadline):
+        _record_source(source_name, result, all_results, source_stats)
+    data_source_ms = int((time.perf_counter() - data_source_started) * 1000)
+
+    categorized, summary, places_for_response = _rank(all_results, search_context)
+
+    if defer_response:
+        partial_result = _build_result(
+            request_id,
+            started,
+            parsed,
+            normalized,
+            None,
+            places_for_response,
+            source_stats,
+            summary,
+            data_source_ms,
+        )
+        _schedule_response(
+            chat_input, partial_result, categorized, search_context, request_id, started
+        )
+        return {**partial_result, "response_status": "pending", "response_id": request_id}
+
+    response = await response_service.generate_response(
+        parsed.intent,
+        search_context.location,
+        places_for_response,
+        asdict(summary),
+        search_context.query_type,
+    )
+
+    final_result = _build_result(
+        request_id,
+        started,
+        parsed,
+        normalized,
+        response,
+        places_for_response,
+        source_stats,
+        summary,
+        data_source_ms,
+    )
+    await _store_result(chat_input, final_result, categorized, request_id, started)
+    return final_result
+
+
+def _schedule_response(
+    chat_input: str,
+    partial_result: dict,
+    categorized: CategorizedResults,
+    search_context: SearchContext,
+    request_id: str,
+    started: float,
+) -> None:
+    """Generate a deferred Stonewalker response in the background.
+
+    The finished text is back-filled into the result, which is then cached
+    like any other completed search.
+
+    Args:
+        chat_input: User's search query
+        partial_result: Search response without the Stonewalker text
+        categorized: Categorized results
+        search_context: Search context
+        request_id: Request ID the response is fetched by
+        started: perf_counter timestamp when the request began
+    """
+
+    async def complete() -> str:
+        response = await response_service.generate_response(
+            partial_result["user_intent"],
+            partial_result["user_location"],
+            partial_result["places"],
+            partial_result["debug"]["scoring_summary"],
+            search_context.query_type,
+        )
+        await _store_result(
+            chat_input, {**partial_result, "response": response}, categorized, request_id, started
+        )
+        return response
+
+    def log_failure(task: asyncio.Task) -> None:
+        # Retrieving the exception here keeps an unpolled failure from being
+        # reported as "never retrieved"; pollers still see it via the task.
+        if not task.cancelled() and (error := task.exception()) is not None:
+            logger.warning(
+                "search.deferred_response_failed", request_id=request_id, error=str(error)
+            )
+
+    task = asyncio.create_task(complete())
+    deferred_responses.set(request_id, task)
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+    task.add_done_callback(log_failure)
+
+
+async def get_deferred_response(request_id: str, wait_seconds: float = 0) -> dict | None:
+    """Fetch the Stonewalker response of a deferred search.
+
+    Args:
+        request_id: The search's ``response_id``
+        wait_seconds: How long to wait for a pending response before returning
+
+    Returns:
+        Dict with status ("pending", "complete" or "failed") and response,
+        or None if the request ID is unknown or expired
+    """
+    task = deferred_responses.get(request_id)
+    if task is None:
+        return None
+
+    if not task.done() and wait_seconds > 0:
+        await asyncio.wait({task}, timeout=wait_seconds)
+
+    if not task.done():
+        return {"request_id": request_id, "status": "pending", "response": None}
+
+    if task.cancelled() or task.exception() is not None:
+        return {"request_id": request_id, "status": "failed", "response": None}
+
+    return {"request_id": request_id, "status": "complete", "response": task.result()}
+
+
+async def stream_search(
+    chat_input: str, force: bool = False, intent: dict | None = None
+) -> AsyncIterator[tuple[str, dict]]:
+    """Run the search pipeline, yielding each stage's output as it becomes available.
+
+    Emits ``start``, ``intent``, ``location``, one ``source`` event per data
+    source in completion order, ``places``, a ``token`` event per chunk of
+    the Stonewalker response, and finally ``done`` with the debug block.
+    Cache hits skip straight to ``places``/``token``/``done``. A search that
+    misses the query cache needs a search_admission slot for the rest of
+    the stream; without one it ends with an ``error`` event.
+
+    Args:
+        chat_input: User's search query
+        force: Force bypass cache
+        intent: Locally parsed intent from IntentParser, if already computed
+
+    Yields:
+        Tuples of (event name, JSON-serializable payload)
+    """
+    started = time.perf_counter()
+    deadline = Deadline(SEARCH_DEADLINE_SECONDS, started)
+    request_id = f"search_{uuid4().hex[:12]}"
+    logger.info("search.stream_start", request_id=request_id, input_preview=chat_input[:100])
+
+    yield "start", {"request_id": request_id}
+
+    if not force:
+        cached = await cache_service.get_cached_search_results(chat_input)
+        if cached:
+            for event in _cached_events(
+                _serve_cached(cached, chat_input, request_id, started, match="query")
+            ):
+                yield event
+            return
+
+    if not search_admission.try_acquire():
+        metrics.counter("requests_shed_total", reason="overload")
+        yield "error", {
+            "error": "SERVICE_OVERLOADED",
+            "retry_after": OVERLOAD_RETRY_AFTER_SECONDS,
+        }
+        return
+
+    try:
+        async for event in _stream_pipeline(
+            chat_input, request_id, started, deadline, force=force, intent=intent
+        ):
+            yield event
+    finally:
+        search_admission.release()
+
+
+async def _stream_pipeline(
+    chat_input: str,
+    request_id: str,
+    started: float,
+    deadline: Deadline,
+    force: bool = False,
+    intent: dict | None = None,
+) -> AsyncIterator[tuple[str, dict]]:
+    """Stream the pipeline stages of an admitted search (see stream_search).
+
+    Args:
+        chat_input: User's search query
+        request_id: Request ID for logging
+        started: perf_counter timestamp when the request began
+        deadline: Search deadline
+        force: Force bypass cache
+        intent: Locally parsed intent from IntentParser, if already computed
+
+    Yields:
+        Tuples of (event name, JSON-serializable payload)
+    """
+    parsed, normalized, search_context = await _parse_and_locate(chat_input, intent)
+    yield "intent", asdict(parsed)
+    yield "location", asdict(normalized)
+
+    if not force:
+        cached = await cache_service.get_cached_search_results_by_intent(
+            chat_input, parsed.intent, search_context.location
+        )
+        if cached:
+            for event in _cached_events(
+                _serve_cached(cached, chat_input, request_id, started, match="intent")
+            ):
+                yield event
+            return
+
+    data_source_started = time.perf_counter()
+    all_results: list[SearchResult] = []
+    source_stats: dict[str, dict] = {}
+    async for source_name, result in _iter_sources(search_context, deadline):
+        source_results = _record_source(source_name, result, all_results, source_stats)
+        yield "source", {
+            "source": source_name,
+            **source_stats[source_name],
+            "results": [_place_dict(r) for r in source_results],
+        }
+
+    data_source_ms = int((time.perf_counter() - data_source_started) * 1000)
+
+    categorized, summary, places_for_response = _rank(all_results, search_context)
+    yield "places", {"places": places_for_response, "scoring_summary": asdict(summary)}
+
+    chunks = []
+    async for chunk in response_service.stream_response(
+        parsed.intent,
+        search_context.location,
+        places_for_response,
+        asdict(summary),
+        search_context.query_type,
+    ):
+        chunks.append(chunk)
+        yield "token", {"text": chunk}
+
+    final_result = _build_result(
+        request_id,
+        started,
+        parsed,
+        normalized,
+        "".join(chunks),
+        places_for_response,
+        source_stats,
+        summary,
+        data_source_ms,
+    )
+    await _store_result(chat_input, final_result, categorized, request_id, started)
+
+    yield "done", {"debug": final_result["debug"]}
+
+
+def _cached_events(result: dict) -> list[tuple[str, dict]]:
+    """Replay a cached response as stream events.
+
+    Args:
+        result: Cached search response
+
+    Returns:
+        Events for the places, the full response text and the debug block
+    """
+    return [
+        ("places", {"places": result.get("places", [])}),
+        ("token", {"text": result.get("response", "")}),
+        ("done", {"debug": result["debug"]}),
+    ]
+
+
+async def _parse_and_locate(
+    chat_input: str, intent: dict | None = None
+) -> tuple[ParsedInput, NormalizedLocation, SearchContext]:
+    """Parse the query and normalize its location.
+
+    When IntentParser already found a location, it is geocoded speculatively
+    while the parse is in flight. The speculative result is used if it
+    matches the parsed location; otherwise it is discarded and the parsed
+    location is geocoded as before.
+
+    Args:
+        chat_input: User's search query
+        intent: Locally parsed intent from IntentParser, if already computed
+
+    Returns:
+        Tuple of (parsed input, normalized location, search context)
+
+    Raises:
+        ValueError: If no location or intent can be extracted
+    """
+    if intent is None:
+        intent = IntentParser.parse_intent(chat_input)
+
+    location_hint = intent.get("location")
+    speculative = (
+        asyncio.ensure_future(geocoding_service.normalize_location(location_hint))
+        if location_hint
+        else None
+    )
+
+    try:
+        parsed = await openai_service.route_parse(chat_input, intent)
+        if not parsed.location or not parsed.intent:
+            raise ValueError("Unable to parse location and intent from input")
+
+        normalized = await _speculative_location(speculative, location_hint, parsed.location)
+        if normalized is None:
+            normalized = await geocoding_service.normalize_location(parsed.location)
+    finally:
+        if speculative is not None and not speculative.done():
+            speculative.cancel()
 
     search_context = SearchContext(
         location=normalized.normalized,
         intent=parsed.intent,
         coordinates=normalized.coordinates,
         confidence=normalized.confidence,
+        query_type=intent.get("query_type", "general"),
     )
+    return parsed, normalized, search_context
 
-    data_source_started = time.perf_counter()
-    results = await asyncio.gather(
-        serp_service.search_hidden_gems(search_context.location, parsed.intent),
-        reddit_service.search_reddit_rss(search_context.location, parsed.intent),
-        eventbrite_service.search_local_events(search_context.location, [parsed.intent]),
-        return_exceptions=True,
-    )
 
-    all_results = []
-    source_stats = {}
+async def _speculative_location(
+    speculative: asyncio.Future | None, location_hint: str | None, parsed_location: str
+) -> NormalizedLocation | None:
+    """Resolve a speculative geocode if the parse agrees with it.
 
-    for idx, result in enumerate(results):
-        source_name = ["serpapi", "reddit", "eventbrite"][idx]
-        if isinstance(result, Exception):
-            logger.error(f"{source_name}.failed", error=str(result))
-            source_stats[source_name] = {"count": 0, "status": "failed", "error": str(result)}
-        else:
-            all_results.extend(result)
-            source_stats[source_name] = {"count": len(result), "status": "success"}
+    The parse agrees when it names the same location text as the hint, or
+    when the speculative geocode has already finished and resolved to the
+    parsed location (e.g. hint "Austin" geocoded to "Austin, TX, USA" and
+    parsed "Austin, TX"). A still-pending geocode of a different string is
+    cancelled rather than awaited.
+
+    Args:
+        speculative: Pending geocode of the IntentParser location, if started
+        location_hint: Location IntentParser found
+        parsed_location: Location from the parse
+
+    Returns:
+        Speculative result, or None if it must be discarded
+    """
+    if speculative is None or location_hint is None:
+        return None
+
+    wanted = _comparable_location(parsed_location)
+    same_text = wanted == _comparable_location(location_hint)
+    if not same_text and not speculative.done():
+        speculative.cancel()
+        logger.info("search.speculative_geocode", outcome="cancelled")
+        return None
+
+    try:
+        normalized = await speculative
+    except Exception as e:
+        logger.warning("search.speculative_geocode", outcome="failed", error=str(e))
+        return None
+
+    got = _comparable_location(normalized.normalized)
+    agrees = same_text or got == wanted or got.startswith(f"{wanted} ")
+    logger.info("search.speculative_geocode", outcome="used" if agrees else "discarded")
+    return normalized if agrees else None
+
+
+def _comparable_location(location: str) -> str:
+    """Normalize a location string for agreement checks.
+
+    Args:
+        location: Location text
+
+    Returns:
+        Lowercased location with punctuation and commas removed
+    """
+    return cache_service.normalize_cache_text(location).replace(",", "")
 
-    scored_results = scoring_service.score_and_rank_results(
-        all_results, {"intent": parsed.intent, "location": search_context.location}
-    )
-    categorized = scoring_service.categorize_results(scored_results)
-    summary = scoring_service.generate_scoring_summary(scored_results)
-
-    places_for_response = [
-        {
-            "name": r.name,
-            "description": r.description,
-            "source": r.source,
-            "url": r.url,
-            "score": r.score,
-            "category": r.category,
-        }
-        for r in (categorized.primary + categorized.nearby)
-    ]
 
-    response = await openai_service.generate_response(
-        parsed.intent, search_context.location, places_for_response, asdict(summary)
+def _source_calls(
+    search_context: SearchContext, timeout: float
+) -> dict[str, Awaitable[list[SearchResult]]]:
+    """Build the data-source fetches for a search.
+
+    Args:
+        search_context: Search context
+        timeout: Budget in seconds each source may spend
+
+    Returns:
+        Mapping of source name to its pending fetch
+    """
+    return {
+        "serpapi": serp_service.search_hidden_gems(
+            search_context.location, search_context.intent, timeout=timeout
+        ),
+        "reddit": reddit_service.search_reddit_rss(
+            search_context.location, search_context.intent, timeout=timeout
+        ),
+        "eventbrite": eventbrite_service.search_local_events(
+            search_context.location, [search_context.intent], timeout=timeout
+        ),
+    }
+
+
+async def _iter_sources(
+    search_context: SearchContext, deadline: Deadline
+) -> AsyncIterator[tuple[str, list[SearchResult] | BaseException]]:
+    """Fan out to every data source and yield outcomes in completion order.
+
+    Sources share a budget of DATA_SOURCE_DEADLINE_SECONDS, capped by what is
+    left of the request deadline. Sources still running when it runs out are
+    cancelled and reported as timeouts, so ranking proceeds with whatever
+    arrived in time.
+
+    Args:
+        search_context: Search context
+        deadline: Request deadline
+
+    Yields:
+        Tuples of (source name, results or the exception the fetch raised)
+    """
+    budget = deadline.remaining(cap=DATA_SOURCE_DEADLINE_SECONDS)
+    source_deadline = Deadline(budget)
+    fanout_started = time.perf_counter()
+    pending = {
+        asyncio.ensure_future(call): name
+        for name, call in _source_calls(search_context, budget).items()
+    }
+
+    try:
+        while pending:
+            done, _ = await asyncio.wait(
+                pending, timeout=source_deadline.remaining(), return_when=asyncio.FIRST_COMPLETED
+            )
+            if not done:
+                break
+            for task in done:
+                name = pending.pop(task)
+                outcome = task.exception() or task.result()
+                _time_source(name, outcome, fanout_started)
+                yield name, outcome
+
+        for name in pending.values():
+            logger.warning("search.source_deadline_exceeded", source=name, budget_s=budget)
+            metrics.timing(
+                STAGE_DURATION, budget * 1000, stage="source", source=name, status="timeout"
+            )
+            yield name, TimeoutError(f"{name} exceeded {budget:.1f}s deadline")
+    finally:
+        for task in pending:
+            task.cancel()
+
+
+def _time_source(
+    source_name: str, outcome: list[SearchResult] | BaseException, fanout_started: float
+) -> None:
+    """Record how long a data source took to settle.
+
+    Args:
+        source_name: Data source name
+        outcome: Results, or the exception the fetch raised
+        fanout_started: perf_counter timestamp the fan-out began
+    """
+    if isinstance(outcome, TimeoutError | httpx.TimeoutException):
+        status = "timeout"
+    elif isinstance(outcome, BaseException):
+        status = "failed"
+    else:
+        status = "success"
+    elapsed_ms = (time.perf_counter() - fanout_started) * 1000
+    metrics.timing(STAGE_DURATION, elapsed_ms, stage="source", source=source_name, status=status)
+
+
+def _record_source(
+    source_name: str,
+    result: list[SearchResult] | BaseException,
+    all_results: list[SearchResult],
+    source_stats: dict[str, dict],
+) -> list[SearchResult]:
+    """Fold one data source's outcome into the combined results and stats.
+
+    Args:
+        source_name: Data source name
+        result: Results, or the exception the fetch raised
+        all_results: Combined results to extend
+        source_stats: Per-source stats to update
+
+    Returns:
+        The source's results (empty on failure)
+    """
+    if isinstance(result, TimeoutError | httpx.TimeoutException):
+        source_stats[source_name] = {"count": 0, "status": "timeout"}
+        return []
+
+    if isinstance(result, BaseException):
+        logger.error(f"{source_name}.failed", error=str(result))
+        source_stats[source_name] = {"count": 0, "status": "failed", "error": str(result)}
+        return []
+
+    all_results.extend(result)
+    source_stats[source_name] = {"count": len(result), "status": "success"}
+    return result
+
+
+def _place_dict(result: SearchResult) -> dict:
+    """Convert a scored result to its response shape.
+
+    Args:
+        result: Search result
+
+    Returns:
+        Place dict
+    """
+    return {
+        "name": result.name,
+        "description": result.description,
+        "source": result.source,
+        "sources": sorted(
+            {p["source"] for p in (result.metadata or {}).get("provenance", [])}
+            or {result.source}
+        ),
+        "url": result.url,
+        "score": result.score,
+        "category": result.category,
+    }
+
+
+@metrics.timed(STAGE_DURATION, stage="scoring")
+def _rank(
+    all_results: list[SearchResult], search_context: SearchContext
+) -> tuple[CategorizedResults, ScoringSummary, list[dict]]:
+    """Deduplicate, score, rank and categorize combined results.
+
+    Args:
+        all_results: Results from every data source
+        search_context: Search context
+
+    Returns:
+        Tuple of (categorized results, scoring summary, places for the response)
+    """
+    _, categorized, summary = scoring_service.rank_results(
+        dedup_service.deduplicate(all_results),
+        {"intent": search_context.intent, "location": search_context.location},
     )
 
-    final_result = {
+    places = [_place_dict(r) for r in (categorized.primary + categorized.nearby)]
+    return categorized, summary, places
+
+
+def _build_result(
+    request_id: str,
+    started: float,
+    parsed: ParsedInput,
+    normalized: NormalizedLocation,
+    response: str | None,
+    places: list[dict],
+    source_stats: dict[str, dict],
+    summary: ScoringSummary,
+    data_source_ms: int,
+) -> dict:
+    """Assemble the search response.
+
+    Args:
+        request_id: Request ID
+        started: perf_counter timestamp when the request began
+        parsed: Parsed input
+        normalized: Normalized location
+        response: Stonewalker response text, or None if deferred
+        places: Ranked places
+        source_stats: Per-source stats
+        summary: Scoring summary
+        data_source_ms: Time spent in the data-source fan-out
+
+    Returns:
+        Complete search response
+    """
+    return {
         "user_intent": parsed.intent,
-        "user_location": search_context.location,
+        "user_location": normalized.normalized,
         "response": response,
-        "places": places_for_response,
+        "places": places,
         "debug": {
             "request_id": request_id,
             "execution_time_ms": int((time.perf_counter() - started) * 1000),
-            "data_source_ms": int((time.perf_counter() - data_source_started) * 1000),
+            "data_source_ms": data_source_ms,
             "parsed": asdict(parsed),
             "normalized_location": asdict(normalized),
             "source_stats": source_stats,
@@ -139,8 +889,25 @@ async def execute_search(
         },
     }
 
+
+async def _store_result(
+    chat_input: str,
+    final_result: dict,
+    categorized: CategorizedResults,
+    request_id: str,
+    started: float,
+) -> None:
+    """Cache a completed search and log its completion.
+
+    Args:
+        chat_input: User's search query
+        final_result: Complete search response
+        categorized: Categorized results
+        request_id: Request ID
+        started: perf_counter timestamp when the request began
+    """
     await cache_service.set_cached_search_results(
-        chat_input, search_context.location, final_result, 30
+        chat_input, final_result["user_intent"], final_result["user_location"], final_result, 30
     )
 
     elapsed_ms = int((time.perf_counter() - started) * 1000)
@@ -148,9 +915,7 @@ async def execute_search(
         "search.complete",
         request_id=request_id,
         elapsed_ms=elapsed_ms,
-        result_count=len(places_for_response),
+        result_count=len(final_result["places"]),
         primary_count=len(categorized.primary),
         nearby_count=len(categorized.nearby),
     )
-
-    return final_result
@@ -2,21 +2,28 @@
 
 import httpx
 
-from src.config.constants import HTTP_CONNECT_TIMEOUT_SECONDS, HTTP_TIMEOUT_SECONDS
 from src.config.settings import get_settings
 from src.models.domain_models import SearchResult
+from src.services.http_client_service import http_clients, request_timeout
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
 settings = get_settings()
 
 
-async def search_hidden_gems(location: str, intent: str) -> list[SearchResult]:
+async def search_hidden_gems(
+    location: str,
+    intent: str,
+    client: httpx.AsyncClient | None = None,
+    timeout: float | None = None,
+) -> list[SearchResult]:
     """Search for hidden gems using SERP API.
 
     Args:
         location: Normalized location
         intent: Search intent
+        client: Shared HTTP client (defaults to the pooled serpapi client)
+        timeout: Remaining deadline budget in seconds (defaults to the client timeout)
 
     Returns:
         List of search results
@@ -32,12 +39,12 @@ async def search_hidden_gems(location: str, intent: str) -> list[SearchResult]:
             "api_key": settings.serpapi_key,
         }
 
-        async with httpx.AsyncClient(
-            timeout=httpx.Timeout(HTTP_TIMEOUT_SECONDS, connect=HTTP_CONNECT_TIMEOUT_SECONDS)
-        ) as client:
-            response = await client.get("https://serpapi.com/search", params=params)
-            response.raise_for_status()
-            data = response.json()
+        client = client or http_clients.get("serpapi")
+        response = await client.get(
+            "https://serpapi.com/search", params=params, timeout=request_timeout(timeout)
+        )
+        response.raise_for_status()
+        data = response.json()
 
         results = []
         for item in data.get("organic_results", [])[:10]:
@@ -60,6 +67,9 @@ async def search_hidden_gems(location: str, intent: str) -> list[SearchResult]:
 
         return results
 
+    except httpx.TimeoutException:
+        logger.warning("serp.search_timeout", location=location, intent=intent)
+        raise
     except Exception as e:
         logger.error("serp.search_failed", error=str(e), location=location, intent=intent)
         return []
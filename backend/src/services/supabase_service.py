@@ -1,16 +1,30 @@
 """Supabase database service."""
 
-from datetime import datetime, timedelta, timezone
+import asyncio
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from datetime import UTC, datetime, timedelta
 from functools import lru_cache
 from typing import Any
 
 from supabase import Client, create_client
 
+from src.config.constants import (
+    LOCATION_CACHE_TTL_HOURS,
+    PARSE_CACHE_TTL_HOURS,
+    SUPABASE_MAX_CONCURRENCY,
+)
 from src.config.settings import get_settings
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+UPSERT_CONFLICT_KEYS = {
+    "search_results": "query_hash",
+    "location_cache": "raw_input",
+    "parse_cache": "input_hash",
+}
+
 
 @lru_cache(maxsize=1)
 def get_supabase_client() -> Client:
@@ -23,6 +37,102 @@ def get_supabase_client() -> Client:
     return create_client(settings.supabase_url, settings.supabase_service_role_key)
 
 
+def search_results_row(
+    query_hash: str,
+    location: str,
+    intent: str,
+    results: dict,
+    ttl_seconds: int = 3600,
+    payload_version: int = 0,
+) -> dict:
+    """Build a search_results row.
+
+    Args:
+        query_hash: Hash of the query
+        location: Normalized location
+        intent: User intent JSON
+        results: Search results JSON
+        ttl_seconds: Time to live in seconds
+        payload_version: Cache payload format (0 for a full response)
+
+    Returns:
+        Row for upsert
+    """
+    now = datetime.now(UTC)
+    return {
+        "query_hash": query_hash,
+        "location": location,
+        "intent": intent,
+        "results_json": results,
+        "payload_version": payload_version,
+        "created_at": now.isoformat(),
+        "expires_at": (now + timedelta(seconds=ttl_seconds)).isoformat(),
+    }
+
+
+def location_row(
+    raw_input: str,
+    normalized_location: str,
+    confidence: float,
+    raw_candidates: list,
+    ttl_seconds: int = LOCATION_CACHE_TTL_HOURS * 3600,
+) -> dict:
+    """Build a location_cache row.
+
+    Args:
+        raw_input: Raw user input
+        normalized_location: Normalized location string
+        confidence: Confidence score (0-1)
+        raw_candidates: List of candidate locations
+        ttl_seconds: Time to live in seconds
+
+    Returns:
+        Row for upsert
+    """
+    now = datetime.now(UTC)
+    return {
+        "raw_input": raw_input,
+        "normalized_location": normalized_location,
+        "confidence": confidence,
+        "raw_candidates": raw_candidates,
+        "created_at": now.isoformat(),
+        "expires_at": (now + timedelta(seconds=ttl_seconds)).isoformat(),
+    }
+
+
+def parse_row(
+    input_hash: str,
+    raw_input: str,
+    parsed: dict,
+    model: str,
+    prompt_version: int,
+    ttl_seconds: int = PARSE_CACHE_TTL_HOURS * 3600,
+) -> dict:
+    """Build a parse_cache row.
+
+    Args:
+        input_hash: Hash of model, prompt version and normalized input
+        raw_input: Normalized user input
+        parsed: ParsedInput fields
+        model: Model that produced the parse
+        prompt_version: Parse prompt version
+        ttl_seconds: Time to live in seconds
+
+    Returns:
+        Row for upsert
+    """
+    now = datetime.now(UTC)
+    return {
+        "input_hash": input_hash,
+        "raw_input": raw_input,
+        "parsed_json": parsed,
+        "model": model,
+        "prompt_version": prompt_version,
+        "created_at": now.isoformat(),
+        "expires_at": (now + timedelta(seconds=ttl_seconds)).isoformat(),
+    }
+
+
 class SupabaseService:
     """Service for Supabase operations."""
 
@@ -41,52 +151,6 @@ class SupabaseService:
             self._client = get_supabase_client()
         return self._client
 
-    def store_search_results(
-        self,
-        query_hash: str,
-        location: str,
-        intent: str,
-        results: dict,
-        ttl_seconds: int = 3600,
-    ) -> bool:
-        """Store search results in cache.
-
-        Args:
-            query_hash: Hash of the query
-            location: Normalized location
-            intent: User intent JSON
-            results: Search results JSON
-            ttl_seconds: Time to live in seconds
-
-        Returns:
-            True if stored successfully
-        """
-        try:
-            expires_at = datetime.now(timezone.utc) + timedelta(seconds=ttl_seconds)
-
-            data = {
-                "query_hash": query_hash,
-                "location": location,
-                "intent": intent,
-                "results_json": results,
-                "expires_at": expires_at.isoformat(),
-            }
-
-            response = self.client.table("search_results").upsert(data).execute()
-
-            logger.info(
-                "supabase.cache_stored",
-                query_hash=query_hash,
-                location=location,
-                ttl_seconds=ttl_seconds,
-            )
-
-            return True
-
-        except Exception as e:
-            logger.error("supabase.store_error", error=str(e), exc_info=True)
-            return False
-
     def get_search_results(self, query_hash: str) -> dict | None:
         """Retrieve cached search results.
 
@@ -94,20 +158,20 @@ class SupabaseService:
             query_hash: Hash of the query
 
         Returns:
-            Cached results or None
+            Row with results_json and created_at, or None
         """
         try:
             response = (
                 self.client.table("search_results")
-                .select("*")
+                .select("results_json, created_at")
                 .eq("query_hash", query_hash)
-                .gt("expires_at", datetime.now(timezone.utc).isoformat())
+                .gt("expires_at", datetime.now(UTC).isoformat())
                 .execute()
             )
 
             if response.data and len(response.data) > 0:
                 logger.info("supabase.cache_hit", query_hash=query_hash)
-                return response.data[0]["results_json"]
+                return response.data[0]
 
             logger.info("supabase.cache_miss", query_hash=query_hash)
             return None
@@ -116,51 +180,38 @@ class SupabaseService:
             logger.error("supabase.get_error", error=str(e), exc_info=True)
             return None
 
-    def store_location(
-        self,
-        raw_input: str,
-        normalized_location: str,
-        confidence: float,
-        raw_candidates: list,
-        ttl_days: int = 30,
-    ) -> bool:
-        """Store normalized location in cache.
+    def get_search_results_by_intent(self, intent: str, location: str) -> dict | None:
+        """Retrieve the freshest cached results for a parsed intent and location.
 
         Args:
-            raw_input: Raw user input
-            normalized_location: Normalized location string
-            confidence: Confidence score (0-1)
-            raw_candidates: List of candidate locations
-            ttl_days: Time to live in days
+            intent: Normalized intent
+            location: Normalized location
 
         Returns:
-            True if stored successfully
+            Row with results_json and created_at, or None
         """
         try:
-            expires_at = datetime.now(timezone.utc) + timedelta(days=ttl_days)
-
-            data = {
-                "raw_input": raw_input,
-                "normalized_location": normalized_location,
-                "confidence": confidence,
-                "raw_candidates": raw_candidates,
-                "expires_at": expires_at.isoformat(),
-            }
-
-            response = self.client.table("location_cache").upsert(data).execute()
-
-            logger.info(
-                "supabase.location_stored",
-                raw_input=raw_input,
-                normalized=normalized_location,
-                confidence=confidence,
+            response = (
+                self.client.table("search_results")
+                .select("results_json, created_at")
+                .eq("intent", intent)
+                .eq("location", location)
+                .gt("expires_at", datetime.now(UTC).isoformat())
+                .order("created_at", desc=True)
+                .limit(1)
+                .execute()
             )
 
-            return True
+            if response.data:
+                logger.info("supabase.intent_cache_hit", intent=intent, location=location)
+                return response.data[0]
+
+            logger.info("supabase.intent_cache_miss", intent=intent, location=location)
+            return None
 
         except Exception as e:
-            logger.error("supabase.location_store_error", error=str(e), exc_info=True)
-            return False
+            logger.error("supabase.get_error", error=str(e), exc_info=True)
+            return None
 
     def get_location(self, raw_input: str) -> dict | None:
         """Retrieve cached location normalization.
@@ -176,7 +227,7 @@ class SupabaseService:
                 self.client.table("location_cache")
                 .select("*")
                 .eq("raw_input", raw_input)
-                .gt("expires_at", datetime.now(timezone.utc).isoformat())
+                .gt("expires_at", datetime.now(UTC).isoformat())
                 .execute()
             )
 
@@ -191,31 +242,85 @@ class SupabaseService:
             logger.error("supabase.location_get_error", error=str(e), exc_info=True)
             return None
 
-    def get_stats(self) -> dict:
-        """Get cache statistics.
+    def get_parse(self, input_hash: str) -> dict | None:
+        """Retrieve a memoized parse result.
+
+        Args:
+            input_hash: Hash of model, prompt version and normalized input
 
         Returns:
-            Stats dict with counts
+            Stored ParsedInput fields or None
         """
         try:
-            search_count = len(
-                self.client.table("search_results")
-                .select("id", count="exact")
+            response = (
+                self.client.table("parse_cache")
+                .select("parsed_json")
+                .eq("input_hash", input_hash)
+                .gt("expires_at", datetime.now(UTC).isoformat())
                 .execute()
-                .data
             )
 
-            location_count = len(
-                self.client.table("location_cache")
-                .select("id", count="exact")
-                .execute()
-                .data
+            if response.data:
+                logger.info("supabase.parse_hit", input_hash=input_hash)
+                return response.data[0]["parsed_json"]
+
+            logger.info("supabase.parse_miss", input_hash=input_hash)
+            return None
+
+        except Exception as e:
+            logger.error("supabase.parse_get_error", error=str(e), exc_info=True)
+            return None
+
+    def upsert_rows(self, table: str, rows: list[dict]) -> bool:
+        """Upsert a batch of cache rows in one request.
+
+        Args:
+            table: Cache table (a key of UPSERT_CONFLICT_KEYS)
+            rows: Rows built by the matching *_row helper
+
+        Returns:
+            True if stored successfully
+        """
+        try:
+            self.client.table(table).upsert(
+                rows, on_conflict=UPSERT_CONFLICT_KEYS[table]
+            ).execute()
+
+            logger.info("supabase.batch_stored", table=table, rows=len(rows))
+            return True
+
+        except Exception as e:
+            logger.error(
+                "supabase.batch_store_error", table=table, rows=len(rows), error=str(e), exc_info=True
             )
+            return False
+
+    def count_rows(self, table: str) -> int:
+        """Count a table's rows server-side.
+
+        Issues a HEAD request, so only the count comes back, never the rows.
+
+        Args:
+            table: Table name
+
+        Returns:
+            Row count
+        """
+        response = self.client.table(table).select("id", count="exact", head=True).execute()
+        return response.count or 0
 
+    def get_stats(self) -> dict:
+        """Get cache statistics.
+
+        Returns:
+            Stats dict with counts
+        """
+        try:
             return {
                 "connected": True,
-                "search_results_count": search_count,
-                "location_cache_count": location_count,
+                "search_results_count": self.count_rows("search_results"),
+                "location_cache_count": self.count_rows("location_cache"),
+                "parse_cache_count": self.count_rows("parse_cache"),
             }
 
         except Exception as e:
@@ -223,4 +328,77 @@ class SupabaseService:
             return {"connected": False, "error": str(e)}
 
 
+class AsyncSupabaseService:
+    """Non-blocking facade over SupabaseService.
+
+    The supabase ``Client`` is synchronous, so each call runs on a dedicated
+    thread pool instead of the event loop. A semaphore bounds in-flight round
+    trips so a slow database queues callers rather than piling up threads.
+    """
+
+    def __init__(
+        self, service: SupabaseService, max_concurrency: int = SUPABASE_MAX_CONCURRENCY
+    ) -> None:
+        self._service = service
+        self._max_concurrency = max_concurrency
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._executor: ThreadPoolExecutor | None = None
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Lazily create the worker pool."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self._max_concurrency, thread_name_prefix="supabase"
+            )
+        return self._executor
+
+    async def _run(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """Run a blocking Supabase call off the event loop.
+
+        Args:
+            func: Synchronous SupabaseService method
+            *args: Positional arguments for func
+            **kwargs: Keyword arguments for func
+
+        Returns:
+            Whatever func returns
+        """
+        async with self._semaphore:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                self._get_executor(), lambda: func(*args, **kwargs)
+            )
+
+    async def get_search_results(self, query_hash: str) -> dict | None:
+        """Retrieve cached search results without blocking the event loop."""
+        return await self._run(self._service.get_search_results, query_hash)
+
+    async def get_search_results_by_intent(self, intent: str, location: str) -> dict | None:
+        """Retrieve cached results by intent and location without blocking the event loop."""
+        return await self._run(self._service.get_search_results_by_intent, intent, location)
+
+    async def get_location(self, raw_input: str) -> dict | None:
+        """Retrieve cached location normalization without blocking the event loop."""
+        return await self._run(self._service.get_location, raw_input)
+
+    async def get_parse(self, input_hash: str) -> dict | None:
+        """Retrieve a memoized parse result without blocking the event loop."""
+        return await self._run(self._service.get_parse, input_hash)
+
+    async def upsert_rows(self, table: str, rows: list[dict]) -> bool:
+        """Upsert a batch of cache rows without blocking the event loop."""
+        return await self._run(self._service.upsert_rows, table, rows)
+
+    async def get_stats(self) -> dict:
+        """Get cache statistics without blocking the event loop."""
+        return await self._run(self._service.get_stats)
+
+    async def close(self) -> None:
+        """Wait for in-flight calls to finish and release the worker pool."""
+        executor, self._executor = self._executor, None
+        if executor is not None:
+            await asyncio.to_thread(executor.shutdown, wait=True)
+
+
 supabase = SupabaseService()
+async_supabase = AsyncSupabaseService(supabase)
@@ -0,0 +1,105 @@
+"""Compact, versioned encoding for cached search results."""
+
+from typing import Any
+
+from src.config.constants import CACHE_PAYLOAD_VERSION
+
+# Per-request data that is never served from the cache
+DROPPED_KEYS = frozenset({"debug"})
+
+# Place dicts are stored as lists of the fields they have, in this order
+PLACE_FIELDS = ("name", "description", "source", "sources", "url", "score", "category")
+
+
+def strip(results: dict[str, Any]) -> dict[str, Any]:
+    """Drop the parts of a search response that are not worth caching.
+
+    Args:
+        results: Search response
+
+    Returns:
+        Response without per-request debug data
+    """
+    return {key: value for key, value in results.items() if key not in DROPPED_KEYS}
+
+
+def compact(results: dict[str, Any]) -> dict[str, Any]:
+    """Convert a search response to the compact payload format.
+
+    Places become positional lists: a bitmask of the PLACE_FIELDS the place
+    has, then those fields' values in PLACE_FIELDS order, with source names
+    interned into a shared table. Keys a place has beyond PLACE_FIELDS are
+    kept in a trailing dict.
+
+    Args:
+        results: Search response
+
+    Returns:
+        Compact payload tagged with CACHE_PAYLOAD_VERSION
+    """
+    sources: dict[str, int] = {}
+
+    def intern(name: Any) -> Any:
+        return sources.setdefault(name, len(sources)) if isinstance(name, str) else name
+
+    places = []
+    for place in results.get("places", []):
+        mask = 0
+        values = []
+        for bit, field in enumerate(PLACE_FIELDS):
+            if field not in place:
+                continue
+            value = place[field]
+            if field == "source":
+                value = intern(value)
+            elif field == "sources" and value is not None:
+                value = [intern(name) for name in value]
+            mask |= 1 << bit
+            values.append(value)
+
+        row = [mask, *values]
+        extra = {key: value for key, value in place.items() if key not in PLACE_FIELDS}
+        if extra:
+            row.append(extra)
+        places.append(row)
+
+    rest = {k: v for k, v in strip(results).items() if k != "places"}
+    return {"v": CACHE_PAYLOAD_VERSION, "s": list(sources), "p": places, "m": rest}
+
+
+def expand(payload: dict[str, Any]) -> dict[str, Any]:
+    """Convert a stored payload back to a search response.
+
+    Payloads without a version tag are full responses written before the
+    compact format existed and are returned as stored.
+
+    Args:
+        payload: Stored payload
+
+    Returns:
+        Search response
+
+    Raises:
+        ValueError: If the payload has an unknown version
+    """
+    version = payload.get("v")
+    if version is None:
+        return payload
+    if version != CACHE_PAYLOAD_VERSION:
+        raise ValueError(f"Unsupported cache payload version: {version}")
+
+    sources = payload["s"]
+    places = []
+    for mask, *values in payload["p"]:
+        fields = [field for bit, field in enumerate(PLACE_FIELDS) if mask >> bit & 1]
+        place = dict(zip(fields, values, strict=False))
+        if isinstance(place.get("source"), int):
+            place["source"] = sources[place["source"]]
+        if place.get("sources") is not None:
+            place["sources"] = [sources[i] if isinstance(i, int) else i for i in place["sources"]]
+        if len(values) > len(fields):
+            place.update(values[-1])
+        places.append(place)
+
+    return {**payload["m"], "places": places}
+
@@ -0,0 +1,33 @@
+"""Request deadline budgets."""
+
+import time
+
+
+class Deadline:
+    """Absolute deadline for a request, shared by every stage that runs under it."""
+
+    def __init__(self, seconds: float, started: float | None = None) -> None:
+        """Create a deadline.
+
+        Args:
+            seconds: Total budget in seconds
+            started: perf_counter timestamp the budget counts from (default: now)
+        """
+        self.expires_at = (time.perf_counter() if started is None else started) + seconds
+
+    def remaining(self, cap: float | None = None) -> float:
+        """Seconds left before the deadline, optionally capped for a single stage.
+
+        Args:
+            cap: Maximum budget to hand to one stage
+
+        Returns:
+            Non-negative seconds remaining
+        """
+        left = max(0.0, self.expires_at - time.perf_counter())
+        return left if cap is None else min(left, cap)
+
+    @property
+    def expired(self) -> bool:
+        """Whether the deadline has passed."""
+        return self.remaining() <= 0
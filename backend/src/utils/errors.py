@@ -40,6 +40,15 @@ class RateLimitError(UnderfootError):
         )
 
 
+class OverloadedError(UnderfootError):
+    """Server is at capacity and shedding load."""
+
+    def __init__(self, retry_after: int, **context: Any):
+        super().__init__(
+            "Server is at capacity", 503, "SERVICE_OVERLOADED", retry_after=retry_after, **context
+        )
+
+
 class UpstreamError(UnderfootError):
     """External API failed."""
 
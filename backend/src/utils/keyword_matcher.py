@@ -0,0 +1,56 @@
+"""Single-pass multi-keyword matching."""
+
+import re
+from collections.abc import Iterable
+
+
+class KeywordMatcher:
+    """Find which of a fixed set of keywords occur in a text, in one scan.
+
+    Keywords match at the start of a word and may run into a longer word
+    ("local" matches "locals"), the same way a plain substring test behaves
+    at word starts. A keyword that is a prefix of a longer matched keyword
+    (e.g. "local" inside "locals only") is credited too, since the regex
+    can only report one match per position.
+    """
+
+    def __init__(self, keywords: Iterable[str]) -> None:
+        self.keywords = tuple(dict.fromkeys(k.strip().lower() for k in keywords if k.strip()))
+        ordered = sorted(self.keywords, key=len, reverse=True)
+        self._pattern = (
+            re.compile(r"\b(?:" + "|".join(re.escape(k) for k in ordered) + ")")
+            if ordered
+            else None
+        )
+        self._implied = {
+            keyword: frozenset(k for k in self.keywords if keyword.startswith(k))
+            for keyword in self.keywords
+        }
+
+    def matches(self, text: str) -> set[str]:
+        """Get the keywords present in a text.
+
+        Args:
+            text: Lowercased text to scan
+
+        Returns:
+            Set of matched keywords
+        """
+        if self._pattern is None:
+            return set()
+
+        found: set[str] = set()
+        for match in self._pattern.finditer(text):
+            found |= self._implied[match.group()]
+        return found
+
+    def count(self, text: str) -> int:
+        """Count distinct keywords present in a text.
+
+        Args:
+            text: Lowercased text to scan
+
+        Returns:
+            Number of distinct keywords matched
+        """
+        return len(self.matches(text))
@@ -1,32 +1,78 @@
 """Metrics collection for observability."""
 
+import asyncio
+import functools
 import time
-from collections import defaultdict
-from dataclasses import asdict, dataclass
-from typing import Any
+from bisect import bisect_left
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from typing import Any, TypeVar
 
+from src.config.constants import METRICS_LATENCY_BUCKETS_MS, METRICS_MAX_SERIES
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+METRICS_NAMESPACE = "underfoot"
+STAGE_DURATION = "stage_duration_ms"
 
-@dataclass
-class Metric:
-    """Performance metric."""
+F = TypeVar("F", bound=Callable[..., Any])
 
-    name: str
-    value: float
-    unit: str
-    tags: dict[str, str]
-    timestamp: float
+SeriesKey = tuple[str, tuple[tuple[str, str], ...]]
+
+
+class Histogram:
+    """Fixed-bucket histogram with constant memory.
+
+    Observations only bump integers, so it is safe to update from the event
+    loop without a lock.
+    """
+
+    def __init__(self, buckets: tuple[float, ...] = METRICS_LATENCY_BUCKETS_MS) -> None:
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        """Record one observation.
+
+        Args:
+            value: Observed value
+        """
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def cumulative(self) -> list[tuple[str, int]]:
+        """Get cumulative bucket counts keyed by upper bound.
+
+        Returns:
+            List of (le, count) pairs ending with +Inf
+        """
+        running = 0
+        result = []
+        for bound, count in zip((*self.buckets, "+Inf"), self.counts, strict=True):
+            running += count
+            result.append((_format_value(bound), running))
+        return result
 
 
 class MetricsCollector:
-    """Collect and emit metrics for observability."""
+    """Collect bounded counters and latency histograms for observability."""
+
+    def __init__(self, max_series: int = METRICS_MAX_SERIES) -> None:
+        self.max_series = max_series
+        self.histograms: dict[SeriesKey, Histogram] = {}
+        self.counters: dict[SeriesKey, int] = {}
+        self.dropped_series = 0
 
-    def __init__(self) -> None:
-        self.metrics: list[Metric] = []
-        self.counters: dict[str, int] = defaultdict(int)
+    def _admit(self, series: dict[SeriesKey, Any], key: SeriesKey) -> bool:
+        """Check whether a series may be recorded without exceeding the cap."""
+        if key in series or len(self.histograms) + len(self.counters) < self.max_series:
+            return True
+        self.dropped_series += 1
+        return False
 
     def timing(self, name: str, value: float, **tags: str) -> None:
         """Record timing metric in milliseconds.
@@ -36,9 +82,13 @@ class MetricsCollector:
             value: Duration in milliseconds
             **tags: Additional tags for the metric
         """
-        self.metrics.append(
-            Metric(name=name, value=value, unit="ms", tags=tags, timestamp=time.time())
-        )
+        key = _series_key(name, tags)
+        if not self._admit(self.histograms, key):
+            return
+        histogram = self.histograms.get(key)
+        if histogram is None:
+            histogram = self.histograms[key] = Histogram()
+        histogram.observe(value)
 
     def counter(self, name: str, value: int = 1, **tags: str) -> None:
         """Increment counter metric.
@@ -48,24 +98,135 @@ class MetricsCollector:
             value: Count to add (default 1)
             **tags: Additional tags for the metric
         """
-        key = f"{name}:{','.join(f'{k}={v}' for k, v in tags.items())}"
-        self.counters[key] += value
+        key = _series_key(name, tags)
+        if self._admit(self.counters, key):
+            self.counters[key] = self.counters.get(key, 0) + value
+
+    @contextmanager
+    def time(self, name: str, **tags: str) -> Iterator[None]:
+        """Time the enclosed block in milliseconds.
+
+        Args:
+            name: Metric name
+            **tags: Additional tags for the metric
+
+        Yields:
+            Control to the timed block
+        """
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.timing(name, (time.perf_counter() - started) * 1000, **tags)
+
+    def timed(self, name: str, **tags: str) -> Callable[[F], F]:
+        """Decorate a function or coroutine function to time each call.
+
+        Args:
+            name: Metric name
+            **tags: Additional tags for the metric
+
+        Returns:
+            Decorator
+        """
+
+        def decorator(func: F) -> F:
+            if asyncio.iscoroutinefunction(func):
+
+                @functools.wraps(func)
+                async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+                    with self.time(name, **tags):
+                        return await func(*args, **kwargs)
+
+                return async_wrapper  # type: ignore[return-value]
+
+            @functools.wraps(func)
+            def wrapper(*args: Any, **kwargs: Any) -> Any:
+                with self.time(name, **tags):
+                    return func(*args, **kwargs)
+
+            return wrapper  # type: ignore[return-value]
+
+        return decorator
+
+    def render(self) -> str:
+        """Render all series in the Prometheus text exposition format.
+
+        Returns:
+            Exposition text
+        """
+        lines: list[str] = []
+
+        for name, series in _group(self.counters).items():
+            lines.append(f"# TYPE {METRICS_NAMESPACE}_{name} counter")
+            for labels, value in series:
+                lines.append(f"{METRICS_NAMESPACE}_{name}{_format_labels(labels)} {value}")
+
+        for name, series in _group(self.histograms).items():
+            full_name = f"{METRICS_NAMESPACE}_{name}"
+            lines.append(f"# TYPE {full_name} histogram")
+            for labels, histogram in series:
+                for le, count in histogram.cumulative():
+                    bucket_labels = _format_labels((*labels, ("le", le)))
+                    lines.append(f"{full_name}_bucket{bucket_labels} {count}")
+                lines.append(
+                    f"{full_name}_sum{_format_labels(labels)} {_format_value(histogram.sum)}"
+                )
+                lines.append(f"{full_name}_count{_format_labels(labels)} {histogram.count}")
+
+        lines.append(f"# TYPE {METRICS_NAMESPACE}_metrics_dropped_series_total counter")
+        lines.append(f"{METRICS_NAMESPACE}_metrics_dropped_series_total {self.dropped_series}")
+        return "\n".join(lines) + "\n"
 
     def flush(self) -> None:
-        """Emit all metrics and clear buffer."""
-        for metric in self.metrics:
+        """Emit a summary of every series to the log.
+
+        Series are cumulative and bounded, so nothing is cleared.
+        """
+        for (name, labels), histogram in self.histograms.items():
             logger.info(
                 "metric.timing",
-                metric_name=metric.name,
-                value=metric.value,
-                unit=metric.unit,
-                **metric.tags,
+                metric_name=name,
+                count=histogram.count,
+                sum_ms=round(histogram.sum, 3),
+                **dict(labels),
             )
 
-        for key, count in self.counters.items():
-            name, tags_str = key.split(":", 1) if ":" in key else (key, "")
-            tags = dict(tag.split("=") for tag in tags_str.split(",") if "=" in tag)
-            logger.info("metric.counter", metric_name=name, count=count, **tags)
+        for (name, labels), count in self.counters.items():
+            logger.info("metric.counter", metric_name=name, count=count, **dict(labels))
 
-        self.metrics.clear()
+    def reset(self) -> None:
+        """Drop every series."""
+        self.histograms.clear()
         self.counters.clear()
+        self.dropped_series = 0
+
+
+def _series_key(name: str, tags: dict[str, str]) -> SeriesKey:
+    return name, tuple(sorted((k, str(v)) for k, v in tags.items()))
+
+
+def _group(series: dict[SeriesKey, Any]) -> dict[str, list[tuple[tuple, Any]]]:
+    grouped: dict[str, list[tuple[tuple, Any]]] = {}
+    for (name, labels), value in sorted(series.items(), key=lambda item: item[0]):
+        grouped.setdefault(name, []).append((labels, value))
+    return grouped
+
+
+def _format_labels(labels: tuple[tuple[str, str], ...]) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{k}="{_escape_label(v)}"' for k, v in labels) + "}"
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_value(value: float | str) -> str:
+    if isinstance(value, str):
+        return value
+    return repr(float(value)) if value != int(value) else str(int(value))
+
+
+metrics = MetricsCollector()
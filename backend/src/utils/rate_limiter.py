@@ -0,0 +1,88 @@
+"""Per-client token-bucket rate limiting."""
+
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+
+from src.config.constants import TRUSTED_PROXY_HOPS
+
+
+@dataclass
+class TokenBucket:
+    """Token balance for one client."""
+
+    tokens: float
+    updated_at: float
+
+
+class TokenBucketLimiter:
+    """Token-bucket limiter keyed by client.
+
+    Each client may burst up to ``burst`` requests, refilled at
+    ``rate_per_minute``. Buckets are kept in LRU order and capped at
+    ``max_clients``; evicting an idle client only forgets tokens it would
+    have had anyway once refilled. Not thread-safe: intended to be used from
+    a single event loop.
+    """
+
+    def __init__(self, rate_per_minute: float, burst: int, max_clients: int) -> None:
+        self.rate_per_second = rate_per_minute / 60
+        self.burst = burst
+        self.max_clients = max_clients
+        self._buckets: OrderedDict[str, TokenBucket] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._buckets)
+
+    def acquire(self, client_id: str) -> float:
+        """Take one token for a client.
+
+        Args:
+            client_id: Client identity (e.g. remote address)
+
+        Returns:
+            0.0 if the request is allowed, otherwise seconds until a token is available
+        """
+        now = time.monotonic()
+        bucket = self._buckets.get(client_id)
+
+        if bucket is None:
+            bucket = TokenBucket(tokens=self.burst, updated_at=now)
+            self._buckets[client_id] = bucket
+            if len(self._buckets) > self.max_clients:
+                self._buckets.popitem(last=False)
+        else:
+            elapsed = now - bucket.updated_at
+            bucket.tokens = min(self.burst, bucket.tokens + elapsed * self.rate_per_second)
+            bucket.updated_at = now
+            self._buckets.move_to_end(client_id)
+
+        if bucket.tokens >= 1:
+            bucket.tokens -= 1
+            return 0.0
+
+        return (1 - bucket.tokens) / self.rate_per_second
+
+
+def client_address(
+    forwarded_for: str | None, peer: str | None, trusted_hops: int = TRUSTED_PROXY_HOPS
+) -> str:
+    """Resolve the client address a request should be rate limited by.
+
+    Each trusted proxy appends the address it received the request from to
+    X-Forwarded-For, so the client is the entry ``trusted_hops`` from the
+    right. Entries further left were supplied by the client and are ignored.
+
+    Args:
+        forwarded_for: X-Forwarded-For header value, if any
+        peer: Address of the directly connected peer, if known
+        trusted_hops: Number of trusted proxies in front of the app
+
+    Returns:
+        Client address, or "unknown" if none is available
+    """
+    if forwarded_for and trusted_hops > 0:
+        hops = [hop.strip() for hop in forwarded_for.split(",")]
+        if len(hops) >= trusted_hops and hops[-trusted_hops]:
+            return hops[-trusted_hops]
+    return peer or "unknown"
@@ -0,0 +1,104 @@
+"""Template Stonewalker responses.
+
+These are used both for result sets the response policy answers without
+the LLM and as the fallback when the LLM call fails.
+"""
+
+import zlib
+from typing import Any
+
+OPENINGS = {
+    "none": (
+        "The paths around {location} remain elusive for {intent}.",
+        "{location} keeps its {intent} well hidden for now.",
+    ),
+    "one": (
+        "{location} yields a single discovery for {intent}: {first}.",
+        "One place answers the call for {intent} in {location}: {first}.",
+    ),
+    "few": (
+        "{location} reveals {count} spots for {intent}: {first} and {second}.",
+        "For {intent}, {location} offers {first} and {second}.",
+    ),
+    "many": (
+        "{location} reveals {count} spots for {intent}, led by {first}, {second} and {third}.",
+        "For {intent}, {location} holds {count} discoveries—{first}, {second} and {third} among them.",
+    ),
+}
+
+SOURCE_LINES = {
+    "reddit": "Locals speak of these in quiet threads; their word outweighs any guidebook.",
+    "eventbrite": "These are gatherings with a date attached—check the hour before you set out.",
+    "serp": "The wider web points the way, but confirm the hours before you go.",
+    "mixed": "Several voices agree on these, which is rarely an accident.",
+}
+
+QUERY_TYPE_ADVICE = {
+    "nightlife": "Arrive after the early crowd thins and ask the bartender what else is near.",
+    "historical": "Go in daylight and let the old stones tell their story at their own pace.",
+    "underground": "Watch for the entrances that are easy to miss—they are the point.",
+    "mystical": "Walk in with an open mind; some places reveal more to the patient.",
+    "general": "Venture forth with curiosity—each promises something beyond the tourist trail.",
+}
+
+EMPTY_ADVICE = {
+    "nightlife": "Try a neighboring district, or ask at the last bar still open.",
+    "general": "Perhaps broaden your search or try a nearby town—sometimes the best discoveries lie in unexpected directions.",
+}
+
+
+def place_sources(places: list[dict[str, Any]]) -> set[str]:
+    """Collect the distinct data sources behind a set of places.
+
+    Args:
+        places: Place dicts
+
+    Returns:
+        Source names, "unknown" for places that do not record one
+    """
+    sources: set[str] = set()
+    for place in places:
+        sources.update(place.get("sources") or [place.get("source", "unknown")])
+    return sources
+
+
+def render_template(
+    intent: str, location: str, places: list[dict[str, Any]], query_type: str = "general"
+) -> str:
+    """Render a deterministic Stonewalker response.
+
+    The template is keyed on result count, source mix and query type; the
+    variant is picked by a stable hash of the query so the same search
+    always reads the same.
+
+    Args:
+        intent: User's search intent
+        location: Normalized location
+        places: Ranked places for the response
+        query_type: Query type from IntentParser
+
+    Returns:
+        Response text
+    """
+    count = len(places)
+    bucket = "none" if count == 0 else "one" if count == 1 else "few" if count < 4 else "many"
+    variants = OPENINGS[bucket]
+    variant = variants[zlib.crc32(f"{intent}|{location}".encode()) % len(variants)]
+
+    names = [place.get("name") or "an unnamed place" for place in places[:3]]
+    opening = variant.format(
+        location=location,
+        intent=intent,
+        count=count,
+        **dict(zip(("first", "second", "third"), names, strict=False)),
+    )
+
+    if count == 0:
+        advice = EMPTY_ADVICE.get(query_type, EMPTY_ADVICE["general"])
+        return f"{opening} {advice}"
+
+    sources = place_sources(places)
+    source_mix = next(iter(sources)) if len(sources) == 1 else "mixed"
+    source_line = SOURCE_LINES.get(source_mix, SOURCE_LINES["mixed"])
+    advice = QUERY_TYPE_ADVICE.get(query_type, QUERY_TYPE_ADVICE["general"])
+    return f"{opening} {source_line} {advice}"
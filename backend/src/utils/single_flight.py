@@ -0,0 +1,50 @@
+"""Request coalescing for identical concurrent work."""
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+
+class SingleFlight:
+    """Collapse concurrent calls with the same key into one shared computation.
+
+    The first caller for a key starts the work; callers that arrive while it
+    is in flight await the same result (or exception). The shared task is
+    shielded, so one caller going away does not cancel it for the others.
+    """
+
+    def __init__(self) -> None:
+        self._inflight: dict[str, asyncio.Task[Any]] = {}
+
+    def __len__(self) -> int:
+        return len(self._inflight)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._inflight
+
+    async def do(self, key: str, func: Callable[[], Awaitable[Any]]) -> tuple[Any, bool]:
+        """Run func once per key among concurrent callers.
+
+        Args:
+            key: Coalescing key
+            func: Zero-argument coroutine factory producing the result
+
+        Returns:
+            Tuple of (result, shared) where shared is True for callers that
+            joined an in-flight computation instead of starting it
+        """
+        task = self._inflight.get(key)
+        if task is not None:
+            return await asyncio.shield(task), True
+
+        task = asyncio.ensure_future(func())
+        self._inflight[key] = task
+        task.add_done_callback(lambda done: self._forget(key, done))
+
+        return await asyncio.shield(task), False
+
+    def _forget(self, key: str, task: asyncio.Task[Any]) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled():
+            task.exception()
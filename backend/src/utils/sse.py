@@ -0,0 +1,43 @@
+"""Server-Sent Events helpers."""
+
+import json
+from typing import Any
+
+
+def format_sse(event: str, data: Any) -> str:
+    """Format a single Server-Sent Event.
+
+    Args:
+        event: Event name
+        data: JSON-serializable payload
+
+    Returns:
+        Wire-format event terminated by a blank line
+    """
+    return f"event: {event}\ndata: {json.dumps(data, default=str)}\n\n"
+
+
+class ConnectionLimiter:
+    """Cap on concurrently open streaming connections.
+
+    Not thread-safe: intended to be used from a single event loop.
+    """
+
+    def __init__(self, limit: int) -> None:
+        self.limit = limit
+        self.active = 0
+
+    def try_acquire(self) -> bool:
+        """Claim a connection slot.
+
+        Returns:
+            True if a slot was claimed, False if at capacity
+        """
+        if self.active >= self.limit:
+            return False
+        self.active += 1
+        return True
+
+    def release(self) -> None:
+        """Return a connection slot."""
+        self.active = max(0, self.active - 1)
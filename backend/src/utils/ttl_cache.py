@@ -0,0 +1,140 @@
+"""Bounded in-process LRU cache with per-entry TTL."""
+
+import json
+import time
+from collections import OrderedDict
+from dataclasses import asdict, dataclass, is_dataclass
+from typing import Any
+
+
+@dataclass
+class CacheEntry:
+    """Single cached value with expiry bookkeeping."""
+
+    value: Any
+    expires_at: float
+    size: int
+
+
+def estimate_size(value: Any) -> int:
+    """Estimate the in-memory footprint of a JSON-like value.
+
+    Args:
+        value: Value to measure
+
+    Returns:
+        Approximate size in bytes
+    """
+    if isinstance(value, bytes | str):
+        return len(value)
+    if is_dataclass(value) and not isinstance(value, type):
+        value = asdict(value)
+    return len(json.dumps(value, default=str, separators=(",", ":")))
+
+
+class TTLCache:
+    """LRU cache capped by entry count and total bytes, with TTL expiry.
+
+    Not thread-safe: intended to be used from a single event loop. Returned
+    values are shared, so callers must treat them as read-only.
+    """
+
+    def __init__(self, max_entries: int, max_bytes: int, ttl_seconds: float) -> None:
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[str, CacheEntry] = OrderedDict()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> Any | None:
+        """Get a live value and mark it recently used.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached value or None if missing or expired
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        if entry.expires_at <= time.monotonic():
+            self._remove(key)
+            self.expirations += 1
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry.value
+
+    def set(self, key: str, value: Any, ttl_seconds: float | None = None) -> bool:
+        """Store a value, evicting least-recently-used entries to stay in bounds.
+
+        Args:
+            key: Cache key
+            value: Value to cache
+            ttl_seconds: Override for the default TTL
+
+        Returns:
+            True if stored, False if the value alone exceeds the byte cap
+        """
+        size = estimate_size(value)
+        if size > self.max_bytes:
+            return False
+
+        if key in self._entries:
+            self._remove(key)
+
+        ttl = self.ttl_seconds if ttl_seconds is None else ttl_seconds
+        self._entries[key] = CacheEntry(value=value, expires_at=time.monotonic() + ttl, size=size)
+        self._bytes += size
+
+        while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+            self._remove(next(iter(self._entries)))
+            self.evictions += 1
+
+        return True
+
+    def delete(self, key: str) -> None:
+        """Remove a key if present.
+
+        Args:
+            key: Cache key
+        """
+        if key in self._entries:
+            self._remove(key)
+
+    def clear(self) -> None:
+        """Drop all entries and reset counters."""
+        self._entries.clear()
+        self._bytes = 0
+        self.hits = self.misses = self.evictions = self.expirations = 0
+
+    def stats(self) -> dict[str, int]:
+        """Get hit/miss/eviction counters and current usage.
+
+        Returns:
+            Stats dict
+        """
+        return {
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+        }
+
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key)
+        self._bytes -= entry.size
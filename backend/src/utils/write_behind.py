@@ -0,0 +1,171 @@
+"""Write-behind batching for best-effort persistence."""
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from contextlib import suppress
+from typing import Any
+
+from src.utils.logger import get_logger
+from src.utils.metrics import STAGE_DURATION, metrics
+
+logger = get_logger(__name__)
+
+
+class WriteBehindQueue:
+    """Bounded queue that coalesces writes by key and flushes them in batches.
+
+    Rows are grouped by table; a later write for a key that is still pending
+    replaces the earlier one. A background task flushes every
+    ``interval_seconds``, or as soon as a table has ``batch_size`` rows
+    waiting, and exits once the queue is empty. When the queue is full new
+    keys are dropped: the rows are cache entries, so a lost write only costs
+    a future miss.
+    """
+
+    def __init__(
+        self,
+        flush_batch: Callable[[str, list[dict[str, Any]]], Awaitable[bool]],
+        max_pending: int,
+        batch_size: int,
+        interval_seconds: float,
+    ) -> None:
+        self._flush_batch = flush_batch
+        self.max_pending = max_pending
+        self.batch_size = batch_size
+        self.interval_seconds = interval_seconds
+        self._pending: dict[str, dict[str, dict[str, Any]]] = {}
+        self._size = 0
+        self._task: asyncio.Task | None = None
+        self._wakeup = asyncio.Event()
+        self.coalesced = 0
+        self.dropped = 0
+        self.written = 0
+        self.failed = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def pending(self, table: str) -> dict[str, dict[str, Any]]:
+        """Get the rows waiting to be written to a table.
+
+        Args:
+            table: Table name
+
+        Returns:
+            Copy of the pending rows keyed by their conflict key
+        """
+        return dict(self._pending.get(table, {}))
+
+    def enqueue(self, table: str, key: str, row: dict[str, Any]) -> bool:
+        """Queue a row for the next flush.
+
+        Must be called from a running event loop.
+
+        Args:
+            table: Table name
+            key: Conflict key of the row
+            row: Row to upsert
+
+        Returns:
+            True if queued, False if dropped because the queue is full
+        """
+        rows = self._pending.setdefault(table, {})
+        if key in rows:
+            self.coalesced += 1
+        elif self._size >= self.max_pending:
+            self.dropped += 1
+            metrics.counter("cache_write_dropped_total", table=table)
+            logger.warning("write_behind.dropped", table=table, pending=self._size)
+            return False
+        else:
+            self._size += 1
+
+        rows[key] = row
+        self._ensure_flusher()
+        if len(rows) >= self.batch_size:
+            self._wakeup.set()
+        return True
+
+    def _ensure_flusher(self) -> None:
+        """Start the flusher task on the current loop if it is not running."""
+        loop = asyncio.get_running_loop()
+        if self._task is None or self._task.done() or self._task.get_loop() is not loop:
+            self._wakeup = asyncio.Event()
+            self._task = loop.create_task(self._run())
+
+    async def _run(self) -> None:
+        """Flush periodically until the queue is empty."""
+        while self._size:
+            with suppress(TimeoutError):
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.interval_seconds)
+            self._wakeup.clear()
+            await self.flush()
+
+    async def flush(self) -> int:
+        """Write every pending row now, one call per batch.
+
+        Failed batches are logged and discarded.
+
+        Returns:
+            Number of rows written
+        """
+        pending, self._pending, self._size = self._pending, {}, 0
+        written = 0
+
+        for table, rows in pending.items():
+            values = list(rows.values())
+            for start in range(0, len(values), self.batch_size):
+                batch = values[start : start + self.batch_size]
+                with metrics.time(STAGE_DURATION, stage="cache_flush", table=table):
+                    try:
+                        success = await self._flush_batch(table, batch)
+                    except Exception as e:
+                        logger.error("write_behind.flush_error", table=table, error=str(e))
+                        success = False
+
+                metrics.counter(
+                    "cache_write_batches_total",
+                    table=table,
+                    status="success" if success else "error",
+                )
+                if success:
+                    written += len(batch)
+                else:
+                    self.failed += len(batch)
+
+        if written:
+            self.written += written
+            logger.info("write_behind.flushed", rows=written)
+        return written
+
+    async def shutdown(self) -> None:
+        """Stop the flusher and write everything still pending."""
+        task, self._task = self._task, None
+        if task is not None and not task.done() and task.get_loop() is asyncio.get_running_loop():
+            self._wakeup.set()
+            await task
+
+        written = await self.flush()
+        logger.info("write_behind.stopped", flushed=written)
+
+    def clear(self) -> None:
+        """Drop every pending row and stop the flusher."""
+        task, self._task = self._task, None
+        if task is not None and not task.done() and not task.get_loop().is_closed():
+            task.cancel()
+        self._pending.clear()
+        self._size = 0
+
+    def stats(self) -> dict[str, int]:
+        """Get queue counters.
+
+        Returns:
+            Pending, coalesced, dropped, written and failed row counts
+        """
+        return {
+            "pending": self._size,
+            "coalesced": self.coalesced,
+            "dropped": self.dropped,
+            "written": self.written,
+            "failed": self.failed,
+        }
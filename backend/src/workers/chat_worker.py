@@ -1,30 +1,70 @@
 """Chat worker - lightweight FastAPI endpoint."""
 
+import math
 import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from datetime import UTC, datetime
 
-from fastapi import FastAPI, HTTPException, Request
-from fastapi.responses import JSONResponse
+from fastapi import Depends, FastAPI, HTTPException, Request
+from fastapi.responses import JSONResponse, PlainTextResponse, StreamingResponse
 from pydantic import ValidationError
 
-from src.middleware.cors_middleware import add_cors_middleware
-from src.middleware.security_middleware import SecurityHeadersMiddleware
-from src.middleware.tracing_middleware import RequestTracingMiddleware, request_id_var
+from src.config.constants import (
+    DEFERRED_RESPONSE_MAX_WAIT_SECONDS,
+    OVERLOAD_RETRY_AFTER_SECONDS,
+    RATE_LIMIT_BURST,
+    RATE_LIMIT_MAX_CLIENTS,
+    RATE_LIMIT_PER_MINUTE,
+    SSE_MAX_CONNECTIONS,
+)
+from src.middleware.request_middleware import RequestMiddleware
+from src.middleware.tracing_middleware import request_id_var
 from src.models.request_models import SearchRequest
 from src.models.response_models import HealthResponse
 from src.services import cache_service, search_service
-from src.utils.errors import UnderfootError
+from src.services.http_client_service import http_clients
+from src.services.supabase_service import async_supabase
+from src.utils.errors import RateLimitError, UnderfootError
 from src.utils.input_sanitizer import InputSanitizer, IntentParser
 from src.utils.logger import get_logger, setup_logging
+from src.utils.metrics import STAGE_DURATION, metrics
+from src.utils.rate_limiter import TokenBucketLimiter, client_address
+from src.utils.sse import ConnectionLimiter, format_sse
 
 setup_logging()
 logger = get_logger(__name__)
 
-app = FastAPI(title="Underfoot Chat Worker", version="0.1.0")
+sse_connections = ConnectionLimiter(SSE_MAX_CONNECTIONS)
+rate_limiter = TokenBucketLimiter(
+    rate_per_minute=RATE_LIMIT_PER_MINUTE,
+    burst=RATE_LIMIT_BURST,
+    max_clients=RATE_LIMIT_MAX_CLIENTS,
+)
 
-app.add_middleware(SecurityHeadersMiddleware)
-app.add_middleware(RequestTracingMiddleware)
-add_cors_middleware(app)
+
+@asynccontextmanager
+async def lifespan(_app: FastAPI) -> AsyncIterator[None]:
+    """Manage app-scoped resources.
+
+    Args:
+        _app: FastAPI application instance
+
+    Yields:
+        Control to the running application
+    """
+    await http_clients.startup()
+    try:
+        yield
+    finally:
+        await http_clients.shutdown()
+        await cache_service.cache_writes.shutdown()
+        await async_supabase.close()
+
+
+app = FastAPI(title="Underfoot Chat Worker", version="0.1.0", lifespan=lifespan)
+
+app.add_middleware(RequestMiddleware)
 
 
 @app.exception_handler(UnderfootError)
@@ -48,6 +88,8 @@ async def underfoot_error_handler(request: Request, exc: UnderfootError):
         **exc.context,
     )
 
+    retry_after = exc.context.get("retry_after")
+
     return JSONResponse(
         status_code=exc.status_code,
         content={
@@ -55,6 +97,7 @@ async def underfoot_error_handler(request: Request, exc: UnderfootError):
             "request_id": request_id_var.get(),
             "timestamp": datetime.now(UTC).isoformat(),
         },
+        headers={"Retry-After": str(retry_after)} if retry_after is not None else None,
     )
 
 
@@ -115,8 +158,15 @@ async def global_error_handler(request: Request, exc: Exception):
 
 
 @app.get("/health", response_model=HealthResponse)
-async def health():
-    """Comprehensive health check endpoint.
+async def health(deep: bool = False):
+    """Health check endpoint.
+
+    By default this is a liveness probe and does not touch any dependency.
+    With ``deep=true`` it also reports Supabase connectivity and cache row
+    counts (cached for CACHE_STATS_TTL_SECONDS).
+
+    Args:
+        deep: Also check dependencies
 
     Returns:
         Health status and dependency information
@@ -125,11 +175,16 @@ async def health():
 
     dependencies = {}
 
-    try:
-        stats = await cache_service.get_cache_stats()
-        dependencies["supabase"] = {"status": "healthy" if stats["connected"] else "degraded"}
-    except Exception as e:
-        dependencies["supabase"] = {"status": "degraded", "error": str(e)}
+    if deep:
+        try:
+            stats = await cache_service.get_cache_stats()
+            dependencies["supabase"] = {
+                "status": "healthy" if stats["connected"] else "degraded",
+                "search_results_count": stats.get("search_results_count", 0),
+                "location_cache_count": stats.get("location_cache_count", 0),
+            }
+        except Exception as e:
+            dependencies["supabase"] = {"status": "degraded", "error": str(e)}
 
     elapsed_ms = int((time.perf_counter() - start) * 1000)
 
@@ -143,18 +198,54 @@ async def health():
     return health_data
 
 
-@app.post("/underfoot/search")
+@app.get("/metrics")
+async def metrics_endpoint():
+    """Expose counters and stage latency histograms for scraping.
+
+    Returns:
+        Prometheus text exposition
+    """
+    return PlainTextResponse(
+        metrics.render(), media_type="text/plain; version=0.0.4; charset=utf-8"
+    )
+
+
+def enforce_rate_limit(http_request: Request) -> None:
+    """Reject clients that have used up their token bucket.
+
+    Args:
+        http_request: Incoming request
+
+    Raises:
+        RateLimitError: If the client has no tokens left
+    """
+    peer = http_request.client.host if http_request.client else None
+    client_id = client_address(http_request.headers.get("x-forwarded-for"), peer)
+    wait_seconds = rate_limiter.acquire(client_id)
+    if wait_seconds:
+        metrics.counter("requests_shed_total", reason="rate_limit")
+        raise RateLimitError(retry_after=math.ceil(wait_seconds), client=client_id)
+
+
+@app.post("/underfoot/search", dependencies=[Depends(enforce_rate_limit)])
 async def search(request: SearchRequest):
     """Execute search with AI orchestration.
 
+    Searches that would start a pipeline beyond SEARCH_MAX_IN_FLIGHT are
+    shed with a 503 (see search_service.execute_search).
+
     Args:
         request: Search request with chat input
 
     Returns:
         Search results with AI-generated response
+
+    Raises:
+        OverloadedError: If too many search pipelines are already running
     """
     try:
-        sanitized_input = InputSanitizer.sanitize(request.chat_input)
+        with metrics.time(STAGE_DURATION, stage="sanitize"):
+            sanitized_input = InputSanitizer.sanitize(request.chat_input)
 
         intent = IntentParser.parse_intent(sanitized_input)
         logger.info("search.intent_parsed", **intent)
@@ -166,16 +257,106 @@ async def search(request: SearchRequest):
             force=request.force,
             intent=intent,
             vector_query=vector_query,
+            defer_response=request.defer_response,
         )
         return result
 
     except UnderfootError:
         raise
     except ValueError as e:
-        raise HTTPException(status_code=400, detail=str(e))
+        raise HTTPException(status_code=400, detail=str(e)) from e
     except Exception as e:
         logger.error("search.error", error=str(e), exc_info=True)
-        raise HTTPException(status_code=500, detail="Search failed")
+        raise HTTPException(status_code=500, detail="Search failed") from e
+
+
+@app.get("/underfoot/search/{request_id}/response")
+async def search_response(request_id: str, wait: float = 0):
+    """Fetch the Stonewalker response of a search made with defer_response.
+
+    Args:
+        request_id: The search's response_id
+        wait: Seconds to wait for a pending response (long poll)
+
+    Returns:
+        Response status and text
+
+    Raises:
+        UnderfootError: If the request ID is unknown or expired
+    """
+    wait_seconds = min(max(wait, 0.0), DEFERRED_RESPONSE_MAX_WAIT_SECONDS)
+    result = await search_service.get_deferred_response(request_id, wait_seconds)
+    if result is None:
+        raise UnderfootError(
+            "Unknown or expired response ID", 404, "RESPONSE_NOT_FOUND", request_id=request_id
+        )
+    return result
+
+
+@app.post("/underfoot/search/stream", dependencies=[Depends(enforce_rate_limit)])
+async def search_stream(request: SearchRequest):
+    """Execute search, streaming each pipeline stage as Server-Sent Events.
+
+    Args:
+        request: Search request with chat input
+
+    Returns:
+        text/event-stream response
+
+    Raises:
+        UnderfootError: If the streaming connection cap is reached
+    """
+    try:
+        with metrics.time(STAGE_DURATION, stage="sanitize"):
+            sanitized_input = InputSanitizer.sanitize(request.chat_input)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+
+    intent = IntentParser.parse_intent(sanitized_input)
+
+    if sse_connections.active >= sse_connections.limit:
+        raise UnderfootError(
+            "Too many open streams",
+            503,
+            "STREAM_CAPACITY_EXCEEDED",
+            limit=sse_connections.limit,
+            retry_after=OVERLOAD_RETRY_AFTER_SECONDS,
+        )
+
+    return StreamingResponse(
+        _stream_events(sanitized_input, request.force, intent),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+async def _stream_events(chat_input: str, force: bool, intent: dict) -> AsyncIterator[str]:
+    """Format search stream events for the wire, holding a connection slot.
+
+    Args:
+        chat_input: Sanitized user input
+        force: Force cache bypass
+        intent: Locally parsed intent
+
+    Yields:
+        Server-Sent Event strings
+    """
+    if not sse_connections.try_acquire():
+        yield format_sse("error", {"error": "STREAM_CAPACITY_EXCEEDED"})
+        return
+
+    try:
+        async for event, data in search_service.stream_search(
+            chat_input, force=force, intent=intent
+        ):
+            yield format_sse(event, data)
+    except ValueError as e:
+        yield format_sse("error", {"error": "VALIDATION_ERROR", "message": str(e)})
+    except Exception as e:
+        logger.error("search.stream_error", error=str(e), exc_info=True)
+        yield format_sse("error", {"error": "INTERNAL_ERROR", "message": "Search failed"})
+    finally:
+        sse_connections.release()
 
 
 @app.get("/")
@@ -191,6 +372,9 @@ async def root():
         "status": "operational",
         "endpoints": {
             "health": "/health",
+            "metrics": "/metrics",
             "search": "/underfoot/search (POST)",
+            "search_stream": "/underfoot/search/stream (POST, text/event-stream)",
+            "search_response": "/underfoot/search/{response_id}/response (GET)",
         },
     }
@@ -22,3 +22,13 @@ def mock_env_vars(monkeypatch):
     }
     for key, value in test_env.items():
         monkeypatch.setenv(key, value)
+
+
+@pytest.fixture(autouse=True)
+def cache_writes():
+    """Keep queued Supabase writes from leaking between tests."""
+    from src.services.cache_service import cache_writes
+
+    cache_writes.clear()
+    yield cache_writes
+    cache_writes.clear()
@@ -0,0 +1 @@
+"""Middleware tests package."""
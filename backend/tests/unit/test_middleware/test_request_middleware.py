@@ -0,0 +1,85 @@
+"""Unit tests for the fused request middleware."""
+
+from fastapi import FastAPI
+from fastapi.responses import StreamingResponse
+from fastapi.testclient import TestClient
+
+from src.middleware.request_middleware import RequestMiddleware
+from src.middleware.tracing_middleware import request_id_var
+
+
+def _client() -> TestClient:
+    app = FastAPI()
+    app.add_middleware(RequestMiddleware)
+
+    @app.get("/ping")
+    async def ping():
+        return {"request_id": request_id_var.get()}
+
+    @app.get("/stream")
+    async def stream():
+        async def chunks():
+            for i in range(3):
+                yield f"data: {i}\n\n"
+
+        return StreamingResponse(chunks(), media_type="text/event-stream")
+
+    return TestClient(app)
+
+
+def test_adds_security_and_tracing_headers():
+    """Test that responses carry security headers and the request ID."""
+    response = _client().get("/ping", headers={"X-Request-ID": "uf_given"})
+
+    assert response.headers["X-Request-ID"] == "uf_given"
+    assert response.json()["request_id"] == "uf_given"
+    assert response.headers["X-Content-Type-Options"] == "nosniff"
+    assert response.headers["X-Frame-Options"] == "DENY"
+    assert "X-Response-Time" in response.headers
+
+
+def test_generates_request_id_when_missing():
+    """Test that a request ID is generated when the client sends none."""
+    response = _client().get("/ping")
+
+    assert response.headers["X-Request-ID"].startswith("uf_")
+    assert response.json()["request_id"] == response.headers["X-Request-ID"]
+
+
+def test_simple_cors_headers_only_with_origin():
+    """Test CORS headers are added for cross-origin requests only."""
+    client = _client()
+
+    plain = client.get("/ping")
+    cross = client.get("/ping", headers={"Origin": "https://example.com"})
+
+    assert "access-control-allow-origin" not in plain.headers
+    assert cross.headers["access-control-allow-origin"] == "*"
+    assert cross.headers["access-control-allow-credentials"] == "true"
+    assert "X-Request-ID" in cross.headers["access-control-expose-headers"]
+
+
+def test_preflight_is_answered_without_calling_the_app():
+    """Test that CORS preflights short-circuit with the allowed methods and headers."""
+    response = _client().options(
+        "/ping",
+        headers={
+            "Origin": "https://example.com",
+            "Access-Control-Request-Method": "POST",
+            "Access-Control-Request-Headers": "content-type",
+        },
+    )
+
+    assert response.status_code == 200
+    assert response.headers["access-control-allow-origin"] == "https://example.com"
+    assert "POST" in response.headers["access-control-allow-methods"]
+    assert response.headers["access-control-allow-headers"] == "content-type"
+    assert response.headers["X-Frame-Options"] == "DENY"
+
+
+def test_streaming_body_passes_through():
+    """Test that streamed chunks are delivered intact with headers added."""
+    response = _client().get("/stream")
+
+    assert response.text == "data: 0\n\ndata: 1\n\ndata: 2\n\n"
+    assert response.headers["X-Request-ID"].startswith("uf_")
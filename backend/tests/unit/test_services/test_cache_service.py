@@ -0,0 +1,214 @@
+"""Unit tests for cache service."""
+
+import time
+from datetime import UTC, datetime, timedelta
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from src.config.constants import LOCATION_NEGATIVE_CACHE_TTL_MINUTES
+from src.services import cache_service
+from src.utils import ttl_cache
+
+
+@pytest.fixture(autouse=True)
+def clear_memory_cache():
+    """Reset the in-process tier between tests."""
+    cache_service.search_results_l1.clear()
+    yield
+    cache_service.search_results_l1.clear()
+
+
+@pytest.mark.asyncio
+async def test_memory_tier_serves_repeat_lookups():
+    """Test read-through: second lookup is answered without Supabase."""
+    cached = {"places": [], "response": "cached"}
+
+    with patch.object(
+        cache_service.async_supabase, "get_search_results", new_callable=AsyncMock
+    ) as mock_get:
+        mock_get.return_value = {"results_json": cached, "created_at": None}
+
+        first = await cache_service.get_cached_search_results("hidden gems in Austin")
+        second = await cache_service.get_cached_search_results("hidden gems in Austin")
+
+    assert first.results == cached
+    assert second is first
+    assert not first.is_stale
+    mock_get.assert_called_once()
+    assert cache_service.search_results_l1.stats()["hits"] == 1
+
+
+@pytest.mark.asyncio
+async def test_write_through_populates_memory_tier(cache_writes):
+    """Test that stores land in memory and are queued for Supabase."""
+    results = {"places": [{"name": "Cave"}]}
+
+    with patch.object(
+        cache_service.async_supabase, "get_search_results", new_callable=AsyncMock
+    ) as mock_get:
+        assert await cache_service.set_cached_search_results("q", "intent", "loc", results)
+        assert (await cache_service.get_cached_search_results("q")).results == results
+
+    assert len(cache_writes.pending("search_results")) == 1
+    mock_get.assert_not_called()
+
+
+def test_cache_key_ignores_case_punctuation_and_spacing():
+    """Test that trivially different queries share a key."""
+    assert cache_service.generate_cache_key("Hidden gems in Austin, TX?") == (
+        cache_service.generate_cache_key("  hidden GEMS in austin ,tx ")
+    )
+    assert cache_service.generate_cache_key("hidden gems") != cache_service.generate_cache_key(
+        intent="hidden gems"
+    )
+
+
+@pytest.mark.asyncio
+async def test_store_records_normalized_intent_and_location(cache_writes):
+    """Test that rows are stored with the columns used by the secondary lookup."""
+    await cache_service.set_cached_search_results(
+        "Dive bars in Austin!", "Dive Bars", "Austin, TX, USA", {"places": []}
+    )
+
+    (row,) = cache_writes.pending("search_results").values()
+    assert row["query_hash"] == cache_service.generate_cache_key("dive bars in austin")
+    assert row["intent"] == "dive bars"
+    assert row["location"] == "austin, tx, usa"
+
+
+@pytest.mark.asyncio
+async def test_queued_writes_are_flushed_in_one_batch(cache_writes):
+    """Test that repeated stores coalesce and reach Supabase as one upsert."""
+    with patch.object(
+        cache_service.async_supabase, "upsert_rows", new_callable=AsyncMock, return_value=True
+    ) as mock_upsert:
+        for query in ("hidden gems in Austin", "Hidden gems in Austin!", "caves near Austin"):
+            await cache_service.set_cached_search_results(query, "gems", "Austin", {})
+        await cache_writes.flush()
+
+    mock_upsert.assert_awaited_once()
+    table, rows = mock_upsert.await_args.args
+    assert table == "search_results"
+    assert len(rows) == 2
+
+
+@pytest.mark.asyncio
+async def test_paraphrased_query_hits_by_intent():
+    """Test that a different query with the same parse finds the stored entry."""
+    results = {"places": [{"name": "Cave"}]}
+
+    with patch.object(
+        cache_service.async_supabase, "get_search_results_by_intent", new_callable=AsyncMock
+    ) as mock_by_intent:
+        await cache_service.set_cached_search_results(
+            "hidden gems in Austin", "hidden gems", "Austin, TX, USA", results
+        )
+        hit = await cache_service.get_cached_search_results_by_intent(
+            "secret spots around Austin", "Hidden Gems", "austin, tx, usa"
+        )
+
+    assert hit.results == results
+    mock_by_intent.assert_not_called()
+    alias = await cache_service.get_cached_search_results("secret spots around Austin")
+    assert alias is hit
+
+
+@pytest.mark.asyncio
+async def test_old_supabase_row_is_returned_as_stale():
+    """Test that rows past the soft TTL are still served but flagged stale."""
+    with patch.object(
+        cache_service.async_supabase, "get_search_results", new_callable=AsyncMock
+    ) as mock_get:
+        mock_get.return_value = {
+            "results_json": {"places": []},
+            "created_at": "2020-01-01T00:00:00+00:00",
+        }
+
+        entry = await cache_service.get_cached_search_results("hidden gems in Austin")
+
+    assert entry.is_stale
+    assert entry.results == {"places": []}
+
+
+@pytest.mark.asyncio
+async def test_supabase_stats_are_cached_briefly():
+    """Test that repeated stats calls reuse one set of count queries."""
+    cache_service.supabase_stats.clear()
+
+    with patch.object(
+        cache_service.async_supabase,
+        "get_stats",
+        new_callable=AsyncMock,
+        return_value={"connected": True, "search_results_count": 3},
+    ) as mock_stats:
+        first = await cache_service.get_cache_stats()
+        second = await cache_service.get_cache_stats()
+
+    cache_service.supabase_stats.clear()
+    mock_stats.assert_awaited_once()
+    assert first["search_results_count"] == second["search_results_count"] == 3
+    assert "memory" in second
+
+
+def test_parse_key_changes_with_prompt_version():
+    """Test that bumping the parse prompt version invalidates memoized parses."""
+    before = cache_service.generate_parse_key("hidden gems in Austin")
+
+    with patch.object(cache_service, "OPENAI_PARSE_PROMPT_VERSION", 2):
+        after = cache_service.generate_parse_key("hidden gems in Austin")
+
+    assert before != after
+    assert before == cache_service.generate_parse_key("Hidden gems in  Austin!")
+
+
+@pytest.mark.asyncio
+async def test_queued_row_round_trips_through_compact_payload(cache_writes):
+    """Test that a stored row decodes to the response without debug data."""
+    results = {
+        "response": "The stones remember.",
+        "places": [
+            {"name": "Cave", "source": "serp", "url": None, "score": 0.9},
+        ],
+        "debug": {"request_id": "search_abc"},
+    }
+
+    await cache_service.set_cached_search_results("caves", "caves", "Austin", results)
+    (row,) = cache_writes.pending("search_results").values()
+
+    assert row["payload_version"] == cache_service.CACHE_PAYLOAD_VERSION
+    entry = cache_service._entry_from_row({**row, "created_at": None})
+    assert entry.results == {"response": "The stones remember.", "places": results["places"]}
+
+
+@pytest.mark.asyncio
+async def test_location_row_keeps_its_expiry_in_memory():
+    """Test that a short-lived negative row read from Supabase is not held for a day."""
+    expires_at = datetime.now(UTC) + timedelta(minutes=LOCATION_NEGATIVE_CACHE_TTL_MINUTES)
+    row = {
+        "normalized_location": "Atlantis",
+        "confidence": 0.5,
+        "raw_candidates": [],
+        "expires_at": expires_at.isoformat(),
+    }
+    cache_service.location_l1.clear()
+
+    with patch.object(
+        cache_service.async_supabase, "get_location", new_callable=AsyncMock, return_value=row
+    ):
+        cached = await cache_service.get_cached_location("Atlantis")
+
+    assert cached["normalized"] == "Atlantis"
+    later = time.monotonic() + LOCATION_NEGATIVE_CACHE_TTL_MINUTES * 60 + 1
+    with patch.object(ttl_cache.time, "monotonic", return_value=later):
+        assert cache_service.location_l1.get("atlantis") is None
+
+
+@pytest.mark.asyncio
+async def test_location_row_resets_created_at_on_every_write(cache_writes):
+    """Test that a re-geocoded location stays within its table's TTL CHECK."""
+    await cache_service.set_cached_location("Austin", "Austin, TX, USA", 0.9, ttl_seconds=3600)
+    (row,) = cache_writes.pending("location_cache").values()
+
+    created_at = datetime.fromisoformat(row["created_at"])
+    assert datetime.fromisoformat(row["expires_at"]) - created_at == timedelta(seconds=3600)
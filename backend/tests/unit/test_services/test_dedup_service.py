@@ -0,0 +1,89 @@
+"""Unit tests for cross-source deduplication."""
+
+import pytest
+
+from src.models.domain_models import SearchResult
+from src.services import dedup_service
+
+
+@pytest.mark.parametrize(
+    ("url", "expected"),
+    [
+        (
+            "HTTP://www.Example.com/bars/?utm_source=x&b=2&a=1&fbclid=abc#top",
+            "https://example.com/bars?a=1&b=2",
+        ),
+        (
+            "https://old.reddit.com/r/Austin/comments/1/x/",
+            "https://reddit.com/r/Austin/comments/1/x",
+        ),
+        ("https://example.com", "https://example.com/"),
+        ("mailto:someone@example.com", None),
+        (None, None),
+    ],
+)
+def test_canonicalize_url(url, expected):
+    """Test tracking params, host aliases and cosmetic differences are removed."""
+    assert dedup_service.canonicalize_url(url) == expected
+
+
+def test_results_with_same_canonical_url_are_merged():
+    """Test that tracking-parameter variants collapse into one result."""
+    results = [
+        SearchResult(
+            name="The Cellar",
+            description="Short",
+            source="serp",
+            url="https://cellar.bar/?utm_source=g",
+        ),
+        SearchResult(
+            name="Cellar Bar ATX",
+            description="A longer description",
+            source="serp",
+            url="https://www.cellar.bar/",
+        ),
+    ]
+
+    deduped = dedup_service.deduplicate(results)
+
+    assert len(deduped) == 1
+    assert deduped[0].description == "A longer description"
+    assert [p["url"] for p in deduped[0].metadata["provenance"]] == [
+        "https://cellar.bar/?utm_source=g",
+        "https://www.cellar.bar/",
+    ]
+
+
+def test_near_duplicate_titles_across_sources_are_merged():
+    """Test that near-identical titles from different sources merge with provenance."""
+    results = [
+        SearchResult(
+            name="The Hidden Door Speakeasy", description="", source="serp", url="https://a.example"
+        ),
+        SearchResult(
+            name="Hidden Door Speakeasy!",
+            description="Locals love it",
+            source="reddit",
+            url="https://reddit.com/r/x/1",
+        ),
+        SearchResult(
+            name="Cathedral of Junk", description="", source="serp", url="https://b.example"
+        ),
+    ]
+
+    deduped = dedup_service.deduplicate(results)
+
+    assert [r.name for r in deduped] == ["Hidden Door Speakeasy!", "Cathedral of Junk"]
+    assert {p["source"] for p in deduped[0].metadata["provenance"]} == {"serp", "reddit"}
+
+
+def test_distinct_and_placeholder_titles_are_kept():
+    """Test that different places and untitled results are not merged."""
+    results = [
+        SearchResult(name="Unknown", description="", source="reddit", url=None),
+        SearchResult(name="Unknown", description="", source="serp", url=None),
+        SearchResult(name="Hidden Door Speakeasy", description="", source="serp"),
+        SearchResult(name="Hidden Garden Cafe", description="", source="serp"),
+    ]
+
+    assert len(dedup_service.deduplicate(results)) == 4
@@ -0,0 +1,99 @@
+"""Unit tests for geocoding service."""
+
+from datetime import UTC, datetime, timedelta
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import pytest
+
+from src.config.constants import LOCATION_NEGATIVE_CACHE_TTL_MINUTES
+from src.services import cache_service, geocoding_service
+
+
+def make_client(payload: dict, status_code: int = 200) -> tuple[httpx.AsyncClient, list]:
+    """Build a client backed by a canned Geocoding API response."""
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(status_code, json=payload)
+
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler)), requests
+
+
+OK_PAYLOAD = {
+    "status": "OK",
+    "results": [
+        {
+            "formatted_address": "Asheville, NC, USA",
+            "geometry": {"location": {"lat": 35.59, "lng": -82.55}, "location_type": "APPROXIMATE"},
+        }
+    ],
+}
+
+
+@pytest.fixture(autouse=True)
+def isolated_location_cache():
+    """Keep Supabase out of the loop and reset the memory tier."""
+    cache_service.location_l1.clear()
+    with patch.object(
+        cache_service.async_supabase, "get_location", AsyncMock(return_value=None)
+    ):
+        yield
+    cache_service.location_l1.clear()
+
+
+@pytest.mark.asyncio
+async def test_second_lookup_is_served_from_cache():
+    """Test that a geocoded location is not requested twice."""
+    client, requests = make_client(OK_PAYLOAD)
+
+    first = await geocoding_service.normalize_location("Asheville NC", client)
+    second = await geocoding_service.normalize_location("asheville nc", client)
+
+    assert first.normalized == "Asheville, NC, USA"
+    assert second == first
+    assert len(requests) == 1
+
+
+@pytest.mark.asyncio
+async def test_zero_results_are_negatively_cached(cache_writes):
+    """Test that junk locations are cached with the shorter TTL."""
+    client, requests = make_client({"status": "ZERO_RESULTS", "results": []})
+
+    await geocoding_service.normalize_location("qwxz", client)
+    result = await geocoding_service.normalize_location("qwxz", client)
+
+    assert result.coordinates is None
+    assert len(requests) == 1
+    (row,) = cache_writes.pending("location_cache").values()
+    expires_in = datetime.fromisoformat(row["expires_at"]) - datetime.now(UTC)
+    assert expires_in <= timedelta(minutes=LOCATION_NEGATIVE_CACHE_TTL_MINUTES)
+
+
+@pytest.mark.asyncio
+async def test_transient_failures_are_not_cached(cache_writes):
+    """Test that HTTP errors fall back without poisoning the cache."""
+    client, requests = make_client({}, status_code=503)
+
+    await geocoding_service.normalize_location("Asheville NC", client)
+    await geocoding_service.normalize_location("Asheville NC", client)
+
+    assert len(requests) == 2
+    assert not cache_writes.pending("location_cache")
+
+
+@pytest.mark.asyncio
+async def test_supabase_row_is_used_before_api():
+    """Test that a persisted location_cache row avoids the API call."""
+    client, requests = make_client(OK_PAYLOAD)
+    cache_service.async_supabase.get_location.return_value = {
+        "normalized_location": "Asheville, NC, USA",
+        "confidence": 0.7,
+        "raw_candidates": [{"lat": 35.59, "lng": -82.55}],
+    }
+
+    result = await geocoding_service.normalize_location("Asheville NC", client)
+
+    assert result.coordinates == {"lat": 35.59, "lng": -82.55}
+    assert requests == []
@@ -0,0 +1,56 @@
+"""Unit tests for the shared HTTP client registry."""
+
+import pytest
+
+from src.config.constants import (
+    HTTP_CONNECT_TIMEOUT_SECONDS,
+    HTTP_POOL_LIMITS,
+    HTTP_TIMEOUT_SECONDS,
+)
+from src.services.http_client_service import HttpClientRegistry, request_timeout
+
+
+def test_get_reuses_client_per_upstream():
+    """Test that the same pooled client is returned for an upstream."""
+    registry = HttpClientRegistry()
+
+    first = registry.get("serpapi")
+    second = registry.get("serpapi")
+
+    assert first is second
+    assert registry.get("reddit") is not first
+
+
+@pytest.mark.asyncio
+async def test_startup_opens_all_configured_upstreams():
+    """Test that startup creates a client for every configured upstream."""
+    registry = HttpClientRegistry()
+
+    await registry.startup()
+    clients = [registry.get(name) for name in HTTP_POOL_LIMITS]
+    await registry.shutdown()
+
+    assert all(client.is_closed for client in clients)
+
+
+@pytest.mark.asyncio
+async def test_get_recreates_closed_client():
+    """Test that a closed client is replaced on next access."""
+    registry = HttpClientRegistry()
+
+    client = registry.get("geocoding")
+    await registry.shutdown()
+
+    replacement = registry.get("geocoding")
+
+    assert client.is_closed
+    assert replacement is not client
+    await registry.shutdown()
+
+
+def test_request_timeout_caps_connect_at_budget():
+    """Test per-request timeouts follow the remaining budget, or the default."""
+    assert request_timeout(0.5).connect == 0.5
+    assert request_timeout(0.5).read == 0.5
+    assert request_timeout(None).read == HTTP_TIMEOUT_SECONDS
+    assert request_timeout(None).connect == HTTP_CONNECT_TIMEOUT_SECONDS
@@ -3,8 +3,18 @@
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 
-from src.services import openai_service
-from src.models.domain_models import ParsedInput
+from src.services import cache_service, openai_service
+
+
+@pytest.fixture(autouse=True)
+def parse_memo(cache_writes):
+    """Keep the parse memo in memory and empty between tests."""
+    cache_service.parse_l1.clear()
+    with patch.object(
+        cache_service.async_supabase, "get_parse", new_callable=AsyncMock, return_value=None
+    ):
+        yield cache_writes
+    cache_service.parse_l1.clear()
 
 
 @pytest.mark.asyncio
@@ -86,3 +96,120 @@ async def test_generate_response_fallback():
 
         assert "Pikeville" in result
         assert "hidden gems" in result
+
+
+@pytest.mark.asyncio
+async def test_stream_response_yields_chunks():
+    """Test streaming response generation with OpenAI."""
+
+    async def chunks():
+        for text in ("The paths ", None, "of Pikeville."):
+            yield MagicMock(choices=[MagicMock(delta=MagicMock(content=text))])
+
+    with patch.object(openai_service.client.chat.completions, 'create', new_callable=AsyncMock) as mock_create:
+        mock_create.return_value = chunks()
+
+        result = [
+            chunk
+            async for chunk in openai_service.stream_response(
+                "hidden gems", "Pikeville, KY", [], {"total_results": 0}
+            )
+        ]
+
+        assert result == ["The paths ", "of Pikeville."]
+        assert mock_create.call_args.kwargs["stream"] is True
+
+
+@pytest.mark.asyncio
+async def test_stream_response_fallback():
+    """Test streaming falls back to the template response when OpenAI fails."""
+    with patch.object(openai_service.client.chat.completions, 'create', new_callable=AsyncMock) as mock_create:
+        mock_create.side_effect = Exception("API error")
+
+        result = [
+            chunk
+            async for chunk in openai_service.stream_response(
+                "hidden gems", "Pikeville, KY", [], {"total_results": 0}
+            )
+        ]
+
+        assert len(result) == 1
+        assert "Pikeville" in result[0]
+
+
+@pytest.mark.asyncio
+async def test_route_parse_skips_llm_for_confident_input():
+    """Test that unambiguous input is parsed locally."""
+    with patch.object(openai_service.client.chat.completions, 'create', new_callable=AsyncMock) as mock_create:
+        before = openai_service.parse_route_counts["heuristic"]
+
+        result = await openai_service.route_parse("hidden gems in Pikeville KY")
+
+        assert result.location == "Pikeville KY"
+        assert result.intent == "hidden gems"
+        assert result.method == "heuristic"
+        assert openai_service.parse_route_counts["heuristic"] == before + 1
+        mock_create.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_route_parse_uses_llm_for_ambiguous_input():
+    """Test that inputs the heuristics disagree on go to OpenAI."""
+    mock_response = MagicMock()
+    mock_response.choices = [
+        MagicMock(message=MagicMock(content='{"location": "Austin, TX", "intent": "weird bars"}'))
+    ]
+
+    with patch.object(openai_service.client.chat.completions, 'create', new_callable=AsyncMock) as mock_create:
+        mock_create.return_value = mock_response
+
+        result = await openai_service.route_parse("weird bars in Austin this weekend")
+
+        assert result.location == "Austin, TX"
+        assert result.method == "llm"
+        mock_create.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_route_parse_uses_llm_when_keyword_is_only_a_modifier():
+    """Test that a keyword does not replace the rest of the request."""
+    with patch.object(openai_service.client.chat.completions, 'create', new_callable=AsyncMock) as mock_create:
+        mock_create.side_effect = Exception("API error")
+
+        result = await openai_service.route_parse("quirky coffee shops in Portland")
+
+        assert result.intent == "quirky coffee shops"
+        assert result.location == "Portland"
+        mock_create.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_parse_user_input_is_memoized(parse_memo):
+    """Test that repeat and trivially different inputs reuse the stored parse."""
+    mock_response = MagicMock()
+    mock_response.choices = [
+        MagicMock(message=MagicMock(content='{"location": "Austin, TX", "intent": "weird bars"}'))
+    ]
+
+    with patch.object(openai_service.client.chat.completions, 'create', new_callable=AsyncMock) as mock_create:
+        mock_create.return_value = mock_response
+
+        first = await openai_service.parse_user_input("Weird bars in Austin")
+        second = await openai_service.parse_user_input("  weird bars in austin! ")
+
+        assert second == first
+        mock_create.assert_called_once()
+        assert len(parse_memo.pending("parse_cache")) == 1
+
+
+@pytest.mark.asyncio
+async def test_parse_user_input_does_not_memoize_fallback(parse_memo):
+    """Test that heuristic fallbacks are not stored, so the LLM is retried."""
+    with patch.object(openai_service.client.chat.completions, 'create', new_callable=AsyncMock) as mock_create:
+        mock_create.side_effect = Exception("API error")
+
+        await openai_service.parse_user_input("hidden gems in Pikeville KY")
+        await openai_service.parse_user_input("hidden gems in Pikeville KY")
+
+        assert mock_create.call_count == 2
+        assert not parse_memo.pending("parse_cache")
@@ -0,0 +1,52 @@
+"""Unit tests for the response policy."""
+
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from src.services import response_service
+
+
+def _places(*sources):
+    return [
+        {"name": f"Place {i}", "description": "", "source": source, "sources": [source]}
+        for i, source in enumerate(sources)
+    ]
+
+
+def test_small_or_single_source_sets_use_template():
+    """Test that low-information result sets are answered from templates."""
+    assert response_service.choose_policy([]) == "template"
+    assert response_service.choose_policy(_places("reddit", "serp")) == "template"
+    assert response_service.choose_policy(_places("serp", "serp", "serp", "serp")) == "template"
+
+
+def test_rich_sets_use_llm():
+    """Test that several places from several sources go to the LLM."""
+    assert response_service.choose_policy(_places("reddit", "serp", "serp")) == "llm"
+
+
+@pytest.mark.asyncio
+async def test_template_policy_skips_openai():
+    """Test that the template policy never calls the model."""
+    with patch("src.services.openai_service.generate_response", new_callable=AsyncMock) as generate:
+        text = await response_service.generate_response(
+            "hidden gems", "Pikeville, KY", _places("serp"), {}
+        )
+
+    generate.assert_not_awaited()
+    assert "Place 0" in text
+
+
+@pytest.mark.asyncio
+async def test_stream_template_is_one_chunk():
+    """Test that streamed template responses arrive as a single chunk."""
+    chunks = [
+        chunk
+        async for chunk in response_service.stream_response(
+            "hidden gems", "Pikeville, KY", _places("serp"), {}
+        )
+    ]
+
+    assert len(chunks) == 1
+    assert "Pikeville, KY" in chunks[0]
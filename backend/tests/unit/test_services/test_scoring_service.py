@@ -4,6 +4,7 @@ import pytest
 
 from src.models.domain_models import SearchResult
 from src.services import scoring_service
+from src.utils.keyword_matcher import KeywordMatcher
 
 
 def test_score_result_with_intent_match():
@@ -102,3 +103,70 @@ def test_generate_scoring_summary_empty():
     assert summary.average_score == 0.0
     assert summary.max_score == 0.0
     assert summary.min_score == 0.0
+
+
+def test_score_result_uses_given_keyword_matcher():
+    """Test that scoring honours a configured keyword list."""
+    result = SearchResult(name="Speakeasy", description="Cash only", source="eventbrite")
+
+    default = scoring_service.score_result(result, "bars").score
+    custom = scoring_service.score_result(
+        result, "bars", KeywordMatcher(["speakeasy", "cash only"])
+    ).score
+
+    assert custom == pytest.approx(default + 0.2)
+
+
+def _candidates():
+    return [
+        SearchResult(name="Tourist Trap", description="Popular attraction", source="serp"),
+        SearchResult(
+            name="Hidden Underground Spot",
+            description="Secret local hidden gem",
+            source="reddit",
+            metadata={"score": 250},
+        ),
+        SearchResult(
+            name="Indie Venue",
+            description="Alternative space",
+            source="eventbrite",
+            metadata={"id": "1"},
+        ),
+        SearchResult(name="Dive Bar", description="hidden gems downtown", source="serp"),
+        SearchResult(name="Another Trap", description="Popular attraction", source="serp"),
+    ]
+
+
+def test_rank_results_matches_per_result_scoring():
+    """Test the batch ranker agrees with scoring results one at a time."""
+    context = {"intent": "hidden gems", "location": "Portland"}
+    scored = [scoring_service.score_result(r, context["intent"]) for r in _candidates()]
+    expected = [(r.name, r.score) for r in sorted(scored, key=lambda r: r.score, reverse=True)]
+
+    ranked, categorized, summary = scoring_service.rank_results(_candidates(), context)
+
+    assert [(r.name, r.score) for r in ranked] == expected
+    assert all(r.category == "primary" for r in categorized.primary)
+    assert all(r.score < 0.5 for r in categorized.nearby)
+    assert summary.total_results == 5
+    assert summary.max_score == expected[0][1]
+    assert summary.min_score == expected[-1][1]
+
+
+def test_rank_results_keeps_top_k_with_stable_ties():
+    """Test that top_k keeps the best results, ties in original order."""
+    ranked, _, summary = scoring_service.rank_results(
+        _candidates(), {"intent": "nothing"}, top_k=3
+    )
+
+    assert [r.name for r in ranked] == ["Hidden Underground Spot", "Dive Bar", "Indie Venue"]
+    assert summary.total_results == 3
+
+
+def test_rank_results_handles_no_results():
+    """Test ranking an empty batch."""
+    ranked, categorized, summary = scoring_service.rank_results([], {"intent": "x"})
+
+    assert ranked == []
+    assert categorized.primary == categorized.nearby == []
+    assert summary.total_results == 0
@@ -0,0 +1,346 @@
+"""Unit tests for search orchestration."""
+
+import asyncio
+import gc
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.models.domain_models import CachedSearch, NormalizedLocation, ParsedInput, SearchResult
+from src.services import search_service
+from src.utils.errors import OverloadedError
+
+# No intent keyword, so the parse router always sends it to the (mocked) LLM.
+QUERY = "cool places to drink in Austin TX"
+
+
+@pytest.fixture
+def pipeline():
+    """Patch every upstream the search pipeline touches."""
+    mocks = {
+        "get_cached_search_results": AsyncMock(return_value=None),
+        "set_cached_search_results": AsyncMock(return_value=True),
+        "parse_user_input": AsyncMock(
+            return_value=ParsedInput(location="Austin, TX", intent="dive bars", confidence=0.8)
+        ),
+        "generate_response": AsyncMock(return_value="The stones remember."),
+        "normalize_location": AsyncMock(
+            return_value=NormalizedLocation(normalized="Austin, TX, USA", confidence=0.9)
+        ),
+        # Route every response to the (mocked) LLM; the template policy is tested separately.
+        "choose_policy": MagicMock(return_value="llm"),
+    }
+    with (
+        patch.multiple(
+            "src.services.cache_service",
+            get_cached_search_results=mocks["get_cached_search_results"],
+            get_cached_search_results_by_intent=AsyncMock(return_value=None),
+            set_cached_search_results=mocks["set_cached_search_results"],
+        ),
+        patch.multiple(
+            "src.services.openai_service",
+            parse_user_input=mocks["parse_user_input"],
+            generate_response=mocks["generate_response"],
+        ),
+        patch("src.services.geocoding_service.normalize_location", mocks["normalize_location"]),
+        patch("src.services.response_service.choose_policy", mocks["choose_policy"]),
+        patch(
+            "src.services.serp_service.search_hidden_gems",
+            AsyncMock(
+                return_value=[SearchResult(name="Hidden Dive", description="", source="serp")]
+            ),
+        ),
+        patch("src.services.reddit_service.search_reddit_rss", AsyncMock(return_value=[])),
+        patch("src.services.eventbrite_service.search_local_events", AsyncMock(return_value=[])),
+    ):
+        yield mocks
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("pipeline")
+async def test_execute_search_runs_pipeline():
+    """Test a cold search returns places and a generated response."""
+    result = await search_service.execute_search(QUERY)
+
+    assert result["response"] == "The stones remember."
+    assert result["places"][0]["name"] == "Hidden Dive"
+    assert result["debug"]["source_stats"]["serpapi"]["status"] == "success"
+
+
+@pytest.mark.asyncio
+async def test_identical_concurrent_searches_are_coalesced(pipeline):
+    """Test that a burst of identical searches runs the pipeline once."""
+
+    async def slow_parse(_):
+        await asyncio.sleep(0.02)
+        return ParsedInput(location="Austin, TX", intent="dive bars", confidence=0.8)
+
+    pipeline["parse_user_input"].side_effect = slow_parse
+
+    results = await asyncio.gather(
+        *(search_service.execute_search(QUERY) for _ in range(3))
+    )
+
+    assert pipeline["parse_user_input"].await_count == 1
+    assert pipeline["generate_response"].await_count == 1
+    assert len({r["debug"]["request_id"] for r in results}) == 3
+    assert sum(1 for r in results if "coalesced_with" in r["debug"]) == 2
+
+
+@pytest.mark.asyncio
+async def test_simple_result_set_uses_template_response(pipeline):
+    """Test that a template policy answers without a second LLM call."""
+    pipeline["choose_policy"].return_value = "template"
+
+    result = await search_service.execute_search(QUERY)
+
+    assert pipeline["generate_response"].await_count == 0
+    assert "Hidden Dive" in result["response"]
+    assert "Austin, TX, USA" in result["response"]
+
+
+@pytest.mark.asyncio
+async def test_stale_entry_is_served_and_refreshed_in_background(pipeline):
+    """Test stale-while-revalidate: respond from cache, then refresh once."""
+    pipeline["get_cached_search_results"].return_value = CachedSearch(
+        results={"response": "old", "places": [], "debug": {}},
+        cached_at=time.time() - 3600,
+        soft_ttl_seconds=60,
+    )
+
+    first = await search_service.execute_search(QUERY)
+    second = await search_service.execute_search(QUERY)
+    await asyncio.gather(*search_service._background_tasks)
+
+    assert first["response"] == "old"
+    assert first["debug"]["cache"] == "stale"
+    assert first["debug"]["revalidating"] is True
+    assert second["debug"]["cache"] == "stale"
+    assert pipeline["parse_user_input"].await_count == 1
+    pipeline["set_cached_search_results"].assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_stale_intent_match_is_refreshed_in_background(pipeline):
+    """Test that a stale entry found by the pipeline leader is still revalidated."""
+    stale = CachedSearch(
+        results={"response": "old", "places": [], "debug": {}},
+        cached_at=time.time() - 3600,
+        soft_ttl_seconds=60,
+    )
+    by_intent = AsyncMock(return_value=stale)
+
+    with patch.object(
+        search_service.cache_service, "get_cached_search_results_by_intent", by_intent
+    ):
+        result = await search_service.execute_search(QUERY)
+        assert result["debug"]["cache"] == "stale"
+        assert result["debug"]["revalidating"] is True
+        assert len(search_service._background_tasks) == 1
+        await asyncio.gather(*search_service._background_tasks)
+
+    assert pipeline["parse_user_input"].await_count == 2
+    pipeline["set_cached_search_results"].assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_fresh_entry_is_served_without_refresh(pipeline):
+    """Test that fresh hits skip the pipeline entirely."""
+    pipeline["get_cached_search_results"].return_value = CachedSearch(
+        results={"response": "cached", "places": [], "debug": {}},
+        cached_at=time.time(),
+        soft_ttl_seconds=60,
+    )
+
+    result = await search_service.execute_search(QUERY)
+
+    assert result["debug"]["cache"] == "hit"
+    assert not search_service._background_tasks
+    pipeline["parse_user_input"].assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_stream_search_emits_each_stage(pipeline):
+    """Test that streaming yields stage events in pipeline order."""
+
+    async def fake_stream(*_):
+        for chunk in ("The stones ", "remember."):
+            yield chunk
+
+    with patch("src.services.openai_service.stream_response", fake_stream):
+        events = [event async for event in search_service.stream_search(QUERY)]
+
+    names = [name for name, _ in events]
+    assert names[:3] == ["start", "intent", "location"]
+    assert names.count("source") == 3
+    assert names[-4:] == ["places", "token", "token", "done"]
+    assert events[-1][1]["debug"]["cache_status"] == "miss"
+    cached = pipeline["set_cached_search_results"].call_args.args[3]
+    assert cached["response"] == "The stones remember."
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("pipeline")
+async def test_slow_source_times_out_and_partial_results_are_ranked():
+    """Test that a straggler is cancelled and marked timeout without blocking the search."""
+    cancelled = asyncio.Event()
+
+    async def hang(*_, **__):
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    with patch("src.services.reddit_service.search_reddit_rss", hang), patch.object(
+        search_service, "DATA_SOURCE_DEADLINE_SECONDS", 0.05
+    ):
+        started = time.perf_counter()
+        result = await search_service.execute_search(QUERY, force=True)
+        elapsed = time.perf_counter() - started
+        await asyncio.sleep(0)
+
+    stats = result["debug"]["source_stats"]
+    assert stats["reddit"]["status"] == "timeout"
+    assert stats["serpapi"]["status"] == "success"
+    assert result["places"][0]["name"] == "Hidden Dive"
+    assert cancelled.is_set()
+    assert elapsed < 1
+
+
+@pytest.mark.asyncio
+async def test_speculative_geocode_is_used_when_parse_agrees(pipeline):
+    """Test that the IntentParser location is geocoded once, alongside the parse."""
+
+    async def slow_parse(_):
+        await asyncio.sleep(0.01)
+        return ParsedInput(location="Austin, TX", intent="dive bars", confidence=0.8)
+
+    pipeline["parse_user_input"].side_effect = slow_parse
+
+    result = await search_service.execute_search(QUERY)
+
+    pipeline["normalize_location"].assert_awaited_once_with("Austin")
+    assert result["user_location"] == "Austin, TX, USA"
+
+
+@pytest.mark.asyncio
+async def test_speculative_geocode_is_discarded_when_parse_disagrees(pipeline):
+    """Test that a mismatched speculative geocode falls back to the parsed location."""
+
+    async def slow_parse(_):
+        await asyncio.sleep(0.01)
+        return ParsedInput(location="Round Rock, TX", intent="dive bars", confidence=0.8)
+
+    pipeline["parse_user_input"].side_effect = slow_parse
+
+    await search_service.execute_search(QUERY)
+
+    assert [c.args[0] for c in pipeline["normalize_location"].await_args_list] == [
+        "Austin",
+        "Round Rock, TX",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_deferred_search_returns_places_before_the_response(pipeline):
+    """Test that places come back first and the response is back-filled into the cache."""
+    release = asyncio.Event()
+
+    async def slow_response(*_):
+        await release.wait()
+        return "The stones remember."
+
+    pipeline["generate_response"].side_effect = slow_response
+
+    result = await search_service.execute_search(QUERY, defer_response=True)
+
+    assert result["places"][0]["name"] == "Hidden Dive"
+    assert result["response"] is None
+    assert result["response_status"] == "pending"
+    pipeline["set_cached_search_results"].assert_not_awaited()
+
+    pending = await search_service.get_deferred_response(result["response_id"])
+    assert pending["status"] == "pending"
+
+    release.set()
+    done = await search_service.get_deferred_response(result["response_id"], wait_seconds=1)
+
+    assert done == {
+        "request_id": result["response_id"],
+        "status": "complete",
+        "response": "The stones remember.",
+    }
+    cached = pipeline["set_cached_search_results"].await_args.args[3]
+    assert cached["response"] == "The stones remember."
+    assert "response_status" not in cached
+
+
+@pytest.mark.asyncio
+async def test_failed_deferred_response_is_retrieved_without_polling(pipeline):
+    """Test that a deferred response failure is consumed even if nobody polls for it."""
+    pipeline["generate_response"].side_effect = RuntimeError("model unavailable")
+    unhandled = []
+    loop = asyncio.get_running_loop()
+    loop.set_exception_handler(lambda _, context: unhandled.append(context))
+
+    try:
+        result = await search_service.execute_search(QUERY, defer_response=True)
+        await asyncio.wait({search_service.deferred_responses.get(result["response_id"])})
+        search_service.deferred_responses.clear()
+        gc.collect()
+    finally:
+        loop.set_exception_handler(None)
+
+    assert unhandled == []
+    assert await search_service.get_deferred_response(result["response_id"]) is None
+
+
+@pytest.mark.asyncio
+async def test_unknown_deferred_response_id_returns_none():
+    """Test that unknown or expired response IDs are reported as missing."""
+    assert await search_service.get_deferred_response("search_missing") is None
+
+
+@pytest.mark.asyncio
+async def test_only_pipeline_leaders_take_admission_slots(pipeline):
+    """Test that coalesced followers are not shed when the leader fills capacity."""
+
+    async def slow_parse(_):
+        await asyncio.sleep(0.02)
+        return ParsedInput(location="Austin, TX", intent="dive bars", confidence=0.8)
+
+    pipeline["parse_user_input"].side_effect = slow_parse
+
+    with patch.object(search_service.search_admission, "limit", 1):
+        results = await asyncio.gather(
+            *(search_service.execute_search(QUERY) for _ in range(3)),
+            search_service.execute_search("a different search entirely"),
+            return_exceptions=True,
+        )
+
+    assert [type(r) for r in results[:3]] == [dict, dict, dict]
+    assert isinstance(results[3], OverloadedError)
+    assert search_service.search_admission.active == 0
+
+
+@pytest.mark.asyncio
+async def test_stream_and_refresh_need_admission_slots(pipeline):
+    """Test that streamed pipelines and background refreshes respect the admission cap."""
+    pipeline["get_cached_search_results"].return_value = CachedSearch(
+        results={"response": "old", "places": [], "debug": {}},
+        cached_at=time.time() - 3600,
+        soft_ttl_seconds=60,
+    )
+
+    with patch.object(search_service.search_admission, "limit", 0):
+        stale = await search_service.execute_search(QUERY)
+        pipeline["get_cached_search_results"].return_value = None
+        events = [event async for event in search_service.stream_search(QUERY)]
+
+    assert stale["debug"]["revalidating"] is False
+    assert not search_service._background_tasks
+    assert [name for name, _ in events] == ["start", "error"]
+    assert events[-1][1]["error"] == "SERVICE_OVERLOADED"
+    pipeline["parse_user_input"].assert_not_awaited()
@@ -0,0 +1,91 @@
+"""Unit tests for the async Supabase facade."""
+
+import asyncio
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.services.supabase_service import AsyncSupabaseService, supabase
+
+
+class BlockingService:
+    """Stand-in for SupabaseService with slow synchronous calls."""
+
+    def __init__(self, delay: float = 0.05):
+        self.delay = delay
+        self.threads: set[str] = set()
+        self.stored: list[dict] = []
+
+    def get_search_results(self, query_hash):
+        self.threads.add(threading.current_thread().name)
+        time.sleep(self.delay)
+        return {"query_hash": query_hash}
+
+    def upsert_rows(self, table, rows):
+        self.stored.append({"table": table, "rows": rows})
+        return True
+
+    def get_stats(self):
+        return {"connected": True}
+
+
+@pytest.mark.asyncio
+async def test_calls_run_off_event_loop():
+    """Test that blocking calls run on worker threads concurrently."""
+    service = BlockingService(delay=0.1)
+    repo = AsyncSupabaseService(service, max_concurrency=4)
+
+    started = time.perf_counter()
+    results = await asyncio.gather(*(repo.get_search_results(f"h{i}") for i in range(4)))
+    elapsed = time.perf_counter() - started
+    await repo.close()
+
+    assert [r["query_hash"] for r in results] == ["h0", "h1", "h2", "h3"]
+    assert all(name.startswith("supabase") for name in service.threads)
+    assert elapsed < 0.3
+
+
+@pytest.mark.asyncio
+async def test_concurrency_is_bounded():
+    """Test that in-flight calls never exceed max_concurrency."""
+    service = BlockingService(delay=0.05)
+    repo = AsyncSupabaseService(service, max_concurrency=2)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(repo.get_search_results(f"h{i}") for i in range(4)))
+    elapsed = time.perf_counter() - started
+    await repo.close()
+
+    assert elapsed >= 0.1
+
+
+@pytest.mark.asyncio
+async def test_upsert_delegates_to_service():
+    """Test that batched writes delegate with the SupabaseService signature."""
+    service = BlockingService()
+    repo = AsyncSupabaseService(service)
+
+    stored = await repo.upsert_rows("search_results", [{"query_hash": "abc"}])
+    stats = await repo.get_stats()
+    await repo.close()
+
+    assert stored is True
+    assert service.stored == [{"table": "search_results", "rows": [{"query_hash": "abc"}]}]
+    assert stats["connected"] is True
+
+
+def test_stats_count_rows_server_side():
+    """Test that stats use HEAD count queries instead of fetching rows."""
+    client = MagicMock()
+    client.table.return_value.select.return_value.execute.return_value = MagicMock(
+        count=42, data=[]
+    )
+
+    with patch.object(supabase, "_client", client):
+        stats = supabase.get_stats()
+
+    client.table.return_value.select.assert_called_with("id", count="exact", head=True)
+    assert stats["search_results_count"] == 42
+    assert stats["location_cache_count"] == 42
@@ -0,0 +1,76 @@
+"""Unit tests for the compact cache payload format."""
+
+import json
+
+import pytest
+
+from src.utils import cache_payload
+
+RESULTS = {
+    "user_intent": "dive bars",
+    "user_location": "Austin, TX, USA",
+    "response": "The stones remember.",
+    "places": [
+        {
+            "name": f"Hidden Dive {i}",
+            "description": "A bar with no sign. " * 5,
+            "source": "reddit" if i % 2 else "serp",
+            "sources": ["reddit", "serp"],
+            "url": f"https://example.com/{i}",
+            "score": 0.5 + i / 100,
+            "category": "primary",
+        }
+        for i in range(10)
+    ],
+    "debug": {"request_id": "search_abc", "scoring_summary": {"total_results": 10}},
+}
+
+
+def _size(value) -> int:
+    return len(json.dumps(value, separators=(",", ":")))
+
+
+def test_round_trip_drops_debug_only():
+    """Test that expand(compact(x)) is x without its debug block."""
+    restored = cache_payload.expand(cache_payload.compact(RESULTS))
+
+    assert restored == cache_payload.strip(RESULTS)
+    assert "debug" not in restored
+
+
+def test_compact_payload_is_smaller():
+    """Test that positional places and interned sources shrink the payload."""
+    payload = cache_payload.compact(RESULTS)
+
+    assert payload["s"] == ["serp", "reddit"]
+    assert _size(payload) < _size(cache_payload.strip(RESULTS)) * 0.85
+
+
+def test_extra_place_fields_survive():
+    """Test that place keys outside PLACE_FIELDS are preserved."""
+    results = {"places": [{"name": "Cave", "source": "serp", "distance_km": 3}]}
+
+    restored = cache_payload.expand(cache_payload.compact(results))
+
+    assert restored["places"][0]["distance_km"] == 3
+    assert restored["places"][0]["source"] == "serp"
+
+
+def test_missing_place_fields_stay_missing():
+    """Test that only the fields a place had are restored."""
+    results = {"places": [{"name": "Cave", "score": None}, {"source": "reddit", "url": "u"}]}
+
+    restored = cache_payload.expand(cache_payload.compact(results))
+
+    assert restored["places"] == results["places"]
+
+
+def test_legacy_payload_is_returned_as_stored():
+    """Test that rows written before the compact format still decode."""
+    assert cache_payload.expand(RESULTS) == RESULTS
+
+
+def test_unknown_version_is_rejected():
+    """Test that a payload from a newer format is not misread."""
+    with pytest.raises(ValueError):
+        cache_payload.expand({"v": 99, "s": [], "p": [], "m": {}})
@@ -0,0 +1,35 @@
+"""Unit tests for multi-keyword matching."""
+
+from src.utils.keyword_matcher import KeywordMatcher
+
+
+def test_counts_distinct_keywords_in_one_pass():
+    """Test that each keyword counts once however often it appears."""
+    matcher = KeywordMatcher(["hidden", "dive", "secret"])
+
+    assert matcher.count("hidden dive bar, truly hidden and secret") == 3
+    assert matcher.count("a popular tourist spot") == 0
+
+
+def test_matches_at_word_start_including_longer_words():
+    """Test keywords match as word prefixes but not mid-word."""
+    matcher = KeywordMatcher(["local", "dive"])
+
+    assert matcher.matches("where locals go") == {"local"}
+    assert matcher.matches("skydive center") == set()
+
+
+def test_prefix_keywords_are_credited_with_longer_matches():
+    """Test that "local" is still counted when "locals only" matches."""
+    matcher = KeywordMatcher(["local", "locals only"])
+
+    assert matcher.matches("a locals only speakeasy") == {"local", "locals only"}
+
+
+def test_keywords_are_normalized():
+    """Test keywords are lowercased, trimmed, deduplicated and escaped."""
+    matcher = KeywordMatcher([" Dive ", "dive", "", "a+b"])
+
+    assert matcher.keywords == ("dive", "a+b")
+    assert matcher.count("a+b dive") == 2
+    assert KeywordMatcher([]).count("anything") == 0
@@ -0,0 +1,61 @@
+"""Unit tests for metrics collection."""
+
+import pytest
+
+from src.utils.metrics import Histogram, MetricsCollector
+
+
+def test_histogram_buckets_are_cumulative():
+    """Test that observations land in the first bucket whose bound covers them."""
+    histogram = Histogram(buckets=(10, 100))
+
+    for value in (5, 10, 50, 500):
+        histogram.observe(value)
+
+    assert histogram.cumulative() == [("10", 2), ("100", 3), ("+Inf", 4)]
+    assert histogram.count == 4
+    assert histogram.sum == 565
+
+
+def test_render_uses_text_exposition_format():
+    """Test counters and histograms render as Prometheus series."""
+    collector = MetricsCollector()
+
+    collector.counter("parse_route_total", route="llm")
+    collector.timing("stage_duration_ms", 12.5, stage="parse")
+
+    text = collector.render()
+
+    assert "# TYPE underfoot_parse_route_total counter" in text
+    assert 'underfoot_parse_route_total{route="llm"} 1' in text
+    assert "# TYPE underfoot_stage_duration_ms histogram" in text
+    assert 'underfoot_stage_duration_ms_bucket{stage="parse",le="25"} 1' in text
+    assert 'underfoot_stage_duration_ms_bucket{stage="parse",le="10"} 0' in text
+    assert 'underfoot_stage_duration_ms_count{stage="parse"} 1' in text
+
+
+def test_series_count_is_bounded():
+    """Test that new label combinations past the cap are dropped, not stored."""
+    collector = MetricsCollector(max_series=2)
+
+    for i in range(5):
+        collector.timing("stage_duration_ms", 1, stage=f"s{i}")
+    collector.timing("stage_duration_ms", 1, stage="s0")
+
+    assert len(collector.histograms) == 2
+    assert collector.dropped_series == 3
+    assert collector.histograms[("stage_duration_ms", (("stage", "s0"),))].count == 2
+
+
+@pytest.mark.asyncio
+async def test_timed_decorator_records_coroutine_calls():
+    """Test that decorated coroutines record one observation per call."""
+    collector = MetricsCollector()
+
+    @collector.timed("stage_duration_ms", stage="geocode")
+    async def geocode():
+        return "ok"
+
+    assert await geocode() == "ok"
+    assert await geocode() == "ok"
+    assert collector.histograms[("stage_duration_ms", (("stage", "geocode"),))].count == 2
@@ -0,0 +1,48 @@
+"""Unit tests for the token-bucket rate limiter."""
+
+from unittest.mock import patch
+
+from src.utils import rate_limiter
+from src.utils.rate_limiter import TokenBucketLimiter
+
+
+def test_burst_is_allowed_then_limited():
+    """Test that a client may burst, then must wait for a refill."""
+    limiter = TokenBucketLimiter(rate_per_minute=60, burst=3, max_clients=10)
+
+    assert [limiter.acquire("a") for _ in range(3)] == [0.0, 0.0, 0.0]
+
+    wait = limiter.acquire("a")
+    assert 0 < wait <= 1.0
+    assert limiter.acquire("b") == 0.0
+
+
+def test_tokens_refill_over_time():
+    """Test that tokens come back at the configured rate."""
+    limiter = TokenBucketLimiter(rate_per_minute=60, burst=1, max_clients=10)
+
+    with patch.object(rate_limiter.time, "monotonic", return_value=100.0):
+        assert limiter.acquire("a") == 0.0
+        assert limiter.acquire("a") > 0
+
+    with patch.object(rate_limiter.time, "monotonic", return_value=101.0):
+        assert limiter.acquire("a") == 0.0
+
+
+def test_client_table_is_bounded():
+    """Test that the least recently seen clients are evicted past the cap."""
+    limiter = TokenBucketLimiter(rate_per_minute=60, burst=1, max_clients=2)
+
+    for client in ("a", "b", "c"):
+        limiter.acquire(client)
+
+    assert len(limiter) == 2
+    assert limiter.acquire("a") == 0.0
+
+
+def test_client_address_uses_the_trusted_forwarded_hop():
+    """Test that spoofed X-Forwarded-For entries left of the proxy are ignored."""
+    assert rate_limiter.client_address("6.6.6.6, 1.2.3.4", "10.0.0.1") == "1.2.3.4"
+    assert rate_limiter.client_address("1.2.3.4", "10.0.0.1", trusted_hops=0) == "10.0.0.1"
+    assert rate_limiter.client_address(None, "10.0.0.1") == "10.0.0.1"
+    assert rate_limiter.client_address(None, None) == "unknown"
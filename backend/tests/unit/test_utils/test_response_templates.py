@@ -0,0 +1,39 @@
+"""Unit tests for template Stonewalker responses."""
+
+from src.utils import response_templates
+
+
+def _places(*sources):
+    return [
+        {"name": f"Place {i}", "description": "", "source": source, "sources": [source]}
+        for i, source in enumerate(sources)
+    ]
+
+
+def test_template_names_places_and_is_deterministic():
+    """Test that templates reference the found places and repeat exactly."""
+    places = _places("reddit", "reddit")
+
+    first = response_templates.render_template("dive bars", "Austin, TX", places, "nightlife")
+    second = response_templates.render_template("dive bars", "Austin, TX", places, "nightlife")
+
+    assert first == second
+    assert "Place 0" in first
+    assert "Austin, TX" in first
+    assert response_templates.SOURCE_LINES["reddit"] in first
+    assert response_templates.QUERY_TYPE_ADVICE["nightlife"] in first
+
+
+def test_empty_template_suggests_broadening():
+    """Test the template used when nothing was found."""
+    text = response_templates.render_template("catacombs", "Pikeville, KY", [], "underground")
+
+    assert "Pikeville, KY" in text
+    assert "broaden" in text
+
+
+def test_place_sources_counts_merged_and_unlabelled_places():
+    """Test that merged places contribute every source they came from."""
+    places = [{"sources": ["reddit", "serp"]}, {"source": "eventbrite"}, {}]
+
+    assert response_templates.place_sources(places) == {"reddit", "serp", "eventbrite", "unknown"}
@@ -0,0 +1,55 @@
+"""Unit tests for the in-process TTL cache."""
+
+import time
+
+from src.utils.ttl_cache import TTLCache
+
+
+def test_get_returns_stored_value_and_counts_hits():
+    """Test basic set/get with hit and miss counters."""
+    cache = TTLCache(max_entries=10, max_bytes=10_000, ttl_seconds=60)
+
+    cache.set("a", {"value": 1})
+
+    assert cache.get("a") == {"value": 1}
+    assert cache.get("missing") is None
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+
+
+def test_expired_entries_are_dropped():
+    """Test that entries past their TTL are treated as misses."""
+    cache = TTLCache(max_entries=10, max_bytes=10_000, ttl_seconds=60)
+
+    cache.set("a", "value", ttl_seconds=0.01)
+    time.sleep(0.02)
+
+    assert cache.get("a") is None
+    assert len(cache) == 0
+    assert cache.stats()["expirations"] == 1
+
+
+def test_evicts_least_recently_used_when_full():
+    """Test LRU eviction on entry cap."""
+    cache = TTLCache(max_entries=2, max_bytes=10_000, ttl_seconds=60)
+
+    cache.set("a", "1")
+    cache.set("b", "2")
+    cache.get("a")
+    cache.set("c", "3")
+
+    assert cache.get("a") == "1"
+    assert cache.get("b") is None
+    assert cache.stats()["evictions"] == 1
+
+
+def test_byte_cap_is_enforced():
+    """Test eviction on byte cap and rejection of oversized values."""
+    cache = TTLCache(max_entries=10, max_bytes=10, ttl_seconds=60)
+
+    cache.set("a", "xxxxxx")
+    cache.set("b", "yyyyyy")
+
+    assert cache.get("a") is None
+    assert cache.stats()["bytes"] == 6
+    assert cache.set("big", "z" * 11) is False
@@ -0,0 +1,99 @@
+"""Unit tests for the write-behind queue."""
+
+import asyncio
+
+import pytest
+
+from src.utils.write_behind import WriteBehindQueue
+
+
+class Recorder:
+    """Flush target that records each batch."""
+
+    def __init__(self, success: bool = True):
+        self.success = success
+        self.batches: list[tuple[str, list[dict]]] = []
+
+    async def __call__(self, table, rows):
+        self.batches.append((table, rows))
+        return self.success
+
+
+def make_queue(recorder, **kwargs):
+    options = {"max_pending": 10, "batch_size": 3, "interval_seconds": 60, **kwargs}
+    return WriteBehindQueue(recorder, **options)
+
+
+@pytest.mark.asyncio
+async def test_duplicate_keys_are_coalesced():
+    """Test that a later write for a pending key replaces the earlier one."""
+    recorder = Recorder()
+    queue = make_queue(recorder)
+
+    queue.enqueue("search_results", "a", {"v": 1})
+    queue.enqueue("search_results", "a", {"v": 2})
+    await queue.shutdown()
+
+    assert recorder.batches == [("search_results", [{"v": 2}])]
+    assert queue.stats()["coalesced"] == 1
+
+
+@pytest.mark.asyncio
+async def test_full_queue_drops_new_keys():
+    """Test that the queue is bounded."""
+    queue = make_queue(Recorder(), max_pending=2)
+
+    assert queue.enqueue("t", "a", {})
+    assert queue.enqueue("t", "b", {})
+    assert not queue.enqueue("t", "c", {})
+    assert queue.enqueue("t", "a", {"v": 2})
+
+    assert len(queue) == 2
+    assert queue.stats()["dropped"] == 1
+    queue.clear()
+
+
+@pytest.mark.asyncio
+async def test_full_batch_flushes_without_waiting_for_interval():
+    """Test that reaching batch_size wakes the flusher early."""
+    recorder = Recorder()
+    queue = make_queue(recorder)
+
+    for key in "abc":
+        queue.enqueue("t", key, {"k": key})
+    await asyncio.sleep(0.01)
+
+    assert [len(rows) for _, rows in recorder.batches] == [3]
+    assert len(queue) == 0
+
+
+@pytest.mark.asyncio
+async def test_flush_splits_tables_and_batches():
+    """Test one flush call per table per batch_size rows."""
+    recorder = Recorder()
+    queue = make_queue(recorder, batch_size=2)
+
+    for key in "abc":
+        queue.enqueue("search_results", key, {})
+    queue.enqueue("location_cache", "x", {})
+
+    written = await queue.flush()
+
+    assert written == 4
+    assert [(table, len(rows)) for table, rows in recorder.batches] == [
+        ("search_results", 2),
+        ("search_results", 1),
+        ("location_cache", 1),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_failed_batches_are_counted_and_discarded():
+    """Test that a failing store does not requeue rows."""
+    queue = make_queue(Recorder(success=False))
+
+    queue.enqueue("t", "a", {})
+    await queue.shutdown()
+
+    assert queue.stats()["failed"] == 1
+    assert len(queue) == 0
@@ -0,0 +1,7 @@
+-- Secondary lookup for search results by parsed intent and normalized location
+-- Lets paraphrased queries for the same place hit the cache
+
+CREATE INDEX IF NOT EXISTS idx_search_results_intent_location
+  ON search_results(intent, location, expires_at DESC);
+
+COMMENT ON INDEX idx_search_results_intent_location IS 'Supports cache lookups by (intent, location) when the query hash misses';
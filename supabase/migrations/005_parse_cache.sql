@@ -0,0 +1,74 @@
+-- Memo table for OpenAI parse results
+-- Keyed on a hash of model, prompt version and normalized input text, so a
+-- prompt or model change never reads stale parses
+
+CREATE TABLE IF NOT EXISTS parse_cache (
+  id uuid DEFAULT gen_random_uuid() PRIMARY KEY,
+  input_hash text NOT NULL UNIQUE,
+  raw_input text NOT NULL,
+  parsed_json jsonb NOT NULL,
+  model text NOT NULL,
+  prompt_version integer NOT NULL,
+  created_at timestamptz DEFAULT now(),
+  expires_at timestamptz NOT NULL,
+  CONSTRAINT valid_expiration CHECK (expires_at > created_at),
+  CONSTRAINT reasonable_ttl CHECK (expires_at < created_at + interval '30 days')
+);
+
+CREATE INDEX IF NOT EXISTS idx_parse_cache_input_hash ON parse_cache(input_hash);
+CREATE INDEX IF NOT EXISTS idx_parse_cache_expires ON parse_cache(expires_at);
+
+ALTER TABLE parse_cache ENABLE ROW LEVEL SECURITY;
+
+CREATE POLICY "Public read access for parse cache" 
+  ON parse_cache FOR SELECT 
+  USING (expires_at > now());
+
+CREATE POLICY "Public insert access for parse cache" 
+  ON parse_cache FOR INSERT 
+  WITH CHECK (
+    expires_at > now() AND 
+    expires_at < now() + interval '30 days' AND
+    input_hash IS NOT NULL AND 
+    parsed_json IS NOT NULL
+  );
+
+CREATE POLICY "Public update access for parse cache" 
+  ON parse_cache FOR UPDATE 
+  USING (true)
+  WITH CHECK (
+    expires_at > now() AND 
+    expires_at < now() + interval '30 days'
+  );
+
+GRANT SELECT, INSERT, UPDATE ON parse_cache TO anon, authenticated;
+GRANT DELETE ON parse_cache TO service_role;
+
+-- Keep the memo bounded like the other cache tables
+CREATE OR REPLACE FUNCTION prevent_parse_cache_bloat()
+RETURNS TRIGGER AS $$
+DECLARE
+  row_count integer;
+  max_rows integer := 10000;
+BEGIN
+  SELECT COUNT(*) INTO row_count FROM parse_cache;
+  
+  IF row_count >= max_rows THEN
+    DELETE FROM parse_cache 
+    WHERE id IN (
+      SELECT id FROM parse_cache 
+      ORDER BY created_at ASC 
+      LIMIT 1000
+    );
+  END IF;
+  
+  RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER enforce_parse_cache_limit
+  BEFORE INSERT ON parse_cache
+  FOR EACH ROW
+  EXECUTE FUNCTION prevent_parse_cache_bloat();
+
+COMMENT ON TABLE parse_cache IS 'Memoized OpenAI parse results keyed on model, prompt version and normalized input';
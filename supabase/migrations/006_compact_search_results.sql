@@ -0,0 +1,8 @@
+-- Compact, versioned payloads for cached search results
+-- results_json holds the compact JSON payload (payload_version >= 1) or a
+-- legacy full response (payload_version 0)
+
+ALTER TABLE search_results
+  ADD COLUMN IF NOT EXISTS payload_version smallint NOT NULL DEFAULT 0;
+
+COMMENT ON COLUMN search_results.payload_version IS 'Cache payload format: 0 = full response JSON, 1 = compact';